@@ -3,46 +3,137 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-import logging
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, dispatcher_send
 from homeassistant.helpers.entityfilter import (
     CONF_EXCLUDE_ENTITIES,
+    CONF_EXCLUDE_ENTITY_GLOBS,
     CONF_INCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITY_GLOBS,
 )
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
+from .bridges import HOMEKIT_DOMAIN, BridgeRoute, bridge_routes
 from .const import (
+    ACCESSORY_OPTION_DEFAULTS,
+    CONF_ACTION_DWELL,
+    CONF_BRIDGES,
+    CONF_EXCLUDE_AREAS,
+    CONF_EXCLUDE_DEVICES,
+    CONF_EXCLUDE_INTEGRATIONS,
+    CONF_EXCLUDE_LABELS,
     CONF_FAN_LANE,
+    CONF_INCLUDE_AREAS,
+    CONF_INCLUDE_DEVICES,
+    CONF_INCLUDE_INTEGRATIONS,
+    CONF_INCLUDE_LABELS,
+    CONF_REFRESH_AFTER_WRITE,
+    CONF_WATCHDOG_THRESHOLD,
+    DATA_BRIDGE_PLAN,
+    DATA_FLEET,
+    DATA_HOMEKIT_ENTRY_UNSUB,
     DATA_PATCH_STATE,
     DATA_PATCH_STATUS,
     DATA_PATCH_STATUS_UNSUB,
-    DATA_YAML_EXCLUDE_ENTITIES,
+    DATA_PREWARM,
+    DATA_REFRESHER,
+    DATA_RESOLVED_ENTITIES,
+    DATA_ROUTING_LOG,
+    DATA_ROUTING_TABLE,
+    DATA_RULE_INDEX,
+    DATA_RULE_INDEX_UNSUB,
+    DATA_SHAPES,
+    DATA_SNAPSHOTS,
+    DATA_STATUS_BUCKETS,
+    DATA_WATCHDOG,
+    DATA_YAML_ACCESSORY_OPTIONS,
+    DATA_YAML_BRIDGES,
+    DATA_YAML_EXCLUDE_RULES,
     DATA_YAML_FAN_LANE,
-    DATA_YAML_INCLUDE_ENTITIES,
+    DATA_YAML_INCLUDE_RULES,
     DEFAULT_FAN_LANE,
     DOMAIN,
     FAN_LANE_AUTO,
     FAN_LANE_MANUAL,
+    MAX_ACTION_DWELL,
     PLATFORMS,
+    ROUTE_BRIDGE_OVERRIDE,
+    ROUTE_EXCLUDED,
+    ROUTE_FAILED,
+    ROUTE_INACTIVE,
+    ROUTE_MISSING,
+    ROUTE_NON_CLIMATE,
+    ROUTE_PATCHED,
+    ROUTE_UNSUPPORTED,
+    SIGNAL_ACCESSORY_FAILED,
     SIGNAL_PATCH_STATUS_UPDATED,
 )
+from .fleet import FleetActions
+from .openmetrics import HomeKitHeaterCoolerMetricsView
 from .patcher import (
     apply_patch,
     native_heatercooler_available,
+    prewarm,
     remove_patch,
     supports_heatercooler,
 )
-
-_LOGGER = logging.getLogger(__name__)
+from .refresh import PollRefresher
+from .routing_log import RoutingLog
+from .rules import EXCLUDE_RULE_KEYS, INCLUDE_RULE_KEYS, RuleIndex, SelectionRules
+from .services import async_setup_services
+from .shapes import ShapeTracker
+from .snapshots import SnapshotStore
+from .watchdog import Watchdog, watch
+
+# The patch status lists an entity can be classified into by its state.
+STATUS_MISSING = "missing_entities"
+STATUS_NON_CLIMATE = "non_climate_entities"
+STATUS_UNSUPPORTED = "unsupported_entities"
+STATUS_PATCHED = "patched_entities"
+STATUS_BUCKETS = (
+    STATUS_MISSING,
+    STATUS_NON_CLIMATE,
+    STATUS_UNSUPPORTED,
+    STATUS_PATCHED,
+)
+_BUCKET_ROUTES = {
+    STATUS_MISSING: ROUTE_MISSING,
+    STATUS_NON_CLIMATE: ROUTE_NON_CLIMATE,
+    STATUS_UNSUPPORTED: ROUTE_UNSUPPORTED,
+}
+# Reasons that follow an entity's state, so a state change can update them.
+_STATE_ROUTES = frozenset({ROUTE_PATCHED, ROUTE_INACTIVE, *_BUCKET_ROUTES.values()})
+
+BRIDGE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_FAN_LANE): vol.In([FAN_LANE_AUTO, FAN_LANE_MANUAL]),
+        vol.Optional(CONF_INCLUDE_ENTITIES, default=[]): vol.All(
+            cv.ensure_list, [cv.entity_id]
+        ),
+        vol.Optional(CONF_EXCLUDE_ENTITIES, default=[]): vol.All(
+            cv.ensure_list, [cv.entity_id]
+        ),
+    }
+)
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -54,9 +145,33 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_EXCLUDE_ENTITIES, default=[]): vol.All(
                     cv.ensure_list, [cv.entity_id]
                 ),
+                **{
+                    vol.Optional(key, default=[]): vol.All(cv.ensure_list, [cv.string])
+                    for key in (
+                        CONF_INCLUDE_AREAS,
+                        CONF_EXCLUDE_AREAS,
+                        CONF_INCLUDE_DEVICES,
+                        CONF_EXCLUDE_DEVICES,
+                        CONF_INCLUDE_LABELS,
+                        CONF_EXCLUDE_LABELS,
+                        CONF_INCLUDE_INTEGRATIONS,
+                        CONF_EXCLUDE_INTEGRATIONS,
+                        CONF_INCLUDE_ENTITY_GLOBS,
+                        CONF_EXCLUDE_ENTITY_GLOBS,
+                    )
+                },
                 vol.Optional(CONF_FAN_LANE, default=DEFAULT_FAN_LANE): vol.In(
                     [FAN_LANE_AUTO, FAN_LANE_MANUAL]
                 ),
+                vol.Optional(CONF_REFRESH_AFTER_WRITE): cv.boolean,
+                vol.Optional(CONF_ACTION_DWELL): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=MAX_ACTION_DWELL)
+                ),
+                vol.Optional(CONF_BRIDGES, default={}): {cv.string: BRIDGE_SCHEMA},
+                # Milliseconds; timing and the loop-lag sensor are off unless set.
+                vol.Optional(CONF_WATCHDOG_THRESHOLD): vol.All(
+                    vol.Coerce(float), vol.Range(min=1)
+                ),
             }
         )
     },
@@ -66,11 +181,32 @@ CONFIG_SCHEMA = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: Mapping[str, Any]) -> bool:
     """Patch HomeKit climate selection and register HeaterCooler accessory."""
-    include_entities, exclude_entities = _yaml_entities_from_config(config)
+    include_rules, exclude_rules = _yaml_rules_from_config(config)
     domain_data = _domain_data(hass)
-    domain_data[DATA_YAML_INCLUDE_ENTITIES] = include_entities
-    domain_data[DATA_YAML_EXCLUDE_ENTITIES] = exclude_entities
+    if (threshold := _yaml_watchdog_threshold_from_config(config)) is not None:
+        watchdog = domain_data[DATA_WATCHDOG] = Watchdog(hass, threshold / 1000)
+        watchdog.async_start()
+    domain_data[DATA_PREWARM] = await hass.async_add_import_executor_job(prewarm)
+    snapshots = SnapshotStore(hass)
+    await snapshots.async_load()
+    domain_data[DATA_SNAPSHOTS] = snapshots
+    shapes = ShapeTracker(hass)
+    await shapes.async_load()
+    domain_data[DATA_SHAPES] = shapes
+    domain_data[DATA_YAML_INCLUDE_RULES] = include_rules
+    domain_data[DATA_YAML_EXCLUDE_RULES] = exclude_rules
     domain_data[DATA_YAML_FAN_LANE] = _yaml_fan_lane_from_config(config)
+    domain_data[DATA_YAML_BRIDGES] = _yaml_bridges_from_config(config)
+    domain_data[DATA_YAML_ACCESSORY_OPTIONS] = _yaml_accessory_options_from_config(
+        config
+    )
+    domain_data[DATA_REFRESHER] = PollRefresher(hass)
+    domain_data[DATA_FLEET] = FleetActions(hass)
+    domain_data[DATA_ROUTING_LOG] = RoutingLog(hass)
+    _start_rule_index(hass)
+    _register_homekit_entry_listener(hass)
+    async_setup_services(hass)
+    hass.http.register_view(HomeKitHeaterCoolerMetricsView())
     _refresh_patch(hass)
     return True
 
@@ -95,15 +231,14 @@ async def _async_handle_entry_update(hass: HomeAssistant, entry: ConfigEntry) ->
     _refresh_patch(hass)
 
 
-def _yaml_entities_from_config(config: Mapping[str, Any]) -> tuple[set[str], set[str]]:
-    """Extract include/exclude entity IDs from YAML config."""
+def _yaml_rules_from_config(
+    config: Mapping[str, Any],
+) -> tuple[SelectionRules, SelectionRules]:
+    """Extract include/exclude rules from YAML config."""
     integration_config = config.get(DOMAIN)
     if not isinstance(integration_config, Mapping):
-        return set(), set()
-
-    include_entities = _entity_set(integration_config.get(CONF_INCLUDE_ENTITIES))
-    exclude_entities = _entity_set(integration_config.get(CONF_EXCLUDE_ENTITIES))
-    return include_entities, exclude_entities
+        return SelectionRules(), SelectionRules()
+    return _rules_from_source(integration_config)
 
 
 def _yaml_fan_lane_from_config(config: Mapping[str, Any]) -> str:
@@ -114,24 +249,56 @@ def _yaml_fan_lane_from_config(config: Mapping[str, Any]) -> str:
     return DEFAULT_FAN_LANE
 
 
+def _yaml_bridges_from_config(
+    config: Mapping[str, Any],
+) -> dict[str, Mapping[str, Any]]:
+    """Extract per-bridge overrides, keyed by bridge name or entry ID."""
+    integration_config = config.get(DOMAIN)
+    if not isinstance(integration_config, Mapping):
+        return {}
+    bridges = integration_config.get(CONF_BRIDGES)
+    return dict(bridges) if isinstance(bridges, Mapping) else {}
+
+
+def _yaml_watchdog_threshold_from_config(config: Mapping[str, Any]) -> float | None:
+    """Extract the watchdog threshold in milliseconds, if timing is enabled."""
+    integration_config = config.get(DOMAIN)
+    if not isinstance(integration_config, Mapping):
+        return None
+    threshold = integration_config.get(CONF_WATCHDOG_THRESHOLD)
+    return float(threshold) if isinstance(threshold, (int, float)) else None
+
+
+def _yaml_accessory_options_from_config(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Extract the accessory options set in YAML config."""
+    integration_config = config.get(DOMAIN)
+    if not isinstance(integration_config, Mapping):
+        return {}
+    return {
+        key: integration_config[key]
+        for key in ACCESSORY_OPTION_DEFAULTS
+        if key in integration_config
+    }
+
+
 def _valid_fan_lane(value: Any) -> str:
     """Return a recognised fan lane or the default."""
     return value if value in (FAN_LANE_AUTO, FAN_LANE_MANUAL) else DEFAULT_FAN_LANE
 
 
-def _entry_entities(entry: ConfigEntry) -> tuple[set[str], set[str]]:
-    """Extract include/exclude entity IDs from a config entry."""
-    source = entry.options or entry.data
-    include_entities = _entity_set(source.get(CONF_INCLUDE_ENTITIES))
-    exclude_entities = _entity_set(source.get(CONF_EXCLUDE_ENTITIES))
-    return include_entities, exclude_entities
+def _entry_rules(entry: ConfigEntry) -> tuple[SelectionRules, SelectionRules]:
+    """Extract include/exclude rules from a config entry."""
+    return _rules_from_source(entry.options or entry.data)
 
 
-def _entity_set(value: Any) -> set[str]:
-    """Normalize config values to a set of entity IDs."""
-    if not isinstance(value, (list, set, tuple)):
-        return set()
-    return {item for item in value if isinstance(item, str)}
+def _rules_from_source(
+    source: Mapping[str, Any],
+) -> tuple[SelectionRules, SelectionRules]:
+    """Read the include and exclude sides of one configuration source."""
+    return (
+        SelectionRules.from_config(source, INCLUDE_RULE_KEYS),
+        SelectionRules.from_config(source, EXCLUDE_RULE_KEYS),
+    )
 
 
 def _domain_data(hass: HomeAssistant) -> dict[str, Any]:
@@ -150,44 +317,155 @@ def _refresh_patch(
     """Apply patch with merged YAML and UI-configured entities."""
     domain_data = _domain_data(hass)
     include_entities, exclude_entities = _combined_entities(hass, ignore_entry)
+    domain_data[DATA_RESOLVED_ENTITIES] = (include_entities, exclude_entities)
     if include_entities:
+        fan_lane = _combined_fan_lane(hass, ignore_entry)
         apply_patch(
             hass,
             include_entities,
             exclude_entities,
-            _combined_fan_lane(hass, ignore_entry),
+            fan_lane,
+            _bridge_routes(hass, include_entities - exclude_entities, fan_lane),
+            _combined_accessory_options(hass, ignore_entry),
         )
     else:
         remove_patch(hass)
+    _prune_stores(hass, include_entities - exclude_entities, ignore_entry)
     _register_patch_status_refresh(hass, include_entities, exclude_entities)
     _update_patch_status(hass, include_entities, exclude_entities)
     patch_status = domain_data[DATA_PATCH_STATUS]
-    _LOGGER.info(
-        "HomeKit HeaterCooler routing loaded (mode=%s, include_entities=%s, "
-        "exclude_entities=%s, patched_entities=%s)",
-        patch_status["routing_mode"],
-        sorted(include_entities),
-        sorted(exclude_entities),
-        patch_status["patched_entities"],
+    if (routing_log := domain_data.get(DATA_ROUTING_LOG)) is not None:
+        routing_log.async_record(
+            patch_status["routing_mode"],
+            include_entities,
+            exclude_entities,
+            patch_status["patched_entities"],
+        )
+
+
+def _prune_stores(
+    hass: HomeAssistant, target_entities: set[str], ignore_entry: ConfigEntry | None
+) -> None:
+    """Drop snapshots and shapes of unrouted entities once every entry is loaded."""
+    # An entry still setting up has not contributed its selection yet.
+    if any(
+        entry.state is not ConfigEntryState.LOADED
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if ignore_entry is None or entry.entry_id != ignore_entry.entry_id
+    ):
+        return
+    domain_data = _domain_data(hass)
+    patch_state = domain_data.get(DATA_PATCH_STATE)
+    routed = set(target_entities)
+    if patch_state:
+        for bridge in patch_state.bridges.values():
+            routed.update(bridge.entities)
+    if isinstance(snapshots := domain_data.get(DATA_SNAPSHOTS), SnapshotStore):
+        snapshots.async_prune(routed)
+    if patch_state and isinstance(shapes := domain_data.get(DATA_SHAPES), ShapeTracker):
+        shapes.async_prune(
+            {
+                entry_id: bridge.entities
+                for entry_id, bridge in patch_state.bridges.items()
+            }
+        )
+
+
+def _refresh_patch_if_selection_changed(hass: HomeAssistant) -> None:
+    """Re-apply routing when a registry change moves the resolved selection."""
+    if _combined_entities(hass) != _domain_data(hass).get(DATA_RESOLVED_ENTITIES):
+        _refresh_patch(hass)
+
+
+def _bridge_routes(
+    hass: HomeAssistant, target_entities: set[str], fan_lane: str
+) -> dict[str, BridgeRoute]:
+    """Build each HomeKit bridge's routing table from the resolved targets."""
+    return bridge_routes(
+        hass,
+        target_entities,
+        fan_lane,
+        _domain_data(hass).get(DATA_YAML_BRIDGES) or {},
+    )
+
+
+def _start_rule_index(hass: HomeAssistant) -> None:
+    """Index the registries for rule resolution until Home Assistant stops."""
+    domain_data = _domain_data(hass)
+    unsubscribe_previous = domain_data.pop(DATA_RULE_INDEX_UNSUB, None)
+    if callable(unsubscribe_previous):
+        unsubscribe_previous()
+    rule_index = RuleIndex(hass)
+    domain_data[DATA_RULE_INDEX] = rule_index
+    domain_data[DATA_RULE_INDEX_UNSUB] = rule_index.async_start(
+        lambda: _refresh_patch_if_selection_changed(hass)
+    )
+
+    @callback
+    def _async_stop(_event: Event) -> None:
+        if callable(unsubscribe := domain_data.pop(DATA_RULE_INDEX_UNSUB, None)):
+            unsubscribe()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+
+
+def _register_homekit_entry_listener(hass: HomeAssistant) -> None:
+    """Rebuild bridge tables when a HomeKit entry or its filter changes."""
+    domain_data = _domain_data(hass)
+    unsubscribe_previous = domain_data.get(DATA_HOMEKIT_ENTRY_UNSUB)
+    if callable(unsubscribe_previous):
+        unsubscribe_previous()
+
+    @callback
+    def _handle_homekit_entry_changed(
+        _change: ConfigEntryChange, entry: ConfigEntry
+    ) -> None:
+        if entry.domain != HOMEKIT_DOMAIN:
+            return
+        _domain_data(hass).pop(DATA_BRIDGE_PLAN, None)
+        patch_state = _domain_data(hass).get(DATA_PATCH_STATE)
+        if not patch_state:
+            return
+        routes = _bridge_routes(
+            hass,
+            patch_state.include_entities - patch_state.exclude_entities,
+            patch_state.fan_lane,
+        )
+        if routes != patch_state.bridges:
+            _refresh_patch(hass)
+
+    domain_data[DATA_HOMEKIT_ENTRY_UNSUB] = async_dispatcher_connect(
+        hass, SIGNAL_CONFIG_ENTRY_CHANGED, _handle_homekit_entry_changed
     )
 
 
 def _combined_entities(
     hass: HomeAssistant, ignore_entry: ConfigEntry | None = None
 ) -> tuple[set[str], set[str]]:
-    """Collect include/exclude entities from YAML and config entries."""
+    """Resolve include/exclude entities from YAML and config entry rules."""
+    include_rules, exclude_rules = _combined_rules(hass, ignore_entry)
+    rule_index = _domain_data(hass).get(DATA_RULE_INDEX)
+    if not isinstance(rule_index, RuleIndex):
+        return set(include_rules.entities), set(exclude_rules.entities)
+    return rule_index.resolve(include_rules), rule_index.resolve(exclude_rules)
+
+
+def _combined_rules(
+    hass: HomeAssistant, ignore_entry: ConfigEntry | None = None
+) -> tuple[SelectionRules, SelectionRules]:
+    """Collect include/exclude rules from YAML and config entries."""
     domain_data = _domain_data(hass)
-    include_entities = _entity_set(domain_data.get(DATA_YAML_INCLUDE_ENTITIES))
-    exclude_entities = _entity_set(domain_data.get(DATA_YAML_EXCLUDE_ENTITIES))
+    include_rules = domain_data.get(DATA_YAML_INCLUDE_RULES) or SelectionRules()
+    exclude_rules = domain_data.get(DATA_YAML_EXCLUDE_RULES) or SelectionRules()
 
     for entry in hass.config_entries.async_entries(DOMAIN):
         if ignore_entry is not None and entry.entry_id == ignore_entry.entry_id:
             continue
-        entry_include_entities, entry_exclude_entities = _entry_entities(entry)
-        include_entities.update(entry_include_entities)
-        exclude_entities.update(entry_exclude_entities)
+        entry_include_rules, entry_exclude_rules = _entry_rules(entry)
+        include_rules = include_rules.merge(entry_include_rules)
+        exclude_rules = exclude_rules.merge(entry_exclude_rules)
 
-    return include_entities, exclude_entities
+    return include_rules, exclude_rules
 
 
 def _combined_fan_lane(
@@ -204,6 +482,24 @@ def _combined_fan_lane(
     return fan_lane
 
 
+def _combined_accessory_options(
+    hass: HomeAssistant, ignore_entry: ConfigEntry | None = None
+) -> dict[str, Any]:
+    """Resolve the accessory options from YAML and config entries."""
+    options = {
+        **ACCESSORY_OPTION_DEFAULTS,
+        **(_domain_data(hass).get(DATA_YAML_ACCESSORY_OPTIONS) or {}),
+    }
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if ignore_entry is not None and entry.entry_id == ignore_entry.entry_id:
+            continue
+        source = entry.options or entry.data
+        options.update(
+            (key, source[key]) for key in ACCESSORY_OPTION_DEFAULTS if key in source
+        )
+    return options
+
+
 def _register_patch_status_refresh(
     hass: HomeAssistant,
     include_entities: set[str],
@@ -215,19 +511,27 @@ def _register_patch_status_refresh(
     if callable(unsubscribe_previous):
         unsubscribe_previous()
 
-    target_entities = sorted(include_entities - exclude_entities)
+    tracked_entities = sorted(
+        _status_entities(include_entities - exclude_entities, domain_data)
+    )
 
     @callback
     def _handle_status_refresh(_event: Any = None) -> None:
-        current_include_entities, current_exclude_entities = _combined_entities(hass)
+        current_include_entities, current_exclude_entities = _domain_data(hass).get(
+            DATA_RESOLVED_ENTITIES
+        ) or _combined_entities(hass)
         _update_patch_status(hass, current_include_entities, current_exclude_entities)
 
+    @callback
+    def _handle_state_change(event: Event[EventStateChangedData]) -> None:
+        _update_entity_status(hass, event.data["entity_id"], event.data["new_state"])
+
     unsubscribe_state: Callable[[], None] | None = None
-    if target_entities:
+    if tracked_entities:
         unsubscribe_state = async_track_state_change_event(
             hass,
-            target_entities,
-            _handle_status_refresh,
+            tracked_entities,
+            _handle_state_change,
         )
 
     unsubscribe_started: Callable[[], None] | None = None
@@ -237,27 +541,102 @@ def _register_patch_status_refresh(
             _handle_status_refresh,
         )
 
+    unsubscribe_failed = async_dispatcher_connect(
+        hass, SIGNAL_ACCESSORY_FAILED, _handle_status_refresh
+    )
+
     def _unsubscribe() -> None:
         if unsubscribe_state:
             unsubscribe_state()
         if unsubscribe_started:
             unsubscribe_started()
+        unsubscribe_failed()
 
     domain_data[DATA_PATCH_STATUS_UNSUB] = _unsubscribe
 
 
+def _status_entities(
+    target_entities: set[str], domain_data: Mapping[str, Any]
+) -> set[str]:
+    """Return the targets plus every entity a bridge routes by override."""
+    entities = set(target_entities)
+    if patch_state := domain_data.get(DATA_PATCH_STATE):
+        for bridge in patch_state.bridges.values():
+            entities.update(bridge.entities)
+    return entities
+
+
+def _status_bucket(state: State | None) -> str:
+    """Return the patch status list an entity's state belongs in."""
+    if state is None:
+        return STATUS_MISSING
+    if state.domain != "climate":
+        return STATUS_NON_CLIMATE
+    if supports_heatercooler(state):
+        return STATUS_PATCHED
+    return STATUS_UNSUPPORTED
+
+
 def _update_patch_status(
     hass: HomeAssistant,
     include_entities: set[str],
     exclude_entities: set[str],
 ) -> None:
-    """Recompute and publish patch diagnostics."""
+    """Reclassify every routed entity and publish patch diagnostics.
+
+    Runs when the selection or routing changes; a state change of one entity
+    goes through _update_entity_status instead.
+    """
     domain_data = _domain_data(hass)
-    domain_data[DATA_PATCH_STATUS] = _build_patch_status(
-        hass,
-        include_entities,
-        exclude_entities,
-    )
+    domain_data.pop(DATA_BRIDGE_PLAN, None)
+    domain_data[DATA_STATUS_BUCKETS] = {
+        entity_id: _status_bucket(hass.states.get(entity_id))
+        for entity_id in _status_entities(
+            include_entities - exclude_entities, domain_data
+        )
+    }
+    _publish_patch_status(hass, include_entities, exclude_entities)
+
+
+@callback
+def _update_entity_status(
+    hass: HomeAssistant, entity_id: str, new_state: State | None
+) -> None:
+    """Reclassify one entity, republishing only if its status list changed."""
+    buckets: dict[str, str] = _domain_data(hass).setdefault(DATA_STATUS_BUCKETS, {})
+    if buckets.get(entity_id) == (bucket := _status_bucket(new_state)):
+        return
+    buckets[entity_id] = bucket
+    include_entities, exclude_entities = _domain_data(hass).get(
+        DATA_RESOLVED_ENTITIES
+    ) or _combined_entities(hass)
+    _publish_patch_status(hass, include_entities, exclude_entities, entity_id)
+
+
+def _publish_patch_status(
+    hass: HomeAssistant,
+    include_entities: set[str],
+    exclude_entities: set[str],
+    changed_entity: str | None = None,
+) -> None:
+    """Rebuild patch diagnostics from the stored classifications.
+
+    With a changed entity, only that entity's routing table row is updated.
+    """
+    domain_data = _domain_data(hass)
+    buckets: Mapping[str, str] = domain_data.get(DATA_STATUS_BUCKETS, {})
+    patch_state = domain_data.get(DATA_PATCH_STATE)
+    with watch(hass, "_build_patch_status"):
+        domain_data[DATA_PATCH_STATUS] = _build_patch_status(
+            hass, include_entities, exclude_entities, buckets
+        )
+    table = domain_data.get(DATA_ROUTING_TABLE)
+    if changed_entity is None or table is None:
+        domain_data[DATA_ROUTING_TABLE] = _build_routing_table(
+            include_entities, exclude_entities, buckets, patch_state
+        )
+    elif (route := table.get(changed_entity)) and route["reason"] in _STATE_ROUTES:
+        route["reason"] = _route_reason(buckets[changed_entity], bool(patch_state))
     dispatcher_send(hass, SIGNAL_PATCH_STATUS_UPDATED)
 
 
@@ -265,28 +644,18 @@ def _build_patch_status(
     hass: HomeAssistant,
     include_entities: set[str],
     exclude_entities: set[str],
+    buckets: Mapping[str, str],
 ) -> dict[str, Any]:
-    """Collect patch status details for diagnostic entities."""
+    """Collect patch status details for diagnostic entities, without states."""
     target_entities = sorted(include_entities - exclude_entities)
-    patched_entities: list[str] = []
-    missing_entities: list[str] = []
-    unsupported_entities: list[str] = []
-    non_climate_entities: list[str] = []
-
+    grouped: dict[str, list[str]] = {bucket: [] for bucket in STATUS_BUCKETS}
     for entity_id in target_entities:
-        state = hass.states.get(entity_id)
-        if state is None:
-            missing_entities.append(entity_id)
-            continue
-        if state.domain != "climate":
-            non_climate_entities.append(entity_id)
-            continue
-        if supports_heatercooler(state):
-            patched_entities.append(entity_id)
-            continue
-        unsupported_entities.append(entity_id)
+        grouped[buckets.get(entity_id, STATUS_MISSING)].append(entity_id)
+    patched_entities = grouped[STATUS_PATCHED]
 
-    hook_installed = bool(_domain_data(hass).get(DATA_PATCH_STATE))
+    patch_state = _domain_data(hass).get(DATA_PATCH_STATE)
+    hook_installed = bool(patch_state)
+    failed_entities = patch_state.failures_by_entity() if patch_state else {}
 
     return {
         "patch_active": hook_installed and bool(patched_entities),
@@ -300,8 +669,72 @@ def _build_patch_status(
         "target_entities": target_entities,
         "patched_entities": patched_entities,
         "patched_entities_count": len(patched_entities),
-        "missing_entities": missing_entities,
-        "unsupported_entities": unsupported_entities,
-        "non_climate_entities": non_climate_entities,
+        "missing_entities": grouped[STATUS_MISSING],
+        "unsupported_entities": grouped[STATUS_UNSUPPORTED],
+        "non_climate_entities": grouped[STATUS_NON_CLIMATE],
+        "failed_entities": failed_entities,
+        "bridges": _bridge_status(patch_state, buckets),
         "last_refresh": dt_util.utcnow().isoformat(),
     }
+
+
+def _build_routing_table(
+    include_entities: set[str],
+    exclude_entities: set[str],
+    buckets: Mapping[str, str],
+    patch_state: Any,
+) -> dict[str, dict[str, Any]]:
+    """Give each selected entity a reason code and the bridges that route it.
+
+    Only entities a rule selected and an exclude then removed are excluded.
+    Built from the status buckets, so diagnostics can return it without
+    looking at any state.
+    """
+    failed = patch_state.failures_by_entity() if patch_state else {}
+    table: dict[str, dict[str, Any]] = {
+        entity_id: {"reason": ROUTE_EXCLUDED, "bridges": []}
+        for entity_id in include_entities & exclude_entities
+    }
+    for entity_id in include_entities - exclude_entities:
+        reason = (
+            ROUTE_FAILED
+            if entity_id in failed
+            else _route_reason(
+                buckets.get(entity_id, STATUS_MISSING), bool(patch_state)
+            )
+        )
+        table[entity_id] = {"reason": reason, "bridges": []}
+    if patch_state:
+        for entry_id, bridge in sorted(patch_state.bridges.items()):
+            for entity_id in bridge.entities:
+                table.setdefault(
+                    entity_id, {"reason": ROUTE_BRIDGE_OVERRIDE, "bridges": []}
+                )["bridges"].append(entry_id)
+    return dict(sorted(table.items()))
+
+
+def _route_reason(bucket: str, hook_installed: bool) -> str:
+    """Return the routing reason for a selected entity's status list."""
+    if bucket == STATUS_PATCHED:
+        return ROUTE_PATCHED if hook_installed else ROUTE_INACTIVE
+    return _BUCKET_ROUTES[bucket]
+
+
+def _bridge_status(patch_state: Any, buckets: Mapping[str, str]) -> dict[str, Any]:
+    """Report which patched entities each HomeKit bridge routes."""
+    if not patch_state:
+        return {}
+    bridges: dict[str, Any] = {}
+    for entry_id, bridge in sorted(patch_state.bridges.items()):
+        routed = [
+            entity_id
+            for entity_id in sorted(bridge.entities)
+            if buckets.get(entity_id) == STATUS_PATCHED
+        ]
+        bridges[entry_id] = {
+            "name": bridge.name,
+            "fan_lane": bridge.fan_lane,
+            "patched_entities": routed,
+            "patched_entities_count": len(routed),
+        }
+    return bridges
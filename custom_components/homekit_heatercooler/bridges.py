@@ -0,0 +1,96 @@
+"""Per-bridge routing tables for HomeKit bridge instances."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entityfilter import (
+    CONF_EXCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITIES,
+    FILTER_SCHEMA,
+    EntityFilter,
+)
+
+from .const import CONF_FAN_LANE, FAN_LANE_AUTO, FAN_LANE_MANUAL
+
+HOMEKIT_DOMAIN = "homekit"
+# Mirrors HomeKit's own option key; older cores do not export it.
+HOMEKIT_CONF_FILTER = "filter"
+
+
+@dataclass(frozen=True)
+class BridgeRoute:
+    """The HeaterCooler routing table for one HomeKit bridge."""
+
+    entry_id: str
+    name: str
+    fan_lane: str
+    entities: frozenset[str]
+
+
+def homekit_entries(hass: HomeAssistant) -> list[ConfigEntry]:
+    """Return every HomeKit bridge or accessory config entry."""
+    entries: list[ConfigEntry] = hass.config_entries.async_entries(HOMEKIT_DOMAIN)
+    return entries
+
+
+def homekit_bridge_name(entry: ConfigEntry) -> str:
+    """Return the bridge name HomeKit advertises for an entry."""
+    name = entry.data.get(CONF_NAME)
+    return name if isinstance(name, str) else entry.title
+
+
+def homekit_entity_filter(entry: ConfigEntry) -> EntityFilter:
+    """Return the entity filter a HomeKit entry applies to its bridge."""
+    filter_config = entry.options.get(HOMEKIT_CONF_FILTER) or {}
+    try:
+        entity_filter: EntityFilter = FILTER_SCHEMA(filter_config)
+    except vol.Invalid:
+        entity_filter = FILTER_SCHEMA({})
+    return entity_filter
+
+
+def bridge_routes(
+    hass: HomeAssistant,
+    target_entities: Iterable[str],
+    fan_lane: str,
+    overrides: Mapping[str, Mapping[str, Any]],
+) -> dict[str, BridgeRoute]:
+    """Precompute which targets each HomeKit bridge routes to HeaterCooler.
+
+    A bridge only carries the targets its own HomeKit filter admits, so a
+    bridge reload looks up its own table instead of the whole selection.
+    Overrides are keyed by bridge name or entry ID and may set a fan lane or
+    add and remove entities for that bridge alone.
+    """
+    targets = set(target_entities)
+    routes: dict[str, BridgeRoute] = {}
+    for entry in homekit_entries(hass):
+        name = homekit_bridge_name(entry)
+        override = overrides.get(entry.entry_id) or overrides.get(name) or {}
+        entity_filter = homekit_entity_filter(entry)
+        entities = {entity_id for entity_id in targets if entity_filter(entity_id)}
+        entities.update(_strings(override.get(CONF_INCLUDE_ENTITIES)))
+        entities.difference_update(_strings(override.get(CONF_EXCLUDE_ENTITIES)))
+        lane = override.get(CONF_FAN_LANE)
+        routes[entry.entry_id] = BridgeRoute(
+            entry_id=entry.entry_id,
+            name=name,
+            fan_lane=lane if lane in (FAN_LANE_AUTO, FAN_LANE_MANUAL) else fan_lane,
+            entities=frozenset(entities),
+        )
+    return routes
+
+
+def _strings(value: Any) -> set[str]:
+    """Return the string items of a config list."""
+    if not isinstance(value, (list, set, tuple)):
+        return set()
+    return {item for item in value if isinstance(item, str)}
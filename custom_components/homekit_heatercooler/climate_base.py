@@ -1,11 +1,15 @@
 """Shared climate accessory support for the legacy HeaterCooler."""
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
 import logging
-from typing import Any
+from time import monotonic
+from typing import Any, NamedTuple, override
 
-from pyhap.characteristic import Characteristic
-from pyhap.const import CATEGORY_THERMOSTAT
+from pyhap.accessory import Bridge, get_topic
+from pyhap.characteristic import PROP_PERMISSIONS, Characteristic
+from pyhap.const import CATEGORY_THERMOSTAT, HAP_PERMISSION_NOTIFY
 from pyhap.service import Service
 
 from homeassistant.components.climate import (
@@ -30,6 +34,7 @@ from homeassistant.components.homekit.const import (
     ATTR_DISPLAY_NAME,
     ATTR_VALUE,
     EVENT_HOMEKIT_CHANGED,
+    SERV_ACCESSORY_INFO,
 )
 from homeassistant.components.homekit.util import (
     temperature_to_homekit,
@@ -42,12 +47,21 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import Context, State
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Context,
+    Event,
+    EventStateChangedData,
+    State,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 
 from .climate_util import (
     as_float,
     as_hap_integer,
+    capability_fingerprint,
     fan_mode_to_speed,
     fan_speed_to_mode,
     get_fan_modes_and_speeds,
@@ -55,6 +69,7 @@ from .climate_util import (
     get_swing_on_mode,
     get_temperature_range_from_state,
     has_swing_off_mode,
+    is_placeholder_state,
     is_swing_on,
     resolve_target_temp_range,
     temperature_attribute_to_homekit,
@@ -62,14 +77,36 @@ from .climate_util import (
 from .const import (
     CHAR_CURRENT_TEMPERATURE,
     CONF_FAN_LANE,
+    CONF_REFRESH_AFTER_WRITE,
+    DATA_REFRESHER,
+    DATA_WATCHDOG,
     DEFAULT_FAN_LANE,
+    DOMAIN,
     PROP_MAX_VALUE,
+    PROP_MIN_STEP,
     PROP_MIN_VALUE,
 )
+from .metrics import NotificationCounter, WriteLatency, WriteQueueStats
+from .refresh import PollRefresher
+from .scheduler import NotificationScheduler
+from .shared import SharedClimate, async_get_shared
+from .snapshots import AccessorySnapshot
+from .trace import WriteTrace
+from .watchdog import Watchdog
 
 _LOGGER = logging.getLogger(__name__)
 
 CLIMATE_INACTIVE_STATES = frozenset({HVACMode.OFF, STATE_UNAVAILABLE, STATE_UNKNOWN})
+# How long a written value outlasts state reports that predate it.
+PENDING_VALUE_TIMEOUT = 30.0
+
+
+class PendingValue(NamedTuple):
+    """A written characteristic value awaiting confirmation from the entity."""
+
+    value: Any
+    reported: Any
+    expires: float
 
 
 class HomeKitClimateAccessory(HomeAccessory):
@@ -79,31 +116,47 @@ class HomeKitClimateAccessory(HomeAccessory):
     char_swing: Characteristic | None
     char_current_temp: Characteristic
 
-    def __init__(self, *args: Any) -> None:
+    def __init__(self, *args: Any, snapshot: AccessorySnapshot | None = None) -> None:
         """Initialize shared climate state."""
+        self._snapshot = snapshot
+        self.on_values_changed: Callable[[], None] | None = None
         super().__init__(*args, category=CATEGORY_THERMOSTAT)
         self._unit = self.hass.config.units.temperature_unit
+        self._watchdog: Watchdog | None = self.hass.data.get(DOMAIN, {}).get(
+            DATA_WATCHDOG
+        )
+        self.shared: SharedClimate = async_get_shared(self.hass, self)
 
         state = self.hass.states.get(self.entity_id)
         assert state
-        attributes = state.attributes
-        features = attributes.get(ATTR_SUPPORTED_FEATURES, 0)
-
-        self.fan_modes: dict[str, str] = {}
-        self.ordered_fan_speeds: list[str] = []
-        if features & ClimateEntityFeature.FAN_MODE:
-            fan_lane = self.config.get(CONF_FAN_LANE, DEFAULT_FAN_LANE)
-            self.fan_modes, self.ordered_fan_speeds = get_fan_modes_and_speeds(
-                attributes, fan_lane
-            )
-
-        self.swing_on_mode: str | None = None
-        self.swing_off_mode = SWING_OFF
-        if features & ClimateEntityFeature.SWING_MODE and has_swing_off_mode(
-            attributes
-        ):
-            self.swing_on_mode = get_swing_on_mode(attributes)
-            self.swing_off_mode = get_swing_off_mode(attributes)
+        if self._snapshot is not None and is_placeholder_state(state):
+            # The climate has not loaded yet; build from its last known shape.
+            state = self._snapshot.as_state(self.entity_id)
+        else:
+            self._snapshot = None
+        self._initial_state = state
+        self._reported_values: dict[Characteristic, Any] = {}
+        self._pending_values: dict[Characteristic, PendingValue] = {}
+        self._pending_timers: dict[Characteristic, CALLBACK_TYPE] = {}
+        self.echoes_suppressed = 0
+        self.write_latency = WriteLatency()
+        self.write_queue = WriteQueueStats()
+        self.notifications = NotificationCounter()
+        self.write_trace = WriteTrace()
+        # When the write awaiting confirmation arrived and completed.
+        self._confirming: tuple[float, float] | None = None
+        self.on_reload_skipped: Callable[[list[str]], None] | None = None
+        # With no controller subscribed, state changes only mark the accessory
+        # stale; characteristics catch up when read or written, or as soon as
+        # a controller subscribes (see async_hook_subscriptions).
+        self._deferred_state: State | None = None
+        self._event_topics: list[str] | None = None
+        self.scheduler: NotificationScheduler | None = None
+        self.shape = self._shape(state)
+        self.fan_modes: dict[str, str] = self.shape["fan_modes"]
+        self.ordered_fan_speeds: list[str] = self.shape["fan_speeds"]
+        self.swing_on_mode: str | None = self.shape["swing_on_mode"]
+        self.swing_off_mode: str = self.shape["swing_off_mode"]
 
         self._reload_on_change_attrs.extend(
             (
@@ -115,6 +168,272 @@ class HomeKitClimateAccessory(HomeAccessory):
             )
         )
 
+    def _shape(self, state: State) -> dict[str, Any]:
+        """Return every decision the accessory derives from a state's attributes.
+
+        Two states with the same shape build identical accessories, so a change
+        that leaves it alone needs no reload.
+        """
+        attributes = state.attributes
+        features = attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+        fan_modes: dict[str, str] = {}
+        fan_speeds: list[str] = []
+        if features & ClimateEntityFeature.FAN_MODE:
+            fan_lane = self.config.get(CONF_FAN_LANE, DEFAULT_FAN_LANE)
+            fan_modes, fan_speeds = get_fan_modes_and_speeds(attributes, fan_lane)
+        swing_on_mode: str | None = None
+        swing_off_mode = SWING_OFF
+        if features & ClimateEntityFeature.SWING_MODE and has_swing_off_mode(
+            attributes
+        ):
+            swing_on_mode = get_swing_on_mode(attributes)
+            swing_off_mode = get_swing_off_mode(attributes)
+        return {
+            "fan_modes": fan_modes,
+            "fan_speeds": fan_speeds,
+            "swing_on_mode": swing_on_mode,
+            "swing_off_mode": swing_off_mode,
+        }
+
+    @property
+    @override
+    def available(self) -> bool:
+        """Return True while serving a snapshot, otherwise follow the entity."""
+        return self._snapshot is not None or super().available
+
+    @callback
+    @override
+    def async_stop(self) -> None:
+        """Cancel the expiry of pending values with the subscriptions."""
+        for cancel in self._pending_timers.values():
+            cancel()
+        self._pending_timers.clear()
+        super().async_stop()
+
+    @callback
+    @override
+    def async_update_event_state_callback(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Reload only for shape changes, and defer updates nobody would see."""
+        new_state = event.data["new_state"]
+        old_state = event.data["old_state"]
+        self._update_available_from_state(new_state)
+        self._observe_state(new_state)
+        if (
+            new_state is not None
+            and old_state is not None
+            and STATE_UNAVAILABLE not in (old_state.state, new_state.state)
+            and (
+                changed := [
+                    attr
+                    for attr in self._reload_on_change_attrs
+                    if old_state.attributes.get(attr) != new_state.attributes.get(attr)
+                ]
+            )
+        ):
+            if self._shape(new_state) != self.shape:
+                _LOGGER.debug(
+                    "%s: Reloading HomeKit accessory since %s changed",
+                    self.entity_id,
+                    ", ".join(changed),
+                )
+                self.async_reload()
+                return
+            _LOGGER.debug(
+                "%s: %s changed without changing the accessory; not reloading",
+                self.entity_id,
+                ", ".join(changed),
+            )
+            if self.on_reload_skipped is not None:
+                self.on_reload_skipped(changed)
+        if self._defer_sync() or (
+            self._snapshot is None
+            and not self._write_active()
+            and self.scheduler is not None
+            and self.scheduler.async_should_queue(self)
+        ):
+            self._async_defer_state(new_state)
+            return
+        self.async_sync_deferred()
+        self.async_update_state_callback(new_state)
+
+    def _watch(self, name: str) -> AbstractContextManager[None]:
+        """Time a block for the watchdog, if it is enabled."""
+        if self._watchdog is None:
+            return nullcontext()
+        return self._watchdog.timed(name, self.entity_id)
+
+    def _observe_state(self, new_state: State | None) -> None:
+        """Note a state as it arrives, even if applying it is deferred."""
+
+    def _write_active(self) -> bool:
+        """Return True while a HomeKit write is being applied or confirmed."""
+        return self._awaiting_confirmation()
+
+    def _awaiting_confirmation(self) -> bool:
+        """Return True while written values wait for the entity to report them."""
+        return bool(self._pending_values)
+
+    def _record_write(self, received: float, locked: float, completed: float) -> None:
+        """Record a write's queue and call times, and await its confirmation."""
+        latency = self.write_latency
+        latency.queue.observe(locked - received)
+        latency.call.observe(completed - locked)
+        if self._confirming is not None:
+            latency.unconfirmed += 1
+            self._confirming = None
+        if self._awaiting_confirmation():
+            self._confirming = (received, completed)
+            return
+        # The entity reported the write before its service call returned.
+        latency.confirm.observe(0.0)
+        latency.total.observe(completed - received)
+
+    def _note_confirmation(self) -> None:
+        """Complete a write's timings once the entity has reported it."""
+        if self._confirming is None or self._awaiting_confirmation():
+            return
+        received, completed = self._confirming
+        self._confirming = None
+        now = monotonic()
+        self.write_latency.confirm.observe(now - completed)
+        self.write_latency.total.observe(now - received)
+
+    def _defer_sync(self) -> bool:
+        """Return True when no controller is subscribed to the accessory's events."""
+        if self._snapshot is not None or self._write_active():
+            return False
+        if self._event_topics is None:
+            self._event_topics = [
+                get_topic(self.aid, self.iid_manager.get_iid(char))
+                for char in self._synced_chars()
+                if HAP_PERMISSION_NOTIFY in char.properties[PROP_PERMISSIONS]
+            ]
+        topics = self.driver.topics
+        return not any(topic in topics for topic in self._event_topics)
+
+    @callback
+    def _async_defer_state(self, new_state: State | None) -> None:
+        """Keep the newest state until a controller reads or subscribes."""
+        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return
+        if self._deferred_state is None:
+            for char in self._synced_chars():
+                char.getter_callback = self._deferred_getter(char)
+        self._deferred_state = new_state
+
+    @property
+    def has_deferred_state(self) -> bool:
+        """Return True while a state change waits to be applied."""
+        return self._deferred_state is not None
+
+    @callback
+    def async_sync_deferred(self) -> None:
+        """Apply a deferred state before characteristics are read or written."""
+        if (state := self._deferred_state) is None:
+            return
+        self._deferred_state = None
+        for char in self._synced_chars():
+            char.getter_callback = None
+        self.async_update_state_callback(state)
+
+    def _deferred_getter(self, char: Characteristic) -> Callable[[], Any]:
+        """Return a read hook that brings a deferred characteristic up to date."""
+
+        def _get_value() -> Any:
+            self.async_sync_deferred()
+            return char.value
+
+        return _get_value
+
+    def _synced_chars(self) -> list[Characteristic]:
+        """Return the characteristics driven by the climate state."""
+        return [
+            char
+            for service in self.services
+            if service.display_name != SERV_ACCESSORY_INFO
+            for char in service.characteristics
+        ]
+
+    @callback
+    @override
+    def async_update_state_callback(self, new_state: State | None) -> None:
+        """Leave the snapshot once live state arrives, then update as usual."""
+        if (
+            self._snapshot is not None
+            and new_state is not None
+            and not is_placeholder_state(new_state)
+        ):
+            snapshot, self._snapshot = self._snapshot, None
+            if snapshot.fingerprint != capability_fingerprint(new_state):
+                _LOGGER.debug(
+                    "%s: capabilities differ from the stored snapshot; reloading",
+                    self.entity_id,
+                )
+                self.async_reload()
+                return
+        super().async_update_state_callback(new_state)
+        if self.on_values_changed is not None:
+            self.on_values_changed()
+
+    def snapshot_values(self) -> dict[str, Any]:
+        """Return the characteristic values worth restoring, keyed by service.
+
+        Values are read as they stand; a deferred state is left for a
+        controller to pull in, so callers should skip deferred accessories.
+        """
+        return {
+            f"{service.display_name}.{char.display_name}": char.value
+            for service in self.services
+            if service.display_name != SERV_ACCESSORY_INFO
+            for char in service.characteristics
+        }
+
+    def _restore_snapshot_values(self) -> None:
+        """Serve the snapshot's last values until live state arrives."""
+        if self._snapshot is None:
+            return
+        for service in self.services:
+            for char in service.characteristics:
+                key = f"{service.display_name}.{char.display_name}"
+                if key in self._snapshot.values:
+                    try:
+                        char.set_value(self._snapshot.values[key], should_notify=False)
+                    except ValueError:
+                        continue
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return runtime details of the accessory for diagnostics."""
+        return {
+            "entity_id": self.entity_id,
+            "aid": self.aid,
+            "bridge": getattr(self.driver, "entry_id", None),
+            "deferred": self._deferred_state is not None,
+            "pending_values": {
+                char.display_name: pending.value
+                for char, pending in self._pending_values.items()
+            },
+            "echoes_suppressed": self.echoes_suppressed,
+            "shared": self.shared.as_dict(),
+            "write_latency": self.write_latency.as_dict(),
+            "write_queue": self.write_queue.as_dict(),
+            "notifications": self.notifications.as_dict(),
+        }
+
+    @override
+    def publish(
+        self,
+        value: Any,
+        sender: Characteristic,
+        sender_client_addr: tuple[str, int] | None = None,
+        immediate: bool = False,
+    ) -> None:
+        """Count each HAP event a controller is subscribed to before sending it."""
+        if get_topic(self.aid, self.iid_manager.get_iid(sender)) in self.driver.topics:
+            self.notifications.record(sender.display_name)
+        super().publish(value, sender, sender_client_addr, immediate)
+
     def get_temperature_range(self, state: State) -> tuple[float, float]:
         """Return the valid HomeKit temperature range."""
         return get_temperature_range_from_state(
@@ -128,7 +447,13 @@ class HomeKitClimateAccessory(HomeAccessory):
         service_data: dict[str, Any],
         value: Any | None = None,
     ) -> bool:
-        """Call a service synchronously and restore state after a failure."""
+        """Call a service synchronously and restore state after a failure.
+
+        A call another bridge's accessory for the entity just made is not
+        repeated; it counts as done.
+        """
+        if self.shared.is_duplicate_call(self, f"{domain}.{service}", service_data):
+            return True
         event_data = {
             ATTR_ENTITY_ID: service_data.get(ATTR_ENTITY_ID, self.entity_id),
             ATTR_DISPLAY_NAME: self.display_name,
@@ -137,6 +462,7 @@ class HomeKitClimateAccessory(HomeAccessory):
         }
         context = Context()
         self.hass.bus.async_fire(EVENT_HOMEKIT_CHANGED, event_data, context=context)
+        self.write_queue.in_flight += 1
         try:
             await self.hass.services.async_call(
                 domain, service, service_data, blocking=True, context=context
@@ -157,15 +483,30 @@ class HomeKitClimateAccessory(HomeAccessory):
                 service,
             )
         else:
+            self.shared.record_call(self, f"{domain}.{service}", service_data)
+            if self.config.get(CONF_REFRESH_AFTER_WRITE):
+                self._request_refresh()
             return True
+        finally:
+            self.write_queue.in_flight -= 1
 
+        self.write_queue.failures += 1
         try:
             if (state := self.hass.states.get(self.entity_id)) is not None:
+                self.write_queue.resyncs += 1
                 self.async_update_state(state)
         except Exception:
             _LOGGER.exception("%s: re-syncing HomeKit state failed", self.entity_id)
         return False
 
+    def _request_refresh(self) -> None:
+        """Ask a polling integration to report the write early."""
+        refresher: PollRefresher | None = self.hass.data.get(DOMAIN, {}).get(
+            DATA_REFRESHER
+        )
+        if refresher is not None:
+            refresher.async_request(self.entity_id)
+
     def _configure_current_temperature_char(self, service: Service) -> None:
         """Configure the current temperature characteristic."""
         self.char_current_temp = service.configure_char(
@@ -198,6 +539,70 @@ class HomeKitClimateAccessory(HomeAccessory):
             return None
         return as_float(char.to_valid_value(value))
 
+    def _reported_value(self, char: Characteristic) -> Any:
+        """Return the value the entity last reported for a characteristic."""
+        return self._reported_values.get(char)
+
+    def _hold_pending_value(
+        self, char: Characteristic, value: Any, reported: Any
+    ) -> None:
+        """Keep showing a written value until the entity reports a change."""
+        self._pending_values[char] = PendingValue(
+            value, reported, monotonic() + PENDING_VALUE_TIMEOUT
+        )
+        if (cancel := self._pending_timers.pop(char, None)) is not None:
+            cancel()
+        self._pending_timers[char] = async_call_later(
+            self.hass,
+            PENDING_VALUE_TIMEOUT,
+            partial(self._async_expire_pending_value, char),
+        )
+        char.set_value(value)
+
+    def _drop_pending_value(self, char: Characteristic) -> PendingValue | None:
+        """Forget a characteristic's pending value and cancel its expiry."""
+        if (cancel := self._pending_timers.pop(char, None)) is not None:
+            cancel()
+        return self._pending_values.pop(char, None)
+
+    @callback
+    def _async_expire_pending_value(self, char: Characteristic, _now: Any) -> None:
+        """Give up on a write the entity never reported, and show its value."""
+        self._pending_timers.pop(char, None)
+        if (pending := self._pending_values.pop(char, None)) is None:
+            return
+        if (
+            reported := self._reported_values.get(char)
+        ) is not None and char.value == pending.value:
+            char.set_value(reported)
+        if self._confirming is not None and not self._awaiting_confirmation():
+            self._confirming = None
+            self.write_latency.unconfirmed += 1
+
+    def _set_reported_value(self, char: Characteristic, value: Any) -> None:
+        """Update a characteristic unless the report predates a pending write."""
+        self._reported_values[char] = value
+        if (pending := self._pending_values.get(char)) is not None:
+            if value == pending.reported and monotonic() < pending.expires:
+                char.set_value(pending.value)
+                return
+            self._drop_pending_value(char)
+            if char.value == pending.value and self._is_echo(char, value, pending):
+                # The entity confirmed the write; controllers already have it.
+                self.echoes_suppressed += 1
+                return
+        char.set_value(value)
+
+    def _is_echo(self, char: Characteristic, value: Any, pending: PendingValue) -> bool:
+        """Return True if a report only restates a written value after rounding."""
+        if value == pending.value:
+            return True
+        reported, written = as_float(value), as_float(pending.value)
+        if reported is None or written is None:
+            return False
+        step = as_float(char.properties.get(PROP_MIN_STEP)) or 0
+        return abs(reported - written) <= step / 2
+
     def _update_temperature_char(
         self, char: Characteristic, state: State, attr: str
     ) -> None:
@@ -205,7 +610,7 @@ class HomeKitClimateAccessory(HomeAccessory):
         if (
             value := temperature_attribute_to_homekit(state, attr, self._unit)
         ) is not None:
-            char.set_value(value)
+            self._set_reported_value(char, value)
 
     def _update_current_temperature_char(self, state: State) -> None:
         """Update the current temperature characteristic."""
@@ -282,7 +687,7 @@ class HomeKitClimateAccessory(HomeAccessory):
             )
             is not None
         ):
-            self.char_speed.set_value(speed)
+            self._set_reported_value(self.char_speed, speed)
 
     def _update_swing_char(self, attributes: Mapping[str, Any]) -> None:
         """Update the swing characteristic."""
@@ -296,4 +701,31 @@ class HomeKitClimateAccessory(HomeAccessory):
             isinstance(swing_mode, str)
             and swing_mode.lower() == self.swing_on_mode.lower()
         )
-        self.char_swing.set_value(1 if enabled else 0)
+        self._set_reported_value(self.char_swing, 1 if enabled else 0)
+
+
+@callback
+def async_hook_subscriptions(driver: Any) -> None:
+    """Catch a deferred accessory up as soon as a controller subscribes to it.
+
+    Installed once per driver. The hook outlives reloads of this integration,
+    so it looks the accessory up by aid instead of holding on to any of them.
+    """
+    original = driver.async_subscribe_client_topic
+    if getattr(original, "heatercooler_hook", False):
+        return
+
+    def _subscribe_client_topic(
+        client: Any, topic: str, subscribe: bool = True
+    ) -> None:
+        original(client, topic, subscribe)
+        if not subscribe:
+            return
+        aid = int(topic.split(".", 1)[0])
+        root = driver.accessory
+        accessory = root.accessories.get(aid) if isinstance(root, Bridge) else root
+        if isinstance(accessory, HomeKitClimateAccessory):
+            accessory.async_sync_deferred()
+
+    _subscribe_client_topic.heatercooler_hook = True  # type: ignore[attr-defined]
+    driver.async_subscribe_client_topic = _subscribe_client_topic
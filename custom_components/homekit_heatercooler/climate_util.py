@@ -1,11 +1,15 @@
 """Shared fan, swing, and temperature helpers for the legacy accessory."""
 
 from collections.abc import Iterable
+import hashlib
+import json
 import math
 from typing import Any
 
 from homeassistant.components.climate import (
+    ATTR_CURRENT_HUMIDITY,
     ATTR_FAN_MODES,
+    ATTR_HVAC_MODES,
     ATTR_MAX_TEMP,
     ATTR_MIN_TEMP,
     ATTR_SWING_MODES,
@@ -21,6 +25,11 @@ from homeassistant.components.climate import (
     SWING_VERTICAL,
 )
 from homeassistant.components.homekit.util import get_min_max, temperature_to_homekit
+from homeassistant.const import (
+    ATTR_SUPPORTED_FEATURES,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import State
 from homeassistant.util.percentage import (
     ordered_list_item_to_percentage,
@@ -38,6 +47,17 @@ SWING_MODE_PREFERRED_ORDER = [SWING_ON, SWING_BOTH, SWING_HORIZONTAL, SWING_VERT
 PRE_DEFINED_SWING_MODES = set(SWING_MODE_PREFERRED_ORDER)
 HEAT_COOL_DEADBAND = 5
 
+# The attributes the accessory shape is built from. A failure recorded against
+# one combination says nothing about the next, so a change retries the build.
+CAPABILITY_ATTRIBUTES = (
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_HVAC_MODES,
+    ATTR_FAN_MODES,
+    ATTR_SWING_MODES,
+    ATTR_MIN_TEMP,
+    ATTR_MAX_TEMP,
+)
+
 
 def as_float(value: Any) -> float | None:
     """Return a finite float, or None for an invalid HomeKit value."""
@@ -48,6 +68,26 @@ def as_float(value: Any) -> float | None:
     return None
 
 
+def capability_fingerprint(state: State) -> str:
+    """Return a stable digest of the attributes that shape the accessory."""
+    attributes = state.attributes
+    profile = [attributes.get(attr) for attr in CAPABILITY_ATTRIBUTES]
+    profile.append(ATTR_CURRENT_HUMIDITY in attributes)
+    encoded = json.dumps(profile, default=str, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def is_placeholder_state(state: State) -> bool:
+    """Return True for a state that carries no climate capabilities yet.
+
+    The entity registry restores unavailable placeholders for entities whose
+    integration has not loaded, without any of the climate's attributes.
+    """
+    return state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN) and not (
+        state.attributes.get(ATTR_HVAC_MODES)
+    )
+
+
 def as_hap_integer(value: Any) -> int | None:
     """Coerce a raw HomeKit enum value as pyhap does for integer chars."""
     if (converted := as_float(value)) is not None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
@@ -10,34 +11,48 @@ from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.helpers import selector
 from homeassistant.helpers.entityfilter import (
     CONF_EXCLUDE_ENTITIES,
+    CONF_EXCLUDE_ENTITY_GLOBS,
     CONF_INCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITY_GLOBS,
 )
 
+from .climate_util import as_float
 from .const import (
+    CONF_ACTION_DWELL,
+    CONF_EXCLUDE_AREAS,
+    CONF_EXCLUDE_DEVICES,
+    CONF_EXCLUDE_INTEGRATIONS,
+    CONF_EXCLUDE_LABELS,
     CONF_FAN_LANE,
+    CONF_INCLUDE_AREAS,
+    CONF_INCLUDE_DEVICES,
+    CONF_INCLUDE_INTEGRATIONS,
+    CONF_INCLUDE_LABELS,
+    CONF_REFRESH_AFTER_WRITE,
     DEFAULT_FAN_LANE,
     DOMAIN,
     FAN_LANE_AUTO,
     FAN_LANE_MANUAL,
+    MAX_ACTION_DWELL,
 )
+from .rules import RULE_KEYS
 
 
 def _normalize_input(user_input: dict[str, Any]) -> dict[str, Any]:
-    """Normalize entity lists and fan lane from user input."""
-    include_entities = sorted(
-        set(_list_of_strings(user_input.get(CONF_INCLUDE_ENTITIES)))
+    """Normalize selection rules, fan lane and accessory options from user input."""
+    normalized: dict[str, Any] = {
+        key: sorted(set(_list_of_strings(user_input.get(key)))) for key in RULE_KEYS
+    }
+    lane = user_input.get(CONF_FAN_LANE)
+    normalized[CONF_FAN_LANE] = (
+        lane if lane in (FAN_LANE_AUTO, FAN_LANE_MANUAL) else DEFAULT_FAN_LANE
     )
-    exclude_entities = sorted(
-        set(_list_of_strings(user_input.get(CONF_EXCLUDE_ENTITIES)))
+    normalized[CONF_REFRESH_AFTER_WRITE] = (
+        user_input.get(CONF_REFRESH_AFTER_WRITE) is True
     )
-    lane = user_input.get(CONF_FAN_LANE)
-    return {
-        CONF_INCLUDE_ENTITIES: include_entities,
-        CONF_EXCLUDE_ENTITIES: exclude_entities,
-        CONF_FAN_LANE: lane
-        if lane in (FAN_LANE_AUTO, FAN_LANE_MANUAL)
-        else DEFAULT_FAN_LANE,
-    }
+    dwell = as_float(user_input.get(CONF_ACTION_DWELL)) or 0.0
+    normalized[CONF_ACTION_DWELL] = min(max(dwell, 0.0), MAX_ACTION_DWELL)
+    return normalized
 
 
 def _list_of_strings(value: Any) -> list[str]:
@@ -47,24 +62,46 @@ def _list_of_strings(value: Any) -> list[str]:
     return [item for item in value if isinstance(item, str)]
 
 
-def _build_schema(
-    include_entities: list[str], exclude_entities: list[str], fan_lane: str
-) -> vol.Schema:
-    """Build the form schema for include/exclude entities and fan lane."""
+def _build_schema(source: Mapping[str, Any]) -> vol.Schema:
+    """Build the form schema for selection rules and fan lane."""
     climate_selector = selector.EntitySelector(
         selector.EntitySelectorConfig(
             domain="climate",
             multiple=True,
         )
     )
+    area_selector = selector.AreaSelector(selector.AreaSelectorConfig(multiple=True))
+    device_selector = selector.DeviceSelector(
+        selector.DeviceSelectorConfig(
+            entity=selector.EntityFilterSelectorConfig(domain="climate"),
+            multiple=True,
+        )
+    )
+    label_selector = selector.LabelSelector(selector.LabelSelectorConfig(multiple=True))
+    text_selector = selector.TextSelector(selector.TextSelectorConfig(multiple=True))
+    rule_selectors = {
+        CONF_INCLUDE_ENTITIES: climate_selector,
+        CONF_EXCLUDE_ENTITIES: climate_selector,
+        CONF_INCLUDE_AREAS: area_selector,
+        CONF_EXCLUDE_AREAS: area_selector,
+        CONF_INCLUDE_DEVICES: device_selector,
+        CONF_EXCLUDE_DEVICES: device_selector,
+        CONF_INCLUDE_LABELS: label_selector,
+        CONF_EXCLUDE_LABELS: label_selector,
+        CONF_INCLUDE_INTEGRATIONS: text_selector,
+        CONF_EXCLUDE_INTEGRATIONS: text_selector,
+        CONF_INCLUDE_ENTITY_GLOBS: text_selector,
+        CONF_EXCLUDE_ENTITY_GLOBS: text_selector,
+    }
+    fan_lane = source.get(CONF_FAN_LANE, DEFAULT_FAN_LANE)
     return vol.Schema(
         {
-            vol.Required(
-                CONF_INCLUDE_ENTITIES, default=include_entities
-            ): climate_selector,
-            vol.Optional(
-                CONF_EXCLUDE_ENTITIES, default=exclude_entities
-            ): climate_selector,
+            **{
+                vol.Optional(
+                    key, default=_list_of_strings(source.get(key))
+                ): rule_selector
+                for key, rule_selector in rule_selectors.items()
+            },
             vol.Optional(CONF_FAN_LANE, default=fan_lane): selector.SelectSelector(
                 selector.SelectSelectorConfig(
                     options=[FAN_LANE_AUTO, FAN_LANE_MANUAL],
@@ -72,6 +109,22 @@ def _build_schema(
                     mode=selector.SelectSelectorMode.DROPDOWN,
                 )
             ),
+            vol.Optional(
+                CONF_REFRESH_AFTER_WRITE,
+                default=source.get(CONF_REFRESH_AFTER_WRITE) is True,
+            ): selector.BooleanSelector(),
+            vol.Optional(
+                CONF_ACTION_DWELL,
+                default=as_float(source.get(CONF_ACTION_DWELL)) or 0.0,
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=MAX_ACTION_DWELL,
+                    step=5,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
         }
     )
 
@@ -91,9 +144,7 @@ class HomeKitHeaterCoolerConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=_build_schema(
-                include_entities=[], exclude_entities=[], fan_lane=DEFAULT_FAN_LANE
-            ),
+            data_schema=_build_schema({}),
         )
 
     @staticmethod
@@ -113,11 +164,9 @@ class HomeKitHeaterCoolerOptionsFlow(OptionsFlow):
                 data=_normalize_input(user_input),
             )
 
-        source = self.config_entry.options or self.config_entry.data
-        include_entities = _list_of_strings(source.get(CONF_INCLUDE_ENTITIES))
-        exclude_entities = _list_of_strings(source.get(CONF_EXCLUDE_ENTITIES))
-        fan_lane = source.get(CONF_FAN_LANE, DEFAULT_FAN_LANE)
         return self.async_show_form(
             step_id="init",
-            data_schema=_build_schema(include_entities, exclude_entities, fan_lane),
+            data_schema=_build_schema(
+                self.config_entry.options or self.config_entry.data
+            ),
         )
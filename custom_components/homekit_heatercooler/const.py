@@ -1,23 +1,83 @@
 """Constants for the HomeKit HeaterCooler patch integration."""
 
+from typing import Any
+
 from homeassistant.const import Platform
 
 DOMAIN = "homekit_heatercooler"
 PLATFORMS: list[Platform] = [Platform.SENSOR]
+DATA_BRIDGE_PLAN = "bridge_plan"
+DATA_FLEET = "fleet"
+DATA_HOMEKIT_ENTRY_UNSUB = "homekit_entry_unsub"
+DATA_MEMORY = "memory"
+DATA_METRICS = "metrics"
 DATA_PATCH_STATE = "patch_state"
 DATA_PATCH_STATUS = "patch_status"
 DATA_PATCH_STATUS_UNSUB = "patch_status_unsub"
-DATA_YAML_INCLUDE_ENTITIES = "yaml_include_entities"
-DATA_YAML_EXCLUDE_ENTITIES = "yaml_exclude_entities"
+DATA_PREWARM = "prewarm"
+DATA_REFRESHER = "refresher"
+DATA_RESOLVED_ENTITIES = "resolved_entities"
+DATA_ROUTING_LOG = "routing_log"
+DATA_ROUTING_TABLE = "routing_table"
+DATA_RULE_INDEX = "rule_index"
+DATA_RULE_INDEX_UNSUB = "rule_index_unsub"
+DATA_SHAPES = "shapes"
+DATA_SHARED = "shared"
+DATA_SNAPSHOTS = "snapshots"
+DATA_STATUS_BUCKETS = "status_buckets"
+DATA_WATCHDOG = "watchdog"
+DATA_YAML_ACCESSORY_OPTIONS = "yaml_accessory_options"
+DATA_YAML_INCLUDE_RULES = "yaml_include_rules"
+DATA_YAML_EXCLUDE_RULES = "yaml_exclude_rules"
+DATA_YAML_BRIDGES = "yaml_bridges"
 DATA_YAML_FAN_LANE = "yaml_fan_lane"
+SERVICE_DUMP_TRACE = "dump_trace"
+SERVICE_MEMORY_REPORT = "memory_report"
+SERVICE_PLAN_BRIDGES = "plan_bridges"
+SERVICE_PROFILE = "profile"
 SIGNAL_PATCH_STATUS_UPDATED = f"{DOMAIN}_patch_status_updated"
+SIGNAL_ACCESSORY_FAILED = f"{DOMAIN}_accessory_failed"
+SIGNAL_FLEET_UPDATED = f"{DOMAIN}_fleet_updated"
+SIGNAL_LOOP_LAG_UPDATED = f"{DOMAIN}_loop_lag_updated"
 
+ATTR_APPLY = "apply"
+ATTR_SECONDS = "seconds"
+ATTR_STOP = "stop"
+CONF_ACTION_DWELL = "action_dwell"
+CONF_BRIDGES = "bridges"
 CONF_FAN_LANE = "fan_lane"
+CONF_REFRESH_AFTER_WRITE = "refresh_after_write"
+CONF_WATCHDOG_THRESHOLD = "watchdog_threshold"
+CONF_INCLUDE_AREAS = "include_areas"
+CONF_EXCLUDE_AREAS = "exclude_areas"
+CONF_INCLUDE_DEVICES = "include_devices"
+CONF_EXCLUDE_DEVICES = "exclude_devices"
+CONF_INCLUDE_LABELS = "include_labels"
+CONF_EXCLUDE_LABELS = "exclude_labels"
+CONF_INCLUDE_INTEGRATIONS = "include_integrations"
+CONF_EXCLUDE_INTEGRATIONS = "exclude_integrations"
 FAN_LANE_AUTO = "auto"
 FAN_LANE_MANUAL = "manual"
 DEFAULT_FAN_LANE = FAN_LANE_AUTO
+MAX_ACTION_DWELL = 600
 TYPE_HEATER_COOLER = "heater_cooler"
 
+# Why an entity in the routing table is or is not a HeaterCooler.
+ROUTE_PATCHED = "patched"
+ROUTE_INACTIVE = "hook_inactive"
+ROUTE_EXCLUDED = "excluded"
+ROUTE_MISSING = "missing"
+ROUTE_NON_CLIMATE = "non_climate"
+ROUTE_UNSUPPORTED = "unsupported"
+ROUTE_FAILED = "build_failed"
+ROUTE_BRIDGE_OVERRIDE = "bridge_override"
+
+# Options passed through to each HeaterCooler accessory, with their defaults.
+ACCESSORY_OPTION_DEFAULTS: dict[str, Any] = {
+    CONF_ACTION_DWELL: 0.0,
+    CONF_REFRESH_AFTER_WRITE: False,
+}
+
 # Released Home Assistant versions without native support do not expose these
 # HeaterCooler characteristic and service names.
 CHAR_ACTIVE = "Active"
@@ -0,0 +1,150 @@
+"""Diagnostics support for the HomeKit HeaterCooler patch integration."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_BRIDGE_PLAN,
+    DATA_FLEET,
+    DATA_PATCH_STATE,
+    DATA_PATCH_STATUS,
+    DATA_PREWARM,
+    DATA_REFRESHER,
+    DATA_ROUTING_TABLE,
+    DATA_SHAPES,
+    DATA_WATCHDOG,
+    DOMAIN,
+)
+from .metrics import WriteLatency
+from .planner import BridgePlan, build_bridge_plan
+
+if TYPE_CHECKING:
+    from .climate_base import HomeKitClimateAccessory
+
+# How many entries the write-queue and notification rankings list.
+SLOWEST_WRITE_QUEUES = 10
+TOP_TALKERS = 20
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    domain_data = hass.data.get(DOMAIN, {})
+    patch_state = domain_data.get(DATA_PATCH_STATE)
+    prewarm = domain_data.get(DATA_PREWARM)
+    shapes = domain_data.get(DATA_SHAPES)
+    refresher = domain_data.get(DATA_REFRESHER)
+    fleet = domain_data.get(DATA_FLEET)
+    watchdog = domain_data.get(DATA_WATCHDOG)
+    return {
+        "patch_status": domain_data.get(DATA_PATCH_STATUS, {}),
+        "patch_state": patch_state.as_dict() if patch_state else None,
+        "routing_table": domain_data.get(DATA_ROUTING_TABLE, {}),
+        "bridge_plan": _bridge_plan(hass, domain_data).as_dict(),
+        "prewarm": prewarm.as_dict() if prewarm else None,
+        "shapes": shapes.as_dict() if shapes else {},
+        "fleet": fleet.as_dict() if fleet else None,
+        "watchdog": watchdog.as_dict() if watchdog else None,
+        "refresh_after_write": refresher.as_dict() if refresher else None,
+        "schedulers": {
+            str(getattr(driver, "entry_id", None)): scheduler.as_dict()
+            for driver, scheduler in patch_state.schedulers.items()
+        }
+        if patch_state
+        else {},
+        "write_latency": _bridge_write_latency(patch_state.accessories)
+        if patch_state
+        else {},
+        "slowest_write_queues": _slowest_write_queues(patch_state.accessories)
+        if patch_state
+        else [],
+        "top_talkers": _top_talkers(patch_state.accessories) if patch_state else [],
+        "accessories": sorted(
+            (accessory.diagnostics() for accessory in patch_state.accessories),
+            key=lambda accessory: (str(accessory["bridge"]), accessory["entity_id"]),
+        )
+        if patch_state
+        else [],
+    }
+
+
+def _bridge_plan(hass: HomeAssistant, domain_data: dict[str, Any]) -> BridgePlan:
+    """Return the bridge plan, built once per routing or bridge change."""
+    if (plan := domain_data.get(DATA_BRIDGE_PLAN)) is None:
+        patch_state = domain_data.get(DATA_PATCH_STATE)
+        plan = domain_data[DATA_BRIDGE_PLAN] = build_bridge_plan(
+            hass, patch_state.bridges if patch_state else {}
+        )
+    return plan
+
+
+def _bridge_write_latency(
+    accessories: Iterable[HomeKitClimateAccessory],
+) -> dict[str, Any]:
+    """Return the write latency of every bridge's accessories combined."""
+    by_bridge: defaultdict[str, list[WriteLatency]] = defaultdict(list)
+    for accessory in accessories:
+        by_bridge[str(getattr(accessory.driver, "entry_id", None))].append(
+            accessory.write_latency
+        )
+    return {
+        bridge: WriteLatency.combined(latencies).as_dict()
+        for bridge, latencies in by_bridge.items()
+    }
+
+
+def _slowest_write_queues(
+    accessories: Iterable[HomeKitClimateAccessory],
+) -> list[dict[str, Any]]:
+    """Return the accessories whose writes waited longest for the lock."""
+    ranked = sorted(
+        (
+            accessory
+            for accessory in accessories
+            if accessory.write_queue.max_lock_wait > 0
+        ),
+        key=lambda accessory: accessory.write_queue.max_lock_wait,
+        reverse=True,
+    )
+    return [
+        {
+            "entity_id": accessory.entity_id,
+            "bridge": getattr(accessory.driver, "entry_id", None),
+            **accessory.write_queue.as_dict(),
+        }
+        for accessory in ranked[:SLOWEST_WRITE_QUEUES]
+    ]
+
+
+def _top_talkers(
+    accessories: Iterable[HomeKitClimateAccessory],
+) -> list[dict[str, Any]]:
+    """Return the characteristics sending the most HAP events per minute.
+
+    An entity on several bridges adds up the events of each of its accessories.
+    """
+    rates: defaultdict[tuple[str, str], float] = defaultdict(float)
+    counts: defaultdict[tuple[str, str], int] = defaultdict(int)
+    for accessory in accessories:
+        notifications = accessory.notifications
+        for characteristic, rate in notifications.per_minute().items():
+            key = (accessory.entity_id, characteristic)
+            rates[key] += rate
+            counts[key] += notifications.counts[characteristic]
+    ranked = sorted(rates, key=rates.__getitem__, reverse=True)[:TOP_TALKERS]
+    return [
+        {
+            "entity_id": entity_id,
+            "characteristic": characteristic,
+            "events": counts[entity_id, characteristic],
+            "per_minute": round(rates[entity_id, characteristic], 3),
+        }
+        for entity_id, characteristic in ranked
+    ]
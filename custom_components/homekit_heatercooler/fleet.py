@@ -0,0 +1,63 @@
+"""Running totals of what the routed climates are doing."""
+
+from __future__ import annotations
+
+from weakref import WeakSet
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_FLEET_UPDATED
+
+FLEET_HEATING = "heating"
+FLEET_COOLING = "cooling"
+FLEET_IDLE = "idle"
+FLEET_OFF = "off"
+FLEET_UNAVAILABLE = "unavailable"
+FLEET_ACTIONS = (FLEET_HEATING, FLEET_COOLING, FLEET_IDLE, FLEET_OFF, FLEET_UNAVAILABLE)
+
+
+class FleetActions:
+    """Count routed climates by their current action, one unit per entity.
+
+    Running accessories report each state they see, and only a change of an
+    entity's action touches the totals, so reading them never scans states.
+    An entity on several bridges counts once, until the last of its
+    accessories stops or is garbage collected.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize empty totals."""
+        self._hass = hass
+        self._actions: dict[str, str] = {}
+        self._reporters: dict[str, WeakSet[object]] = {}
+        self.counts: dict[str, int] = dict.fromkeys(FLEET_ACTIONS, 0)
+
+    @callback
+    def async_report(self, entity_id: str, reporter: object, action: str) -> None:
+        """Record an entity's current action."""
+        self._reporters.setdefault(entity_id, WeakSet()).add(reporter)
+        if (previous := self._actions.get(entity_id)) == action:
+            return
+        self._actions[entity_id] = action
+        self.counts[action] += 1
+        if previous is not None:
+            self.counts[previous] -= 1
+        async_dispatcher_send(self._hass, SIGNAL_FLEET_UPDATED, previous, action)
+
+    @callback
+    def async_withdraw(self, entity_id: str, reporter: object) -> None:
+        """Stop counting an entity once none of its accessories report it."""
+        if (reporters := self._reporters.get(entity_id)) is None:
+            return
+        reporters.discard(reporter)
+        if reporters:
+            return
+        del self._reporters[entity_id]
+        previous = self._actions.pop(entity_id)
+        self.counts[previous] -= 1
+        async_dispatcher_send(self._hass, SIGNAL_FLEET_UPDATED, previous, None)
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the totals for diagnostics."""
+        return dict(self.counts)
@@ -0,0 +1,216 @@
+"""Memory footprint of the patched accessories and the integration's state."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Iterable, Mapping
+import gc
+from pathlib import Path
+import sys
+import tracemalloc
+from types import FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+from pyhap.accessory import Accessory
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .shapes import accessory_shape, shape_hash
+
+if TYPE_CHECKING:
+    from .climate_base import HomeKitClimateAccessory
+
+# Frames kept per allocation, so pyhap objects built by this package count too.
+TRACE_FRAMES = 25
+TOP_LINES = 20
+# Tracing stops by itself this many seconds after the latest report.
+TRACE_TIMEOUT = 1800.0
+
+_PACKAGE_DIR = str(Path(__file__).parent)
+# Instances of these packages are walked into; anything else is sized alone.
+_OWNED_MODULES = ("pyhap.", "homeassistant.components.homekit.", f"{__package__}.")
+_CONTAINERS = (dict, list, tuple, set, frozenset, deque)
+
+
+def footprint(root: object, boundary: Iterable[object] = ()) -> int:
+    """Return the bytes of an object and everything it alone holds.
+
+    The walk follows containers, closures and instances of pyhap, HomeKit and
+    this package, and stops at Home Assistant, the HAP driver, the event loop,
+    other accessories and anything in the boundary, so shared objects are
+    not charged to whichever accessory references them.
+    """
+    excluded = {id(obj) for obj in boundary}
+    seen: set[int] = set()
+    stack = [root]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or id(obj) in excluded:
+            continue
+        seen.add(id(obj))
+        if obj is not root and (
+            isinstance(obj, (type, ModuleType, MethodType, asyncio.AbstractEventLoop))
+            or isinstance(obj, Accessory)
+            or isinstance(obj, HomeAssistant)
+        ):
+            continue
+        size += sys.getsizeof(obj)
+        if isinstance(obj, _CONTAINERS):
+            stack.extend(gc.get_referents(obj))
+        elif isinstance(obj, FunctionType):
+            stack.extend(cell.cell_contents for cell in obj.__closure__ or ())
+            stack.extend(obj.__defaults__ or ())
+        elif obj is root or type(obj).__module__.startswith(_OWNED_MODULES):
+            stack.extend(gc.get_referents(obj))
+    return size
+
+
+def accessory_footprints(
+    accessories: Iterable[HomeKitClimateAccessory],
+) -> dict[str, Any]:
+    """Return the bytes each accessory holds, and their sum per HAP shape."""
+    report: list[dict[str, Any]] = []
+    profiles: dict[str, dict[str, int]] = {}
+    for accessory in accessories:
+        size = footprint(
+            accessory,
+            (accessory.driver, accessory.driver.iid_storage, accessory.shared),
+        )
+        profile = shape_hash(accessory_shape(accessory))
+        report.append(
+            {
+                "entity_id": accessory.entity_id,
+                "bridge": getattr(accessory.driver, "entry_id", None),
+                "profile": profile,
+                "bytes": size,
+            }
+        )
+        totals = profiles.setdefault(profile, {"accessories": 0, "bytes": 0})
+        totals["accessories"] += 1
+        totals["bytes"] += size
+    report.sort(key=lambda entry: -entry["bytes"])
+    return {"accessories": report, "profiles": profiles}
+
+
+def integration_footprints(domain_data: Mapping[str, Any]) -> dict[str, int]:
+    """Return the bytes each of the integration's stored structures holds."""
+    return {key: footprint(value) for key, value in domain_data.items()}
+
+
+def package_allocations(snapshot: tracemalloc.Snapshot) -> Counter[str]:
+    """Return the traced bytes per line of this package that allocated them.
+
+    Each allocation is charged to the innermost frame in this package, so a
+    characteristic pyhap builds for an accessory counts against the line of
+    the accessory that asked for it.
+    """
+    allocations: Counter[str] = Counter()
+    for trace in snapshot.traces:
+        for frame in reversed(trace.traceback):
+            if frame.filename.startswith(_PACKAGE_DIR):
+                name = Path(frame.filename).name
+                allocations[f"{name}:{frame.lineno}"] += trace.size
+                break
+    return allocations
+
+
+class MemoryTracker:
+    """Trace this package's allocations and compare successive snapshots.
+
+    Tracing slows every allocation, so it stops by itself once no report has
+    been taken for a while, and when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant, timeout: float = TRACE_TIMEOUT) -> None:
+        """Initialize without tracing."""
+        self._hass = hass
+        self._timeout = timeout
+        self._previous: Counter[str] | None = None
+        self._started = False
+        self._timer: CALLBACK_TYPE | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+        self.snapshots = 0
+
+    async def async_take(self) -> dict[str, Any]:
+        """Take a snapshot in the executor and restart the tracing timeout."""
+        report: dict[str, Any] = await self._hass.async_add_executor_job(self.take)
+        self._cancel_timer()
+        if self._started:
+            self._timer = async_call_later(
+                self._hass, self._timeout, self._async_timed_out
+            )
+            if self._unsub_stop is None:
+                self._unsub_stop = self._hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_STOP, self._async_hass_stopping
+                )
+        return report
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracing and drop the timeout and the stop listener."""
+        self._cancel_timer()
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        self.stop()
+
+    @callback
+    def _async_timed_out(self, _now: object) -> None:
+        """Stop tracing nobody has asked for in a while."""
+        self._timer = None
+        self.async_stop()
+
+    @callback
+    def _async_hass_stopping(self, _event: Event) -> None:
+        """Stop tracing with Home Assistant."""
+        self._unsub_stop = None
+        self.async_stop()
+
+    def _cancel_timer(self) -> None:
+        """Cancel a pending tracing timeout."""
+        if self._timer is not None:
+            self._timer()
+            self._timer = None
+
+    def take(self) -> dict[str, Any]:
+        """Take a snapshot and report it against the previous one.
+
+        Tracing starts with the first snapshot, so only memory allocated after
+        it is seen; reload the HomeKit bridges to trace their accessories.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._started = True
+            self._previous = None
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, f"{_PACKAGE_DIR}/*", all_frames=True)]
+        )
+        allocations = package_allocations(snapshot)
+        previous, self._previous = self._previous, allocations
+        self.snapshots += 1
+        report: dict[str, Any] = {
+            "snapshot": self.snapshots,
+            "traced_bytes": allocations.total(),
+            "top_lines": dict(allocations.most_common(TOP_LINES)),
+            "growth": None,
+        }
+        if previous is not None:
+            growth = Counter(allocations)
+            growth.subtract(previous)
+            ranked = sorted(growth.items(), key=lambda item: -abs(item[1]))
+            report["growth"] = {
+                "bytes": allocations.total() - previous.total(),
+                "lines": {line: diff for line, diff in ranked[:TOP_LINES] if diff},
+            }
+        return report
+
+    def stop(self) -> None:
+        """Stop tracing if it was started here, and forget the last snapshot."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+        self._previous = None
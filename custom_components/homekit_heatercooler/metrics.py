@@ -0,0 +1,154 @@
+"""Fixed-size runtime metrics for HeaterCooler accessories."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+# Upper bounds of the latency buckets, in seconds; one more bucket holds the rest.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PERCENTILES = (0.5, 0.9, 0.99)
+WRITE_INTERVALS = ("queue", "call", "confirm", "total")
+
+
+class Histogram:
+    """Count observations into fixed buckets, so memory never grows."""
+
+    __slots__ = ("bounds", "counts", "total")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations."""
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def merge(self, other: Histogram) -> None:
+        """Add another histogram with the same buckets to this one."""
+        self.counts = [
+            mine + theirs
+            for mine, theirs in zip(self.counts, other.counts, strict=True)
+        ]
+        self.total += other.total
+
+    def percentile(self, quantile: float) -> float | None:
+        """Return the upper bound of the bucket holding a quantile.
+
+        None means no observations, or a quantile beyond the last bucket.
+        """
+        if not (count := self.count):
+            return None
+        seen = 0
+        for bound, bucket in zip(self.bounds, self.counts, strict=False):
+            seen += bucket
+            if seen >= quantile * count:
+                return bound
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary and the bucket counts for diagnostics."""
+        count = self.count
+        return {
+            "count": count,
+            "mean": round(self.total / count, 6) if count else None,
+            **{f"p{round(q * 100)}": self.percentile(q) for q in PERCENTILES},
+            "buckets": dict(
+                zip([*map(str, self.bounds), "+Inf"], self.counts, strict=True)
+            ),
+        }
+
+
+@dataclass
+class WriteLatency:
+    """Where the time goes between a HomeKit write and its confirmation.
+
+    queue runs from the batch arriving to holding the write lock, call until
+    its service calls complete, confirm until the entity reports the written
+    values, and total covers all three.
+    """
+
+    queue: Histogram = field(default_factory=Histogram)
+    call: Histogram = field(default_factory=Histogram)
+    confirm: Histogram = field(default_factory=Histogram)
+    total: Histogram = field(default_factory=Histogram)
+    unconfirmed: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return each interval's histogram for diagnostics."""
+        return {
+            **{
+                interval: getattr(self, interval).as_dict()
+                for interval in WRITE_INTERVALS
+            },
+            "unconfirmed": self.unconfirmed,
+        }
+
+    @classmethod
+    def combined(cls, latencies: Iterable[WriteLatency]) -> WriteLatency:
+        """Return the sum of several accessories' latencies."""
+        result = cls()
+        for latency in latencies:
+            for interval in WRITE_INTERVALS:
+                getattr(result, interval).merge(getattr(latency, interval))
+            result.unconfirmed += latency.unconfirmed
+        return result
+
+
+@dataclass
+class WriteQueueStats:
+    """Live write-queue gauges and lifetime write counters of an accessory."""
+
+    queued: int = 0
+    in_flight: int = 0
+    max_lock_wait: float = 0.0
+    batches: int = 0
+    failures: int = 0
+    resyncs: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the gauges and counters for diagnostics."""
+        return {
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "max_lock_wait": round(self.max_lock_wait, 6),
+            "batches": self.batches,
+            "failures": self.failures,
+            "resyncs": self.resyncs,
+        }
+
+
+class NotificationCounter:
+    """Count the HAP events an accessory publishes, per characteristic."""
+
+    __slots__ = ("counts", "started")
+
+    def __init__(self) -> None:
+        """Start counting from now."""
+        self.counts: Counter[str] = Counter()
+        self.started = monotonic()
+
+    def record(self, characteristic: str) -> None:
+        """Count one event."""
+        self.counts[characteristic] += 1
+
+    def per_minute(self) -> dict[str, float]:
+        """Return each characteristic's average events per minute."""
+        minutes = max(monotonic() - self.started, 1.0) / 60
+        return {name: count / minutes for name, count in self.counts.items()}
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the event counts for diagnostics."""
+        return dict(self.counts)
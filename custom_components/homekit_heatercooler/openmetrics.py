@@ -0,0 +1,234 @@
+"""OpenMetrics exposition of the integration's counters, gauges and histograms."""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping, MutableMapping
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+
+from .const import (
+    DATA_FLEET,
+    DATA_METRICS,
+    DATA_PATCH_STATE,
+    DATA_ROUTING_TABLE,
+    DATA_SHAPES,
+    DOMAIN,
+)
+from .metrics import WRITE_INTERVALS, Histogram, WriteLatency
+
+if TYPE_CHECKING:
+    from .climate_base import HomeKitClimateAccessory
+
+CONTENT_TYPE_OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PREFIX = DOMAIN
+# Scrapes within this many seconds of a render are served the same text.
+RENDER_INTERVAL = 10.0
+
+type Labels = Mapping[str, object]
+
+
+class MetricsWriter:
+    """Collect metric families and render them as OpenMetrics text."""
+
+    def __init__(self) -> None:
+        """Initialize an empty exposition."""
+        self._lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> str:
+        """Start a metric family and return its full name."""
+        name = f"{PREFIX}_{name}"
+        self._lines += [f"# TYPE {name} {kind}", f"# HELP {name} {help_text}"]
+        return name
+
+    def sample(self, name: str, labels: Labels, value: float) -> None:
+        """Add one sample to the current family."""
+        self._lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(self, name: str, labels: Labels, histogram: Histogram) -> None:
+        """Add a histogram's cumulative buckets, count and sum."""
+        seen = 0
+        for bound, count in zip(
+            [*map(repr, histogram.bounds), "+Inf"], histogram.counts, strict=True
+        ):
+            seen += count
+            self.sample(f"{name}_bucket", {**labels, "le": bound}, seen)
+        self.sample(f"{name}_count", labels, seen)
+        self.sample(f"{name}_sum", labels, histogram.total)
+
+    def render(self) -> str:
+        """Return the exposition, terminated as OpenMetrics requires."""
+        return "\n".join([*self._lines, "# EOF", ""])
+
+
+def _labels(labels: Labels) -> str:
+    """Return a label set, escaped for the text format."""
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+    return f"{{{pairs}}}"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _bridge(accessory: HomeKitClimateAccessory) -> str:
+    """Return the config entry ID of an accessory's bridge."""
+    return str(getattr(accessory.driver, "entry_id", None))
+
+
+def render_metrics(domain_data: Mapping[str, Any]) -> str:
+    """Return the integration's metrics as OpenMetrics text.
+
+    Accessory metrics are summed per bridge, so the number of series follows
+    the number of bridges rather than the number of climates.
+    """
+    writer = MetricsWriter()
+    patch_state = domain_data.get(DATA_PATCH_STATE)
+    accessories: Iterable[HomeKitClimateAccessory] = (
+        list(patch_state.accessories) if patch_state else []
+    )
+    by_bridge: defaultdict[str, list[HomeKitClimateAccessory]] = defaultdict(list)
+    for accessory in accessories:
+        by_bridge[_bridge(accessory)].append(accessory)
+
+    name = writer.family("routed_entities", "gauge", "Selected climates by route.")
+    routes = Counter(
+        route["reason"] for route in domain_data.get(DATA_ROUTING_TABLE, {}).values()
+    )
+    for reason, count in sorted(routes.items()):
+        writer.sample(name, {"reason": reason}, count)
+
+    name = writer.family("accessories", "gauge", "Live HeaterCooler accessories.")
+    for bridge, members in sorted(by_bridge.items()):
+        writer.sample(name, {"bridge": bridge}, len(members))
+
+    if (fleet := domain_data.get(DATA_FLEET)) is not None:
+        name = writer.family("units", "gauge", "Routed climates by current action.")
+        for action, count in fleet.counts.items():
+            writer.sample(name, {"action": action}, count)
+
+    name = writer.family(
+        "write_latency_seconds", "histogram", "HomeKit write latency by interval."
+    )
+    latencies = {
+        bridge: WriteLatency.combined(accessory.write_latency for accessory in members)
+        for bridge, members in sorted(by_bridge.items())
+    }
+    for bridge, latency in latencies.items():
+        for interval in WRITE_INTERVALS:
+            writer.histogram(
+                name,
+                {"bridge": bridge, "interval": interval},
+                getattr(latency, interval),
+            )
+    name = writer.family(
+        "writes_unconfirmed", "counter", "Writes the entity never reported back."
+    )
+    for bridge, latency in latencies.items():
+        writer.sample(f"{name}_total", {"bridge": bridge}, latency.unconfirmed)
+
+    for field, kind, help_text in (
+        ("queued", "gauge", "Write batches waiting for the write lock."),
+        ("in_flight", "gauge", "Service calls in progress."),
+        ("batches", "counter", "Write batches handled."),
+        ("failures", "counter", "Service calls that failed."),
+        ("resyncs", "counter", "Accessory re-syncs after a failed write."),
+    ):
+        name = writer.family(f"write_{field}", kind, help_text)
+        suffix = "_total" if kind == "counter" else ""
+        for bridge, members in sorted(by_bridge.items()):
+            writer.sample(
+                f"{name}{suffix}",
+                {"bridge": bridge},
+                sum(getattr(accessory.write_queue, field) for accessory in members),
+            )
+
+    name = writer.family("hap_events", "counter", "HAP events by characteristic.")
+    for bridge, members in sorted(by_bridge.items()):
+        events: Counter[str] = Counter()
+        for accessory in members:
+            events.update(accessory.notifications.counts)
+        for characteristic, count in sorted(events.items()):
+            writer.sample(
+                f"{name}_total",
+                {"bridge": bridge, "characteristic": characteristic},
+                count,
+            )
+
+    name = writer.family(
+        "echoes_suppressed", "counter", "State echoes of HomeKit writes not re-sent."
+    )
+    for bridge, members in sorted(by_bridge.items()):
+        writer.sample(
+            f"{name}_total",
+            {"bridge": bridge},
+            sum(accessory.echoes_suppressed for accessory in members),
+        )
+
+    if (shapes := domain_data.get(DATA_SHAPES)) is not None:
+        bridges = shapes.as_dict()
+        for field, name, help_text in (
+            (
+                "reloads_skipped",
+                "reloads_suppressed",
+                "Reloads skipped because the shape held.",
+            ),
+            ("changes", "shape_changes", "Accessory shape changes."),
+        ):
+            name = writer.family(name, "counter", help_text)
+            for bridge, records in bridges.items():
+                writer.sample(
+                    f"{name}_total",
+                    {"bridge": bridge},
+                    sum(record[field] for record in records.values()),
+                )
+
+    name = writer.family(
+        "build_failures", "counter", "HeaterCooler builds that failed."
+    )
+    failures = patch_state.failed_accessories.values() if patch_state else ()
+    writer.sample(f"{name}_total", {}, sum(failure.count for failure in failures))
+    return writer.render()
+
+
+def cached_metrics(domain_data: MutableMapping[str, Any]) -> str:
+    """Return the exposition, rendering it at most once per interval.
+
+    Rendering walks every accessory, so several scrapers, or one scraping
+    often, share a render instead of each paying for it.
+    """
+    now = monotonic()
+    cached: tuple[float, str] | None = domain_data.get(DATA_METRICS)
+    if cached is None or cached[0] <= now:
+        cached = domain_data[DATA_METRICS] = (
+            now + RENDER_INTERVAL,
+            render_metrics(domain_data),
+        )
+    return cached[1]
+
+
+class HomeKitHeaterCoolerMetricsView(HomeAssistantView):
+    """Serve the integration's metrics to an authenticated scraper."""
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the current metrics."""
+        hass = request.app[KEY_HASS]
+        return web.Response(
+            body=cached_metrics(hass.data.get(DOMAIN, {})).encode(),
+            headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_OPENMETRICS},
+        )
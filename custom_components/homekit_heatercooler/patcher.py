@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 import inspect
 import logging
+import time
 from typing import Any
+from weakref import WeakKeyDictionary, WeakSet
 
 from homeassistant.components import homekit as homekit_module
 from homeassistant.components.climate import (
@@ -17,15 +19,24 @@ from homeassistant.components.climate import (
 from homeassistant.components.homekit import accessories as homekit_accessories
 from homeassistant.const import ATTR_SUPPORTED_FEATURES, CONF_NAME
 from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.dispatcher import dispatcher_send
 
-from .climate_util import as_float
+from .bridges import BridgeRoute
+from .climate_util import as_float, capability_fingerprint, is_placeholder_state
 from .const import (
     CONF_FAN_LANE,
     DATA_PATCH_STATE,
+    DATA_SHAPES,
+    DATA_SNAPSHOTS,
     DEFAULT_FAN_LANE,
     DOMAIN,
+    SIGNAL_ACCESSORY_FAILED,
     TYPE_HEATER_COOLER,
 )
+from .scheduler import NotificationScheduler
+from .shapes import ShapeTracker
+from .snapshots import AccessorySnapshot, SnapshotStore
+from .watchdog import watch
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,6 +48,32 @@ GetAccessory = Callable[
 ]
 
 
+@dataclass(frozen=True)
+class PrewarmTimings:
+    """How long the setup prewarm spent on each step, in seconds."""
+
+    import_seconds: float
+    probe_seconds: float
+    params: tuple[str, ...]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings for diagnostics."""
+        return {
+            "import_seconds": round(self.import_seconds, 6),
+            "probe_seconds": round(self.probe_seconds, 6),
+            "get_accessory_params": list(self.params),
+        }
+
+
+@dataclass
+class FailedAccessory:
+    """A HeaterCooler build that failed for one capability fingerprint."""
+
+    fingerprint: str
+    error: str
+    count: int = 1
+
+
 @dataclass
 class PatchState:
     """In-memory runtime patch state."""
@@ -46,6 +83,57 @@ class PatchState:
     fan_lane: str
     original_get_accessory: GetAccessory
     original_homekit_get_accessory: GetAccessory
+    # Keyed by entity and fan lane, since the lane shapes the accessory too.
+    failed_accessories: dict[tuple[str, str], FailedAccessory] = field(
+        default_factory=dict
+    )
+    bridges: Mapping[str, BridgeRoute] = field(default_factory=dict)
+    accessory_options: Mapping[str, Any] = field(default_factory=dict)
+    accessories: WeakSet[homekit_accessories.HomeAccessory] = field(
+        default_factory=WeakSet
+    )
+    schedulers: WeakKeyDictionary[
+        homekit_accessories.HomeDriver, NotificationScheduler
+    ] = field(default_factory=WeakKeyDictionary)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the routing inputs and build failures for diagnostics."""
+        return {
+            "fan_lane": self.fan_lane,
+            "include_entities": sorted(self.include_entities),
+            "exclude_entities": sorted(self.exclude_entities),
+            "accessory_options": dict(self.accessory_options),
+            "bridges": {
+                entry_id: {
+                    "name": bridge.name,
+                    "fan_lane": bridge.fan_lane,
+                    "entities_count": len(bridge.entities),
+                }
+                for entry_id, bridge in sorted(self.bridges.items())
+            },
+            "failed_accessories": self.failures_by_entity(),
+            "accessories_count": len(self.accessories),
+        }
+
+    def failures_by_entity(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the build failures of each entity, keyed by fan lane."""
+        failures: dict[str, dict[str, dict[str, Any]]] = {}
+        for (entity_id, fan_lane), failure in sorted(self.failed_accessories.items()):
+            failures.setdefault(entity_id, {})[fan_lane] = asdict(failure)
+        return failures
+
+    def route(
+        self, driver: homekit_accessories.HomeDriver, entity_id: str
+    ) -> str | None:
+        """Return the fan lane if the driver's bridge routes this entity."""
+        entry_id = getattr(driver, "entry_id", None)
+        if entry_id is not None and (bridge := self.bridges.get(entry_id)):
+            return bridge.fan_lane if entity_id in bridge.entities else None
+        if _should_patch_entity(
+            entity_id, self.include_entities, self.exclude_entities
+        ):
+            return self.fan_lane
+        return None
 
 
 def supports_heatercooler(state: State) -> bool:
@@ -81,6 +169,18 @@ def _get_accessory_params(func: Callable[..., Any]) -> tuple[str, ...]:
         return ()
 
 
+# Probed get_accessory parameters, so apply_patch never inspects on the loop
+# once setup has prewarmed them.
+_probed_params: dict[Callable[..., Any], tuple[str, ...]] = {}
+
+
+def _probe_get_accessory_params(func: Callable[..., Any]) -> tuple[str, ...]:
+    """Return get_accessory's parameter names, inspecting each function once."""
+    if (params := _probed_params.get(func)) is None:
+        params = _probed_params[func] = _get_accessory_params(func)
+    return params
+
+
 def native_heatercooler_available() -> bool:
     """Return whether HomeKit provides its own HeaterCooler implementation."""
     climate_types = getattr(homekit_accessories, "CLIMATE_TYPES", None)
@@ -104,24 +204,59 @@ def _bundled_heatercooler() -> type[homekit_accessories.HomeAccessory]:
     return HeaterCooler
 
 
+def prewarm() -> PrewarmTimings:
+    """Import the bundled accessory and probe HomeKit's signature ahead of use.
+
+    Setup runs this in the import executor, so the first bridge start neither
+    imports pyhap-backed modules nor inspects signatures on the event loop.
+    """
+    started = time.perf_counter()
+    _bundled_heatercooler()
+    imported = time.perf_counter()
+    params = _probe_get_accessory_params(homekit_accessories.get_accessory)
+    return PrewarmTimings(
+        import_seconds=imported - started,
+        probe_seconds=time.perf_counter() - imported,
+        params=params,
+    )
+
+
 def apply_patch(
     hass: HomeAssistant,
     include_entities: set[str],
     exclude_entities: set[str],
     fan_lane: str = DEFAULT_FAN_LANE,
+    bridges: Mapping[str, BridgeRoute] | None = None,
+    accessory_options: Mapping[str, Any] | None = None,
 ) -> None:
-    """Patch HomeKit get_accessory to expose selected climates as HeaterCooler."""
+    """Patch HomeKit get_accessory to expose selected climates as HeaterCooler.
+
+    Bridges with a routing table use it and its fan lane; any other driver
+    falls back to the bridge-wide selection. Accessory options are added to
+    the config of every HeaterCooler built from then on.
+    """
     domain_data = hass.data.setdefault(DOMAIN, {})
     patch_state = domain_data.get(DATA_PATCH_STATE)
     if patch_state:
         patch_state.include_entities = include_entities
         patch_state.exclude_entities = exclude_entities
         patch_state.fan_lane = fan_lane
+        patch_state.bridges = bridges or {}
+        patch_state.accessory_options = accessory_options or {}
+        lanes = {
+            fan_lane,
+            *(bridge.fan_lane for bridge in patch_state.bridges.values()),
+        }
+        for entity_id, lane in list(patch_state.failed_accessories):
+            if lane not in lanes or not _should_patch_entity(
+                entity_id, include_entities, exclude_entities
+            ):
+                del patch_state.failed_accessories[entity_id, lane]
         return
 
     original_get_accessory = homekit_accessories.get_accessory
     original_homekit_get_accessory = homekit_module.get_accessory
-    actual_params = _get_accessory_params(original_get_accessory)
+    actual_params = _probe_get_accessory_params(original_get_accessory)
     if actual_params != EXPECTED_GET_ACCESSORY_PARAMS:
         _LOGGER.warning(
             "HomeKit get_accessory signature changed to %s; leaving HomeKit untouched",
@@ -135,6 +270,8 @@ def apply_patch(
         fan_lane=fan_lane,
         original_get_accessory=original_get_accessory,
         original_homekit_get_accessory=original_homekit_get_accessory,
+        bridges=bridges or {},
+        accessory_options=accessory_options or {},
     )
 
     def patched_get_accessory(
@@ -143,32 +280,79 @@ def apply_patch(
         state: State,
         aid: int | None,
         config: dict[Any, Any],
+    ) -> homekit_accessories.HomeAccessory | None:
+        with watch(hass, "get_accessory", state.entity_id):
+            return _get_accessory(hass, driver, state, aid, config)
+
+    def _get_accessory(
+        hass: HomeAssistant,
+        driver: homekit_accessories.HomeDriver,
+        state: State,
+        aid: int | None,
+        config: dict[Any, Any],
     ) -> homekit_accessories.HomeAccessory | None:
         config = config or {}
+        fingerprint: str | None = None
+        build_state = state
+        domain_data = hass.data.get(DOMAIN, {})
+        snapshots: SnapshotStore | None = domain_data.get(DATA_SNAPSHOTS)
+        snapshot: AccessorySnapshot | None = None
+        if (
+            snapshots is not None
+            and is_placeholder_state(state)
+            and (snapshot := snapshots.get(state.entity_id)) is not None
+        ):
+            # The climate has not loaded yet; build from its last known shape.
+            build_state = snapshot.as_state(state.entity_id)
+        fan_lane: str | None = None
+        accessory: homekit_accessories.HomeAccessory | None = None
         try:
             if (
                 state.domain == "climate"
                 and aid
-                and _should_patch_entity(
+                and (fan_lane := patch_state.route(driver, state.entity_id))
+                and supports_heatercooler(build_state)
+                and not _known_failure(
+                    patch_state,
                     state.entity_id,
-                    patch_state.include_entities,
-                    patch_state.exclude_entities,
+                    fan_lane,
+                    fingerprint := capability_fingerprint(build_state),
                 )
-                and supports_heatercooler(state)
             ):
-                name = config.get(CONF_NAME, state.name)
-                hc_config = {**config, CONF_FAN_LANE: patch_state.fan_lane}
-                return _bundled_heatercooler()(
-                    hass, driver, name, state.entity_id, aid, hc_config
-                )
-        except Exception:
+                name = config.get(CONF_NAME, build_state.name)
+                hc_config = {
+                    **config,
+                    **patch_state.accessory_options,
+                    CONF_FAN_LANE: fan_lane,
+                }
+                with watch(hass, "HeaterCooler.__init__", state.entity_id):
+                    accessory = _bundled_heatercooler()(
+                        hass,
+                        driver,
+                        name,
+                        state.entity_id,
+                        aid,
+                        hc_config,
+                        snapshot=snapshot,
+                    )
+                patch_state.failed_accessories.pop((state.entity_id, fan_lane), None)
+        except Exception as err:
+            failure_key = (state.entity_id, fan_lane or patch_state.fan_lane)
+            patch_state.failed_accessories[failure_key] = FailedAccessory(
+                fingerprint=fingerprint or capability_fingerprint(build_state),
+                error=repr(err),
+            )
             _LOGGER.exception(
                 "HeaterCooler mapping failed for %s; falling back to the "
-                "default accessory",
+                "default accessory until its capabilities change",
                 state.entity_id,
             )
+            dispatcher_send(hass, SIGNAL_ACCESSORY_FAILED)
 
-        return patch_state.original_get_accessory(hass, driver, state, aid, config)
+        if accessory is None:
+            return patch_state.original_get_accessory(hass, driver, state, aid, config)
+        _track_accessory(hass, patch_state, driver, accessory, state, snapshot)
+        return accessory
 
     homekit_accessories.get_accessory = patched_get_accessory
     homekit_module.get_accessory = patched_get_accessory
@@ -176,6 +360,61 @@ def apply_patch(
     _LOGGER.debug("Installed HeaterCooler get_accessory patch")
 
 
+def _track_accessory(
+    hass: HomeAssistant,
+    patch_state: PatchState,
+    driver: homekit_accessories.HomeDriver,
+    accessory: homekit_accessories.HomeAccessory,
+    state: State,
+    snapshot: AccessorySnapshot | None,
+) -> None:
+    """Hook a built accessory up to its scheduler, snapshots and shapes.
+
+    The accessory built fine, so a failure here is logged and the accessory
+    is still served rather than counted as a build failure.
+    """
+    # Already loaded by the build; importing here keeps pyhap off setup's path.
+    from .climate_base import async_hook_subscriptions
+
+    domain_data = hass.data.get(DOMAIN, {})
+    try:
+        patch_state.accessories.add(accessory)
+        if (scheduler := patch_state.schedulers.get(driver)) is None:
+            scheduler = patch_state.schedulers[driver] = NotificationScheduler(hass)
+            async_hook_subscriptions(driver)
+        accessory.scheduler = scheduler
+        snapshots: SnapshotStore | None = domain_data.get(DATA_SNAPSHOTS)
+        if snapshots is not None:
+            snapshots.async_track(
+                accessory, snapshot or AccessorySnapshot.from_state(state)
+            )
+        shapes: ShapeTracker | None = domain_data.get(DATA_SHAPES)
+        if shapes is not None:
+            shapes.async_record(accessory)
+    except Exception:
+        _LOGGER.exception(
+            "Tracking the HeaterCooler for %s failed; serving it untracked",
+            accessory.entity_id,
+        )
+
+
+def _known_failure(
+    patch_state: PatchState, entity_id: str, fan_lane: str, fingerprint: str
+) -> bool:
+    """Return True, counting the skip, if this build is known to fail."""
+    failure = patch_state.failed_accessories.get((entity_id, fan_lane))
+    if failure is None or failure.fingerprint != fingerprint:
+        return False
+    failure.count += 1
+    _LOGGER.debug(
+        "Skipping HeaterCooler for %s, known to fail with %s (%d attempts)",
+        entity_id,
+        failure.error,
+        failure.count,
+    )
+    return True
+
+
 def remove_patch(hass: HomeAssistant) -> None:
     """Restore the original HomeKit get_accessory functions."""
     domain_data = hass.data.get(DOMAIN)
@@ -184,6 +423,8 @@ def remove_patch(hass: HomeAssistant) -> None:
     patch_state = domain_data.pop(DATA_PATCH_STATE, None)
     if patch_state is None:
         return
+    for scheduler in patch_state.schedulers.values():
+        scheduler.async_flush()
     homekit_accessories.get_accessory = patch_state.original_get_accessory
     homekit_module.get_accessory = patch_state.original_homekit_get_accessory
     _LOGGER.debug("Removed HeaterCooler get_accessory patch")
@@ -0,0 +1,452 @@
+"""Capacity planning for HomeKit bridges that carry HeaterCooler climates."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.climate import (
+    ATTR_CURRENT_HUMIDITY,
+    ATTR_FAN_MODES,
+    ATTR_HVAC_MODES,
+    ATTR_SWING_MODES,
+    HVACMode,
+)
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entityfilter import (
+    CONF_EXCLUDE_DOMAINS,
+    CONF_EXCLUDE_ENTITIES,
+    CONF_EXCLUDE_ENTITY_GLOBS,
+    CONF_INCLUDE_DOMAINS,
+    CONF_INCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITY_GLOBS,
+    FILTER_SCHEMA,
+    EntityFilter,
+)
+
+from .bridges import (
+    HOMEKIT_CONF_FILTER,
+    BridgeRoute,
+    homekit_bridge_name,
+    homekit_entity_filter,
+    homekit_entries,
+)
+from .patcher import supports_heatercooler
+
+# HomeKit's MAX_DEVICES; the bridge itself takes one of the slots.
+MAX_BRIDGE_ACCESSORIES = 150
+# Mirrors HomeKit's own option keys; older cores do not export them.
+HOMEKIT_CONF_MODE = "mode"
+HOMEKIT_MODE_BRIDGE = "bridge"
+# Mirrors HomeKit's SUPPORTED_DOMAINS, which lives in its heavy config flow.
+HOMEKIT_ACCESSORY_DOMAINS = frozenset(
+    {
+        "alarm_control_panel",
+        "automation",
+        "binary_sensor",
+        "button",
+        "camera",
+        "climate",
+        "cover",
+        "demo",
+        "device_tracker",
+        "fan",
+        "humidifier",
+        "input_boolean",
+        "input_button",
+        "input_select",
+        "lawn_mower",
+        "light",
+        "lock",
+        "media_player",
+        "person",
+        "remote",
+        "scene",
+        "script",
+        "select",
+        "sensor",
+        "switch",
+        "vacuum",
+        "valve",
+        "water_heater",
+    }
+)
+
+# Rough serialized sizes in the HAP /accessories database. Only the relative
+# load between bridges matters, so these need not be exact.
+ESTIMATED_ACCESSORY_BYTES = 40
+ESTIMATED_SERVICE_BYTES = 80
+ESTIMATED_CHARACTERISTIC_BYTES = 150
+# AccessoryInformation: Identify, Manufacturer, Model, Name, SerialNumber and
+# FirmwareRevision.
+ACCESSORY_INFORMATION_CHARACTERISTICS = 6
+# A typical single-service accessory other than a HeaterCooler.
+DEFAULT_SERVICE_CHARACTERISTICS = 3
+
+_INCLUDE_KEYS = (CONF_INCLUDE_DOMAINS, CONF_INCLUDE_ENTITY_GLOBS, CONF_INCLUDE_ENTITIES)
+_EXCLUDE_KEYS = (CONF_EXCLUDE_DOMAINS, CONF_EXCLUDE_ENTITY_GLOBS, CONF_EXCLUDE_ENTITIES)
+
+
+@dataclass(frozen=True)
+class BridgeLoad:
+    """The accessory load one HomeKit bridge carries."""
+
+    entry_id: str
+    name: str
+    accessories: int
+    estimated_bytes: int
+    heatercoolers: tuple[str, ...]
+
+    @property
+    def over_capacity(self) -> bool:
+        """Return True when the bridge exceeds the HAP accessory limit."""
+        return self.accessories > MAX_BRIDGE_ACCESSORIES
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the load for diagnostics and service responses."""
+        return {
+            "name": self.name,
+            "accessories": self.accessories,
+            "estimated_bytes": self.estimated_bytes,
+            "heatercoolers": list(self.heatercoolers),
+            "heatercoolers_count": len(self.heatercoolers),
+            "over_capacity": self.over_capacity,
+        }
+
+
+@dataclass(frozen=True)
+class BridgePlan:
+    """Current bridge loads and a proposed HeaterCooler assignment."""
+
+    current: dict[str, BridgeLoad]
+    proposed: dict[str, BridgeLoad]
+    moves: dict[str, tuple[str, str]]
+    pinned: tuple[str, ...]
+    unplaced: tuple[str, ...]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the plan for diagnostics and service responses."""
+        return {
+            "max_accessories": MAX_BRIDGE_ACCESSORIES,
+            "current": {
+                entry_id: load.as_dict() for entry_id, load in self.current.items()
+            },
+            "proposed": {
+                entry_id: load.as_dict() for entry_id, load in self.proposed.items()
+            },
+            "moves": {
+                entity_id: {"from": source, "to": target}
+                for entity_id, (source, target) in sorted(self.moves.items())
+            },
+            "pinned": list(self.pinned),
+            "unplaced": list(self.unplaced),
+        }
+
+
+def estimate_accessory_bytes(services: int, characteristics: int) -> int:
+    """Estimate an accessory's size in the HAP accessory database."""
+    return (
+        ESTIMATED_ACCESSORY_BYTES
+        + (services + 1) * ESTIMATED_SERVICE_BYTES
+        + (characteristics + ACCESSORY_INFORMATION_CHARACTERISTICS)
+        * ESTIMATED_CHARACTERISTIC_BYTES
+    )
+
+
+def estimate_heatercooler_bytes(state: State) -> int:
+    """Estimate a HeaterCooler accessory's size from its climate's capabilities."""
+    attributes = state.attributes
+    hvac_modes = attributes.get(ATTR_HVAC_MODES) or ()
+    # Active, both HeaterCooler states and CurrentTemperature.
+    characteristics = 4
+    characteristics += (
+        sum(mode in hvac_modes for mode in (HVACMode.COOL, HVACMode.HEAT)) or 1
+    )
+    characteristics += bool(attributes.get(ATTR_FAN_MODES))
+    characteristics += bool(attributes.get(ATTR_SWING_MODES))
+    services = 1
+    if attributes.get(ATTR_CURRENT_HUMIDITY) is not None:
+        # A linked humidity sensor with Name and CurrentRelativeHumidity.
+        services += 1
+        characteristics += 2
+    return estimate_accessory_bytes(services, characteristics)
+
+
+def homekit_bridge_entries(hass: HomeAssistant) -> list[ConfigEntry]:
+    """Return HomeKit entries running in bridge mode."""
+    return [
+        entry
+        for entry in homekit_entries(hass)
+        if (entry.options if HOMEKIT_CONF_MODE in entry.options else entry.data).get(
+            HOMEKIT_CONF_MODE, HOMEKIT_MODE_BRIDGE
+        )
+        == HOMEKIT_MODE_BRIDGE
+    ]
+
+
+def build_bridge_plan(
+    hass: HomeAssistant, bridges: Mapping[str, BridgeRoute]
+) -> BridgePlan:
+    """Measure every bridge and propose a balanced HeaterCooler assignment.
+
+    Each bridge's load is what its HomeKit filter admits today. Routed
+    climates are then spread, largest first, to the bridge with the smallest
+    estimated database that still has a free slot, preferring the bridge a
+    climate already sits on. Climates routed on several bridges are shared on
+    purpose and stay where they are.
+    """
+    entries = homekit_bridge_entries(hass)
+    filters = {entry.entry_id: homekit_entity_filter(entry) for entry in entries}
+    names = {entry.entry_id: homekit_bridge_name(entry) for entry in entries}
+    members = _bridge_members(hass, filters)
+
+    climate_bridges: dict[str, list[str]] = {}
+    climate_bytes: dict[str, int] = {}
+    for entry_id in filters:
+        route = bridges.get(entry_id)
+        for entity_id in sorted(route.entities & members[entry_id]) if route else ():
+            state = hass.states.get(entity_id)
+            if state is None or not supports_heatercooler(state):
+                continue
+            climate_bridges.setdefault(entity_id, []).append(entry_id)
+            climate_bytes[entity_id] = estimate_heatercooler_bytes(state)
+    pinned = {
+        entity_id for entity_id, hosts in climate_bridges.items() if len(hosts) > 1
+    }
+
+    def _load(entry_id: str, heatercoolers: set[str], fixed: set[str]) -> BridgeLoad:
+        entities = fixed | heatercoolers
+        return BridgeLoad(
+            entry_id=entry_id,
+            name=names[entry_id],
+            accessories=len(entities) + 1,
+            estimated_bytes=estimate_accessory_bytes(0, 0)
+            + sum(
+                climate_bytes.get(entity_id) or _default_bytes()
+                for entity_id in entities
+            ),
+            heatercoolers=tuple(
+                sorted(
+                    entity_id for entity_id in entities if entity_id in climate_bytes
+                )
+            ),
+        )
+
+    fixed = {
+        entry_id: members[entry_id]
+        - {entity_id for entity_id in climate_bytes if entity_id not in pinned}
+        for entry_id in filters
+    }
+    current = {
+        entry_id: _load(entry_id, set(), members[entry_id]) for entry_id in filters
+    }
+
+    assigned: dict[str, set[str]] = {entry_id: set() for entry_id in filters}
+    counts = {entry_id: len(fixed[entry_id]) + 1 for entry_id in filters}
+    sizes = {
+        entry_id: sum(
+            climate_bytes.get(entity_id) or _default_bytes()
+            for entity_id in fixed[entry_id]
+        )
+        for entry_id in filters
+    }
+    moves: dict[str, tuple[str, str]] = {}
+    unplaced: list[str] = []
+    movable = sorted(
+        (entity_id for entity_id in climate_bytes if entity_id not in pinned),
+        key=lambda entity_id: (-climate_bytes[entity_id], entity_id),
+    )
+    for entity_id in movable:
+        source = climate_bridges[entity_id][0]
+        candidates = [
+            entry_id
+            for entry_id in filters
+            if counts[entry_id] < MAX_BRIDGE_ACCESSORIES
+        ]
+        if not candidates:
+            unplaced.append(entity_id)
+            continue
+        # Staying put counts as one climate lighter, so a climate only moves
+        # when that actually narrows the gap between bridges.
+        target = min(
+            candidates,
+            key=lambda entry_id: (
+                sizes[entry_id]
+                - (climate_bytes[entity_id] if entry_id == source else 0),
+                entry_id,
+            ),
+        )
+        assigned[target].add(entity_id)
+        counts[target] += 1
+        sizes[target] += climate_bytes[entity_id]
+        if target != source:
+            moves[entity_id] = (source, target)
+
+    proposed = {
+        entry_id: _load(entry_id, assigned[entry_id], fixed[entry_id])
+        for entry_id in filters
+    }
+    return BridgePlan(
+        current=current,
+        proposed=proposed,
+        moves=moves,
+        pinned=tuple(sorted(pinned)),
+        unplaced=tuple(unplaced),
+    )
+
+
+def apply_bridge_plan(hass: HomeAssistant, plan: BridgePlan) -> dict[str, list[str]]:
+    """Rewrite HomeKit entity filters so each move lands on its proposed bridge.
+
+    A move is only written when the edited filters change exactly that one
+    climate, so a bridge whose filter would otherwise flip from excluding to
+    including by default is left for the user to edit. Bridges imported from
+    YAML are rewritten from it on every restart, so moves to or from them are
+    reported as managed by YAML instead. Returns the applied and skipped moves.
+    """
+    entries = {entry.entry_id: entry for entry in homekit_bridge_entries(hass)}
+    yaml_managed = {
+        entry_id for entry_id, entry in entries.items() if entry.source == SOURCE_IMPORT
+    }
+    filter_configs = {
+        entry_id: _filter_config(entry) for entry_id, entry in entries.items()
+    }
+    filters = {
+        entry_id: _compile(config) for entry_id, config in filter_configs.items()
+    }
+    entity_ids = [state.entity_id for state in hass.states.async_all()]
+    applied: list[str] = []
+    skipped: list[str] = []
+    managed_by_yaml: list[str] = []
+    for entity_id, (source, target) in sorted(plan.moves.items()):
+        if source not in entries or target not in entries:
+            skipped.append(entity_id)
+            continue
+        if {source, target} & yaml_managed:
+            managed_by_yaml.append(entity_id)
+            continue
+        edits = {
+            source: _move_out(filter_configs[source], entity_id),
+            target: _move_in(filter_configs[target], entity_id),
+        }
+        edited = {entry_id: _compile(edit) for entry_id, edit in edits.items()}
+        if all(
+            _only_changes(filters[entry_id], edited[entry_id], entity_id, entity_ids)
+            for entry_id in edits
+        ):
+            filter_configs.update(edits)
+            filters.update(edited)
+            applied.append(entity_id)
+        else:
+            skipped.append(entity_id)
+
+    for entry_id, entry in entries.items():
+        if filter_configs[entry_id] != _filter_config(entry):
+            hass.config_entries.async_update_entry(
+                entry,
+                options={
+                    **entry.options,
+                    HOMEKIT_CONF_FILTER: filter_configs[entry_id],
+                },
+            )
+    return {
+        "applied": applied,
+        "skipped": skipped,
+        "managed_by_yaml": managed_by_yaml,
+    }
+
+
+def _bridge_members(
+    hass: HomeAssistant, filters: Mapping[str, EntityFilter]
+) -> dict[str, set[str]]:
+    """Return the entities each bridge's HomeKit filter turns into accessories."""
+    ent_reg = er.async_get(hass)
+    members: dict[str, set[str]] = {entry_id: set() for entry_id in filters}
+    for state in hass.states.async_all():
+        entity_id = state.entity_id
+        if state.domain not in HOMEKIT_ACCESSORY_DOMAINS:
+            continue
+        entry = ent_reg.async_get(entity_id)
+        # HomeKit skips config, diagnostic and hidden entities unless named.
+        auxiliary = entry is not None and (
+            entry.entity_category is not None or entry.hidden_by is not None
+        )
+        for entry_id, entity_filter in filters.items():
+            if entity_filter(entity_id) and (
+                not auxiliary or entity_filter.explicitly_included(entity_id)
+            ):
+                members[entry_id].add(entity_id)
+    return members
+
+
+def _default_bytes() -> int:
+    """Estimate the size of an accessory that is not a HeaterCooler."""
+    return estimate_accessory_bytes(1, DEFAULT_SERVICE_CHARACTERISTICS)
+
+
+def _filter_config(entry: ConfigEntry) -> dict[str, list[str]]:
+    """Return a copy of a HomeKit entry's raw filter options."""
+    raw = entry.options.get(HOMEKIT_CONF_FILTER) or {}
+    return {key: list(value) for key, value in raw.items()}
+
+
+def _move_out(config: dict[str, list[str]], entity_id: str) -> dict[str, list[str]]:
+    """Return a filter config that no longer admits an entity."""
+    edited = {key: list(value) for key, value in config.items()}
+    if entity_id in edited.get(CONF_INCLUDE_ENTITIES, ()):
+        edited[CONF_INCLUDE_ENTITIES].remove(entity_id)
+    if _compile(edited)(entity_id):
+        edited.setdefault(CONF_EXCLUDE_ENTITIES, []).append(entity_id)
+    return edited
+
+
+def _move_in(config: dict[str, list[str]], entity_id: str) -> dict[str, list[str]]:
+    """Return a filter config that admits an entity."""
+    edited = {key: list(value) for key, value in config.items()}
+    if entity_id in edited.get(CONF_EXCLUDE_ENTITIES, ()):
+        edited[CONF_EXCLUDE_ENTITIES].remove(entity_id)
+    if not _compile(edited)(entity_id):
+        edited.setdefault(CONF_INCLUDE_ENTITIES, []).append(entity_id)
+    return edited
+
+
+def _only_changes(
+    before: EntityFilter,
+    after: EntityFilter,
+    entity_id: str,
+    entity_ids: list[str],
+) -> bool:
+    """Return True when two filters differ only for one entity.
+
+    The edits only list or unlist the moved entity, so any other entity can
+    change only when the filter switches between including everything, only
+    what it lists, or all but what it excludes. Only then are they compared.
+    """
+    if _filter_mode(before) == _filter_mode(after):
+        return True
+    return all(
+        before(other) == after(other) for other in entity_ids if other != entity_id
+    )
+
+
+def _filter_mode(entity_filter: EntityFilter) -> tuple[bool, bool]:
+    """Return whether a filter has any include rules and any exclude rules."""
+    config = entity_filter.config
+    return (
+        any(config[key] for key in _INCLUDE_KEYS),
+        any(config[key] for key in _EXCLUDE_KEYS),
+    )
+
+
+def _compile(config: dict[str, list[str]]) -> EntityFilter:
+    """Compile a raw HomeKit filter config."""
+    try:
+        entity_filter: EntityFilter = FILTER_SCHEMA(config)
+    except vol.Invalid:
+        entity_filter = FILTER_SCHEMA({})
+    return entity_filter
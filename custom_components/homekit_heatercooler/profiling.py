@@ -0,0 +1,111 @@
+"""On-demand profiling of the integration's hot paths."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import io
+import logging
+from pathlib import Path
+import pstats
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only functions defined in these modules are kept in the profile.
+PROFILED_MODULES = (
+    "__init__",
+    "patcher",
+    "type_heatercooler",
+    "climate_base",
+    "climate_util",
+)
+SUMMARY_LINES = 40
+
+_PROFILED_FILES = frozenset(
+    str(Path(__file__).with_name(f"{module}.py")) for module in PROFILED_MODULES
+)
+
+
+class RestrictedStats(pstats.Stats):
+    """Profile statistics limited to the profiled modules."""
+
+    # pstats sets these without declaring them.
+    stats: dict[tuple[str, int, str], tuple[Any, ...]]
+    total_calls: int
+    prim_calls: int
+    max_name_len: int
+    total_tt: float
+    top_level: set[tuple[str, int, str]]
+    fcn_list: list[tuple[str, int, str]] | None
+
+    def restrict(self) -> None:
+        """Drop every function outside the profiled modules."""
+        self.stats = {
+            func: timing
+            for func, timing in self.stats.items()
+            if func[0] in _PROFILED_FILES
+        }
+        # Recount the totals the summary header reports from what is left.
+        self.total_calls = self.prim_calls = self.max_name_len = 0
+        self.total_tt = 0.0
+        self.top_level = set()
+        self.fcn_list = None
+        self.get_top_level_stats()
+
+
+def write_profile(profiler: cProfile.Profile, base: Path) -> dict[str, Any]:
+    """Write the restricted profile and its text summary next to each other."""
+    summary = io.StringIO()
+    stats = RestrictedStats(profiler, stream=summary)
+    stats.restrict()
+    stats_path = base.with_suffix(".pstats")
+    summary_path = base.with_suffix(".txt")
+    stats.dump_stats(stats_path)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_LINES)
+    summary_path.write_text(summary.getvalue(), encoding="utf-8")
+    return {
+        "pstats": str(stats_path),
+        "summary": str(summary_path),
+        "functions": len(stats.stats),
+        "calls": stats.total_calls,
+    }
+
+
+async def async_profile(
+    hass: HomeAssistant, lock: asyncio.Lock, seconds: float
+) -> dict[str, Any]:
+    """Profile the event loop for a while and write the integration's share.
+
+    cProfile traces the thread it is enabled on, which is the event loop that
+    runs every accessory update and write, so other threads are not slowed.
+    """
+    if lock.locked():
+        raise HomeAssistantError("A profile is already running")
+    async with lock:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as err:
+            raise HomeAssistantError(f"Could not start profiling: {err}") from err
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+        base = Path(hass.config.path(f"{DOMAIN}_profile_{int(time.time())}"))
+        result: dict[str, Any] = await hass.async_add_executor_job(
+            write_profile, profiler, base
+        )
+    _LOGGER.info(
+        "Wrote a %s second profile to %s and %s",
+        seconds,
+        result["pstats"],
+        result["summary"],
+    )
+    return result
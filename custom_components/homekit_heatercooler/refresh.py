@@ -0,0 +1,110 @@
+"""Expedited polls of climate entities after HomeKit writes."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import logging
+from time import monotonic
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import DATA_INSTANCES
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+HOMEASSISTANT_DOMAIN = "homeassistant"
+SERVICE_UPDATE_ENTITY = "update_entity"
+# Give the device a moment to apply the write before it is polled.
+REFRESH_DELAY = 2.0
+# At most one expedited poll per integration in this many seconds.
+REFRESH_INTERVAL = 10.0
+
+
+class PollRefresher:
+    """Request early polls of written entities, rate limited per integration.
+
+    Polling integrations only report a write on their next scan, often 30 or
+    60 seconds later. Requests for one integration are coalesced into a single
+    homeassistant.update_entity call, and calls are spaced by the interval so
+    a burst of HomeKit writes cannot hammer a cloud API.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        delay: float = REFRESH_DELAY,
+        interval: float = REFRESH_INTERVAL,
+    ) -> None:
+        """Initialize the refresher."""
+        self._hass = hass
+        self._delay = delay
+        self._interval = interval
+        self._pending: defaultdict[str, set[str]] = defaultdict(set)
+        self._timers: dict[str, CALLBACK_TYPE] = {}
+        self._last_refresh: dict[str, float] = {}
+        self.requested = 0
+        self.refreshed = 0
+
+    @callback
+    def async_request(self, entity_id: str) -> bool:
+        """Schedule an early poll of an entity, if its integration polls."""
+        if (platform := self._polling_platform(entity_id)) is None:
+            return False
+        self.requested += 1
+        self._pending[platform].add(entity_id)
+        if platform not in self._timers:
+            next_allowed = self._last_refresh.get(platform, 0.0) + self._interval
+            delay = max(self._delay, next_allowed - monotonic())
+            self._timers[platform] = async_call_later(
+                self._hass, delay, lambda _now: self._async_refresh(platform)
+            )
+        return True
+
+    @callback
+    def _async_refresh(self, platform: str) -> None:
+        """Poll the pending entities of one integration."""
+        self._timers.pop(platform, None)
+        if not (entity_ids := self._pending.pop(platform, set())):
+            return
+        self._last_refresh[platform] = monotonic()
+        self.refreshed += 1
+        _LOGGER.debug("Requesting early poll of %s", sorted(entity_ids))
+        self._hass.async_create_task(
+            self._async_update_entities(sorted(entity_ids)), eager_start=True
+        )
+
+    async def _async_update_entities(self, entity_ids: list[str]) -> None:
+        """Poll entities, logging rather than raising if the poll fails."""
+        try:
+            await self._hass.services.async_call(
+                HOMEASSISTANT_DOMAIN,
+                SERVICE_UPDATE_ENTITY,
+                {ATTR_ENTITY_ID: entity_ids},
+            )
+        except HomeAssistantError as err:
+            _LOGGER.warning("Early poll of %s failed: %s", entity_ids, err)
+
+    def _polling_platform(self, entity_id: str) -> str | None:
+        """Return the integration of an entity that polls, otherwise None.
+
+        Entities of a data update coordinator do not poll on their own, but an
+        update_entity call refreshes their coordinator, so they count too.
+        """
+        component = self._hass.data.get(DATA_INSTANCES, {}).get(
+            entity_id.partition(".")[0]
+        )
+        if component is None or (entity := component.get_entity(entity_id)) is None:
+            return None
+        if not entity.should_poll and not isinstance(entity, CoordinatorEntity):
+            return None
+        # Entities without a registry entry are rate limited on their own.
+        entry = er.async_get(self._hass).async_get(entity_id)
+        return entry.platform if entry is not None else entity_id
+
+    def as_dict(self) -> dict[str, int]:
+        """Return refresh counters for diagnostics."""
+        return {"requested": self.requested, "refreshed": self.refreshed}
@@ -0,0 +1,117 @@
+"""Bounded, rate-limited log records of routing refreshes."""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Set
+import logging
+from time import monotonic
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# At most one routing summary is logged at INFO in this many seconds.
+ROUTING_LOG_INTERVAL = 60.0
+# Entity IDs named per side of a routing diff; the rest are counted.
+ROUTING_LOG_SAMPLE = 5
+
+
+def _sample(entity_ids: Set[str]) -> str:
+    """Return a few entity IDs of a set, and how many more there are."""
+    named = sorted(entity_ids)[:ROUTING_LOG_SAMPLE]
+    more = len(entity_ids) - len(named)
+    return ", ".join(named) + (f" (+{more} more)" if more else "")
+
+
+class RoutingLog:
+    """Summarize routing refreshes as counts and a diff, not full entity lists.
+
+    Each refresh is logged in full at DEBUG. At INFO, the first refresh and
+    every later change of the patched entities is summarized against the last
+    summary; changes within the interval are folded into one summary at its
+    end, so startup and reload bursts log one line instead of one per refresh.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, interval: float = ROUTING_LOG_INTERVAL
+    ) -> None:
+        """Initialize without a logged routing."""
+        self._hass = hass
+        self._interval = interval
+        self._logged: frozenset[str] | None = None
+        self._logged_mode: str | None = None
+        self._last_logged = float("-inf")
+        self._timer: CALLBACK_TYPE | None = None
+        self._current: tuple[str, int, int, frozenset[str]] | None = None
+        self._refreshes = 0
+
+    @callback
+    def async_record(
+        self,
+        mode: str,
+        include_entities: Collection[str],
+        exclude_entities: Collection[str],
+        patched_entities: Collection[str],
+    ) -> None:
+        """Record a refresh, logging a summary now or at the interval's end."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "HomeKit HeaterCooler routing refreshed (mode=%s, include_entities=%s, "
+                "exclude_entities=%s, patched_entities=%s)",
+                mode,
+                sorted(include_entities),
+                sorted(exclude_entities),
+                sorted(patched_entities),
+            )
+        self._current = (
+            mode,
+            len(include_entities),
+            len(exclude_entities),
+            frozenset(patched_entities),
+        )
+        self._refreshes += 1
+        if not self._changed() or self._timer is not None:
+            return
+        if (wait := self._last_logged + self._interval - monotonic()) > 0:
+            self._timer = async_call_later(self._hass, wait, self._async_flush)
+            return
+        self._log_summary()
+
+    @callback
+    def _async_flush(self, _now: object) -> None:
+        """Log the changes folded during the interval."""
+        self._timer = None
+        if self._changed():
+            self._log_summary()
+
+    def _changed(self) -> bool:
+        """Return True if the routing moved since the last summary."""
+        return self._current is not None and (
+            self._current[0] != self._logged_mode or self._current[3] != self._logged
+        )
+
+    def _log_summary(self) -> None:
+        """Log the current routing as counts and a diff against the last summary."""
+        if self._current is None:
+            return
+        mode, include_count, exclude_count, patched = self._current
+        previous = self._logged or frozenset()
+        added, removed = patched - previous, previous - patched
+        _LOGGER.info(
+            "HomeKit HeaterCooler routing %s (mode=%s, include=%d, exclude=%d, "
+            "patched=%d, added=%d, removed=%d, refreshes=%d)%s%s",
+            "loaded" if self._logged is None else "changed",
+            mode,
+            include_count,
+            exclude_count,
+            len(patched),
+            len(added),
+            len(removed),
+            self._refreshes,
+            f"; added: {_sample(added)}" if added and self._logged is not None else "",
+            f"; removed: {_sample(removed)}" if removed else "",
+        )
+        self._logged, self._logged_mode = patched, mode
+        self._last_logged = monotonic()
+        self._refreshes = 0
@@ -0,0 +1,292 @@
+"""Rule-based climate selection backed by registry indexes."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+import fnmatch
+from typing import Any, NamedTuple
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entityfilter import (
+    CONF_EXCLUDE_ENTITIES,
+    CONF_EXCLUDE_ENTITY_GLOBS,
+    CONF_INCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITY_GLOBS,
+)
+
+from .const import (
+    CONF_EXCLUDE_AREAS,
+    CONF_EXCLUDE_DEVICES,
+    CONF_EXCLUDE_INTEGRATIONS,
+    CONF_EXCLUDE_LABELS,
+    CONF_INCLUDE_AREAS,
+    CONF_INCLUDE_DEVICES,
+    CONF_INCLUDE_INTEGRATIONS,
+    CONF_INCLUDE_LABELS,
+)
+
+CLIMATE_DOMAIN = "climate"
+
+INCLUDE_RULE_KEYS = (
+    CONF_INCLUDE_ENTITIES,
+    CONF_INCLUDE_AREAS,
+    CONF_INCLUDE_DEVICES,
+    CONF_INCLUDE_LABELS,
+    CONF_INCLUDE_INTEGRATIONS,
+    CONF_INCLUDE_ENTITY_GLOBS,
+)
+EXCLUDE_RULE_KEYS = (
+    CONF_EXCLUDE_ENTITIES,
+    CONF_EXCLUDE_AREAS,
+    CONF_EXCLUDE_DEVICES,
+    CONF_EXCLUDE_LABELS,
+    CONF_EXCLUDE_INTEGRATIONS,
+    CONF_EXCLUDE_ENTITY_GLOBS,
+)
+RULE_KEYS = INCLUDE_RULE_KEYS + EXCLUDE_RULE_KEYS
+
+
+def _string_set(value: Any) -> frozenset[str]:
+    """Normalize a config value to a set of strings."""
+    if not isinstance(value, (list, set, tuple, frozenset)):
+        return frozenset()
+    return frozenset(item for item in value if isinstance(item, str))
+
+
+@dataclass(frozen=True)
+class SelectionRules:
+    """One side, include or exclude, of the configured selection."""
+
+    entities: frozenset[str] = frozenset()
+    areas: frozenset[str] = frozenset()
+    devices: frozenset[str] = frozenset()
+    labels: frozenset[str] = frozenset()
+    integrations: frozenset[str] = frozenset()
+    entity_globs: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_config(
+        cls, config: Mapping[str, Any], keys: tuple[str, ...]
+    ) -> SelectionRules:
+        """Read rules from a config mapping using include or exclude keys."""
+        entities, areas, devices, labels, integrations, globs = (
+            _string_set(config.get(key)) for key in keys
+        )
+        return cls(entities, areas, devices, labels, integrations, globs)
+
+    def merge(self, other: SelectionRules) -> SelectionRules:
+        """Return the union of two rule sets."""
+        return SelectionRules(
+            self.entities | other.entities,
+            self.areas | other.areas,
+            self.devices | other.devices,
+            self.labels | other.labels,
+            self.integrations | other.integrations,
+            self.entity_globs | other.entity_globs,
+        )
+
+    @property
+    def has_indexed_rules(self) -> bool:
+        """Return True when anything beyond explicit entity IDs is selected."""
+        return bool(
+            self.areas
+            or self.devices
+            or self.labels
+            or self.integrations
+            or self.entity_globs
+        )
+
+    def as_dict(self) -> dict[str, list[str]]:
+        """Return the non-empty rules, sorted, for diagnostics."""
+        return {
+            name: sorted(values)
+            for name, values in (
+                ("entities", self.entities),
+                ("areas", self.areas),
+                ("devices", self.devices),
+                ("labels", self.labels),
+                ("integrations", self.integrations),
+                ("entity_globs", self.entity_globs),
+            )
+            if values
+        }
+
+
+class _IndexedEntity(NamedTuple):
+    """The registry facts a climate entity is selectable by."""
+
+    area_id: str | None
+    device_id: str | None
+    labels: frozenset[str]
+    platform: str
+
+
+class RuleIndex:
+    """Climate entities indexed by area, device, label and integration.
+
+    Built once from the registries and then kept current from their update
+    events, so resolving rules never walks the registries. Only registered
+    climates are indexed; entities without a unique ID can still be listed
+    explicitly.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty index."""
+        self._hass = hass
+        self._entities: dict[str, _IndexedEntity] = {}
+        self._by_area: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_device: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_label: defaultdict[str, set[str]] = defaultdict(set)
+        self._by_integration: defaultdict[str, set[str]] = defaultdict(set)
+        self._glob_matches: dict[str, set[str]] = {}
+
+    @callback
+    def async_start(self, on_change: Callable[[], None]) -> CALLBACK_TYPE:
+        """Index the registries and follow their updates."""
+        ent_reg = er.async_get(self._hass)
+        for entry in ent_reg.entities.values():
+            if entry.domain == CLIMATE_DOMAIN:
+                self._async_index(entry)
+
+        @callback
+        def _handle_entity_update(
+            event: Event[er.EventEntityRegistryUpdatedData],
+        ) -> None:
+            data = event.data
+            if data["action"] == "update" and "old_entity_id" in data:
+                self._async_drop(data["old_entity_id"])
+            self._async_reindex(data["entity_id"])
+            on_change()
+
+        @callback
+        def _handle_device_update(
+            event: Event[dr.EventDeviceRegistryUpdatedData],
+        ) -> None:
+            device_id = event.data["device_id"]
+            entity_ids = set(self._by_device.get(device_id, ()))
+            entity_ids.update(
+                entry.entity_id
+                for entry in er.async_get(
+                    self._hass
+                ).entities.get_entries_for_device_id(
+                    device_id, include_disabled_entities=True
+                )
+                if entry.domain == CLIMATE_DOMAIN
+            )
+            if not entity_ids:
+                return
+            for entity_id in entity_ids:
+                self._async_reindex(entity_id)
+            on_change()
+
+        unsubscribers = (
+            self._hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                _handle_entity_update,
+                event_filter=_is_climate_registry_event,
+            ),
+            self._hass.bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, _handle_device_update
+            ),
+        )
+
+        @callback
+        def _unsubscribe() -> None:
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+
+        return _unsubscribe
+
+    def resolve(self, rules: SelectionRules) -> set[str]:
+        """Return the entity IDs selected by a rule set."""
+        resolved = set(rules.entities)
+        for values, index in (
+            (rules.areas, self._by_area),
+            (rules.devices, self._by_device),
+            (rules.labels, self._by_label),
+            (rules.integrations, self._by_integration),
+        ):
+            for value in values:
+                resolved.update(index.get(value, ()))
+        for glob in rules.entity_globs:
+            resolved.update(self._glob(glob))
+        return resolved
+
+    def _glob(self, glob: str) -> set[str]:
+        """Return, and cache, the indexed entities a glob matches."""
+        if (matches := self._glob_matches.get(glob)) is None:
+            matches = {
+                entity_id
+                for entity_id in self._entities
+                if fnmatch.fnmatchcase(entity_id, glob)
+            }
+            self._glob_matches[glob] = matches
+        return matches
+
+    @callback
+    def _async_reindex(self, entity_id: str) -> None:
+        """Replace an entity's index entries with its current registry facts."""
+        self._async_drop(entity_id)
+        if (entry := er.async_get(self._hass).async_get(entity_id)) is not None:
+            self._async_index(entry)
+
+    @callback
+    def _async_index(self, entry: er.RegistryEntry) -> None:
+        """Add a registry entry to every index."""
+        device = (
+            dr.async_get(self._hass).async_get(entry.device_id)
+            if entry.device_id
+            else None
+        )
+        labels = set(entry.labels)
+        if device is not None:
+            labels.update(device.labels)
+        indexed = _IndexedEntity(
+            area_id=entry.area_id or (device.area_id if device else None),
+            device_id=entry.device_id,
+            labels=frozenset(labels),
+            platform=entry.platform,
+        )
+        entity_id = entry.entity_id
+        self._entities[entity_id] = indexed
+        for index, keys in self._index_keys(indexed):
+            for key in keys:
+                index[key].add(entity_id)
+        for glob, matches in self._glob_matches.items():
+            if fnmatch.fnmatchcase(entity_id, glob):
+                matches.add(entity_id)
+
+    @callback
+    def _async_drop(self, entity_id: str) -> None:
+        """Remove an entity from every index."""
+        if (indexed := self._entities.pop(entity_id, None)) is None:
+            return
+        for index, keys in self._index_keys(indexed):
+            for key in keys:
+                if (members := index.get(key)) is not None:
+                    members.discard(entity_id)
+                    if not members:
+                        del index[key]
+        for matches in self._glob_matches.values():
+            matches.discard(entity_id)
+
+    def _index_keys(
+        self, indexed: _IndexedEntity
+    ) -> Iterable[tuple[defaultdict[str, set[str]], Iterable[str]]]:
+        """Pair each index with the keys an entity is filed under."""
+        yield self._by_area, (indexed.area_id,) if indexed.area_id else ()
+        yield self._by_device, (indexed.device_id,) if indexed.device_id else ()
+        yield self._by_label, indexed.labels
+        yield self._by_integration, (indexed.platform,)
+
+
+@callback
+def _is_climate_registry_event(data: Mapping[str, Any]) -> bool:
+    """Return True for entity registry events about a climate entity."""
+    return any(
+        isinstance(entity_id, str) and entity_id.startswith(f"{CLIMATE_DOMAIN}.")
+        for entity_id in (data.get("entity_id"), data.get("old_entity_id"))
+    )
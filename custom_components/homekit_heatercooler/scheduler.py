@@ -0,0 +1,103 @@
+"""Bridge-level pacing of HeaterCooler characteristic updates."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+import math
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    from .climate_base import HomeKitClimateAccessory
+
+# More updates than this within the burst window start a paced burst.
+BURST_THRESHOLD = 10
+BURST_WINDOW = 0.5
+# A burst is spread over at most this many seconds, in ticks of this length.
+SPREAD_WINDOW = 2.0
+SPREAD_TICK = 0.1
+
+
+class NotificationScheduler:
+    """Spread a burst of accessory updates on one bridge over a bounded window.
+
+    Below the burst threshold, updates apply at once. During a burst, such as
+    a vendor cloud bringing 50 climates back in the same second, accessories
+    keep only their newest state and are applied a slice per tick, so the
+    whole burst reaches controllers within the spread window instead of in a
+    single event flood. Accessories with a write in flight are never queued.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an idle scheduler."""
+        self._hass = hass
+        self._recent: deque[float] = deque()
+        self._queue: dict[HomeKitClimateAccessory, None] = {}
+        self._deadline = 0.0
+        self._timer: CALLBACK_TYPE | None = None
+        self.bursts = 0
+        self.paced = 0
+        self.merged = 0
+        self.max_queue = 0
+
+    @callback
+    def async_should_queue(self, accessory: HomeKitClimateAccessory) -> bool:
+        """Return True if the accessory's update is paced rather than applied now.
+
+        A queued accessory keeps its newest state deferred until its turn.
+        """
+        if accessory in self._queue:
+            self.merged += 1
+            return True
+        now = monotonic()
+        recent = self._recent
+        recent.append(now)
+        while recent and recent[0] < now - BURST_WINDOW:
+            recent.popleft()
+        if not self._queue and len(recent) <= BURST_THRESHOLD:
+            return False
+        if not self._queue:
+            self.bursts += 1
+            self._deadline = now + SPREAD_WINDOW
+        self._queue[accessory] = None
+        self.paced += 1
+        self.max_queue = max(self.max_queue, len(self._queue))
+        if self._timer is None:
+            self._timer = async_call_later(self._hass, SPREAD_TICK, self._async_tick)
+        return True
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Apply the next slice of queued accessories."""
+        self._timer = None
+        ticks_left = max(1, int((self._deadline - monotonic()) / SPREAD_TICK))
+        count = math.ceil(len(self._queue) / ticks_left)
+        for accessory in list(self._queue)[:count]:
+            del self._queue[accessory]
+            accessory.async_sync_deferred()
+        if self._queue:
+            self._timer = async_call_later(self._hass, SPREAD_TICK, self._async_tick)
+
+    @callback
+    def async_flush(self) -> None:
+        """Apply everything still queued at once."""
+        if self._timer is not None:
+            self._timer()
+            self._timer = None
+        queue, self._queue = self._queue, {}
+        for accessory in queue:
+            accessory.async_sync_deferred()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return pacing counters for diagnostics."""
+        return {
+            "queued": len(self._queue),
+            "bursts": self.bursts,
+            "paced": self.paced,
+            "merged": self.merged,
+            "max_queue": self.max_queue,
+        }
@@ -4,15 +4,35 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import DATA_PATCH_STATUS, DOMAIN, SIGNAL_PATCH_STATUS_UPDATED
+from .const import (
+    DATA_FLEET,
+    DATA_PATCH_STATUS,
+    DATA_WATCHDOG,
+    DOMAIN,
+    SIGNAL_FLEET_UPDATED,
+    SIGNAL_LOOP_LAG_UPDATED,
+    SIGNAL_PATCH_STATUS_UPDATED,
+)
+from .fleet import FLEET_ACTIONS, FleetActions
+from .watchdog import Watchdog
+
+# Status keys the patched-entities sensor carries in a shorter form or not at
+# all; native_value already holds the count.
+_SUMMARIZED_STATUS_KEYS = frozenset(
+    {"patched_entities_count", "bridges", "failed_entities"}
+)
 
 
 async def async_setup_entry(
@@ -21,7 +41,24 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up diagnostic entities for a config entry."""
-    async_add_entities([HomeKitHeaterCoolerPatchedEntitiesSensor(entry)])
+    entities: list[SensorEntity] = [
+        HomeKitHeaterCoolerPatchedEntitiesSensor(entry),
+        *(HomeKitHeaterCoolerFleetSensor(entry, action) for action in FLEET_ACTIONS),
+    ]
+    if (watchdog := hass.data.get(DOMAIN, {}).get(DATA_WATCHDOG)) is not None:
+        entities.append(HomeKitHeaterCoolerLoopLagSensor(entry, watchdog))
+    async_add_entities(entities)
+
+
+def _device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return integration device metadata for UI grouping."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="HomeKit HeaterCooler Bridge",
+        manufacturer="Home Assistant",
+        model="HeaterCooler routing",
+        configuration_url="https://github.com/teh-hippo/ha-homekit-heatercooler",
+    )
 
 
 class HomeKitHeaterCoolerPatchedEntitiesSensor(SensorEntity):
@@ -48,24 +85,33 @@ class HomeKitHeaterCoolerPatchedEntitiesSensor(SensorEntity):
 
         Passed straight through from the shared status, so a new diagnostic
         needs adding in one place only and no key can silently fall back to a
-        default that contradicts what is actually in effect.
+        default that contradicts what is actually in effect. The per-bridge
+        entity lists and failure details stay in diagnostics, keeping the
+        attributes under the recorder's size limit on large fleets.
         """
-        return {
+        status = self._patch_status
+        attributes = {
             key: value
-            for key, value in self._patch_status.items()
-            if key != "patched_entities_count"
+            for key, value in status.items()
+            if key not in _SUMMARIZED_STATUS_KEYS
         }
+        if "bridges" in status:
+            attributes["bridges"] = {
+                entry_id: {
+                    key: value
+                    for key, value in bridge.items()
+                    if key != "patched_entities"
+                }
+                for entry_id, bridge in status["bridges"].items()
+            }
+        if "failed_entities" in status:
+            attributes["failed_entities"] = sorted(status["failed_entities"])
+        return attributes
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return integration device metadata for UI grouping."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="HomeKit HeaterCooler Bridge",
-            manufacturer="Home Assistant",
-            model="HeaterCooler routing",
-            configuration_url="https://github.com/teh-hippo/ha-homekit-heatercooler",
-        )
+        return _device_info(self._entry)
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to runtime patch updates."""
@@ -95,3 +141,74 @@ class HomeKitHeaterCoolerPatchedEntitiesSensor(SensorEntity):
         if not isinstance(status, dict):
             return {}
         return status
+
+
+class HomeKitHeaterCoolerFleetSensor(SensorEntity):
+    """Show how many routed climates currently have one action."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:thermostat"
+    _attr_should_poll = False
+
+    def __init__(self, entry: ConfigEntry, action: str) -> None:
+        """Initialize the sensor for one action."""
+        self._entry = entry
+        self._action = action
+        self._attr_name = f"Units {action}"
+        self._attr_unique_id = f"{entry.entry_id}_units_{action}"
+        self._attr_device_info = _device_info(entry)
+
+    @property
+    def native_value(self) -> int:
+        """Return the running total for this action."""
+        fleet: FleetActions | None = self.hass.data.get(DOMAIN, {}).get(DATA_FLEET)
+        return fleet.counts[self._action] if fleet is not None else 0
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to changes of the totals."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_FLEET_UPDATED, self._handle_fleet_update
+            )
+        )
+
+    @callback
+    def _handle_fleet_update(self, previous: str | None, action: str | None) -> None:
+        """Write the total when a change moved a unit into or out of it."""
+        if self._action in (previous, action):
+            self.async_write_ha_state()
+
+
+class HomeKitHeaterCoolerLoopLagSensor(SensorEntity):
+    """Show the worst event-loop scheduling delay of the last sample window."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Event loop lag"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_should_poll = False
+
+    def __init__(self, entry: ConfigEntry, watchdog: Watchdog) -> None:
+        """Initialize the sensor."""
+        self._watchdog = watchdog
+        self._attr_unique_id = f"{entry.entry_id}_loop_lag"
+        self._attr_device_info = _device_info(entry)
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the lag in milliseconds, once a window has been sampled."""
+        lag = self._watchdog.loop_lag
+        return lag * 1000 if lag is not None else None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to new lag samples."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LOOP_LAG_UPDATED, self.async_write_ha_state
+            )
+        )
@@ -0,0 +1,124 @@
+"""Services for the HomeKit HeaterCooler patch integration."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_APPLY,
+    ATTR_SECONDS,
+    ATTR_STOP,
+    DATA_BRIDGE_PLAN,
+    DATA_MEMORY,
+    DATA_PATCH_STATE,
+    DOMAIN,
+    SERVICE_DUMP_TRACE,
+    SERVICE_MEMORY_REPORT,
+    SERVICE_PLAN_BRIDGES,
+    SERVICE_PROFILE,
+)
+from .memory import MemoryTracker, accessory_footprints, integration_footprints
+from .planner import apply_bridge_plan, build_bridge_plan
+from .profiling import async_profile
+
+PLAN_BRIDGES_SCHEMA = vol.Schema({vol.Optional(ATTR_APPLY, default=False): cv.boolean})
+DUMP_TRACE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.entity_ids})
+MEMORY_REPORT_SCHEMA = vol.Schema({vol.Optional(ATTR_STOP, default=False): cv.boolean})
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SECONDS, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        )
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+    profile_lock = asyncio.Lock()
+
+    async def _async_plan_bridges(call: ServiceCall) -> ServiceResponse:
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        patch_state = domain_data.get(DATA_PATCH_STATE)
+        plan = build_bridge_plan(hass, patch_state.bridges if patch_state else {})
+        domain_data[DATA_BRIDGE_PLAN] = plan
+        response = plan.as_dict()
+        if call.data[ATTR_APPLY]:
+            response["result"] = apply_bridge_plan(hass, plan)
+        return response
+
+    async def _async_dump_trace(call: ServiceCall) -> ServiceResponse:
+        patch_state = hass.data.get(DOMAIN, {}).get(DATA_PATCH_STATE)
+        entity_ids = call.data.get(ATTR_ENTITY_ID)
+        accessories = [
+            {
+                "entity_id": accessory.entity_id,
+                "bridge": getattr(accessory.driver, "entry_id", None),
+                "writes": accessory.write_trace.as_list(),
+            }
+            for accessory in (patch_state.accessories if patch_state else ())
+            if entity_ids is None or accessory.entity_id in entity_ids
+        ]
+        accessories.sort(key=lambda trace: (trace["entity_id"], str(trace["bridge"])))
+        response: dict[str, Any] = {"accessories": accessories}
+        return response
+
+    async def _async_memory_report(call: ServiceCall) -> ServiceResponse:
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        if (tracker := domain_data.get(DATA_MEMORY)) is None:
+            tracker = domain_data[DATA_MEMORY] = MemoryTracker(hass)
+        patch_state = domain_data.get(DATA_PATCH_STATE)
+        response: dict[str, Any] = {
+            **accessory_footprints(patch_state.accessories if patch_state else ()),
+            "integration": integration_footprints(domain_data),
+            "traced": await tracker.async_take(),
+        }
+        if call.data[ATTR_STOP]:
+            tracker.async_stop()
+        return response
+
+    async def _async_profile(call: ServiceCall) -> ServiceResponse:
+        return await async_profile(hass, profile_lock, call.data[ATTR_SECONDS])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_TRACE,
+        _async_dump_trace,
+        schema=DUMP_TRACE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_MEMORY_REPORT,
+        _async_memory_report,
+        schema=MEMORY_REPORT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PLAN_BRIDGES,
+        _async_plan_bridges,
+        schema=PLAN_BRIDGES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,220 @@
+"""Persisted HeaterCooler accessory shapes and the causes of their changes."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Set
+from dataclasses import dataclass, field
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .climate_base import HomeKitClimateAccessory
+
+STORAGE_KEY = f"{DOMAIN}.shapes"
+STORAGE_VERSION = 2
+SAVE_DELAY = 10
+
+
+def accessory_shape(accessory: HomeKitClimateAccessory) -> dict[str, Any]:
+    """Return the value-free HAP structure controllers cache for an accessory."""
+    shape: dict[str, Any] = _normalize(
+        {
+            "category": accessory.category,
+            "services": {
+                service.display_name: {
+                    "linked": sorted(
+                        linked.display_name for linked in service.linked_services
+                    ),
+                    "characteristics": {
+                        char.display_name: char.properties
+                        for char in service.characteristics
+                    },
+                }
+                for service in accessory.services
+            },
+        }
+    )
+    return shape
+
+
+def shape_hash(shape: Mapping[str, Any]) -> str:
+    """Return a stable digest of an accessory shape."""
+    encoded = json.dumps(shape, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def shape_changes(old: Mapping[str, Any], new: Mapping[str, Any]) -> list[str]:
+    """Describe how one accessory shape differs from another."""
+    causes: list[str] = []
+    if old.get("category") != new.get("category"):
+        causes.append("category")
+    old_services = old.get("services", {})
+    new_services = new.get("services", {})
+    for name in sorted(old_services.keys() | new_services.keys()):
+        if name not in new_services:
+            causes.append(f"{name} removed")
+            continue
+        if name not in old_services:
+            causes.append(f"{name} added")
+            continue
+        old_service, new_service = old_services[name], new_services[name]
+        if old_service.get("linked") != new_service.get("linked"):
+            causes.append(f"{name} links")
+        old_chars = old_service.get("characteristics", {})
+        new_chars = new_service.get("characteristics", {})
+        for char in sorted(old_chars.keys() | new_chars.keys()):
+            if char not in new_chars:
+                causes.append(f"{name}.{char} removed")
+            elif char not in old_chars:
+                causes.append(f"{name}.{char} added")
+            elif old_chars[char] != new_chars[char]:
+                causes.append(f"{name}.{char} properties")
+    return causes
+
+
+@dataclass
+class ShapeRecord:
+    """The last known shape of an entity's accessory and how it has changed."""
+
+    hash: str
+    shape: dict[str, Any]
+    changes: int = 0
+    last_change: dict[str, Any] | None = None
+    reloads_skipped: int = 0
+    last_skipped: list[str] = field(default_factory=list)
+
+    def as_dict(self, include_shape: bool = True) -> dict[str, Any]:
+        """Return the record for storage or diagnostics."""
+        data: dict[str, Any] = {
+            "hash": self.hash,
+            "changes": self.changes,
+            "last_change": self.last_change,
+            "reloads_skipped": self.reloads_skipped,
+            "last_skipped": self.last_skipped,
+        }
+        if include_shape:
+            data["shape"] = self.shape
+        return data
+
+
+class _ShapeStore(Store[dict[str, Any]]):
+    """Stored shapes, keyed by bridge and then entity."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Any
+    ) -> dict[str, Any]:
+        """Start over, as version 1 records were not kept per bridge."""
+        return {}
+
+
+class ShapeTracker:
+    """Accessory shape hashes per bridge and entity, persisted across restarts.
+
+    HAP controllers refetch the whole accessory database when the config
+    number advances, which HomeKit does whenever a bridge's shape hash moves.
+    Accessories use their shape to skip reloads that would rebuild them
+    identically, and the tracker records what actually changed when one does.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty tracker."""
+        self._store = _ShapeStore(hass, STORAGE_VERSION, STORAGE_KEY)
+        # Keyed by bridge entry ID and entity ID, as each bridge has its own
+        # fan lane and so its own shape of the same climate.
+        self._records: dict[tuple[str, str], ShapeRecord] = {}
+
+    async def async_load(self) -> None:
+        """Load stored shapes."""
+        data = await self._store.async_load() or {}
+        for bridge, entities in data.items():
+            if not isinstance(entities, Mapping):
+                continue
+            for entity_id, stored in entities.items():
+                if not isinstance(stored, Mapping):
+                    continue
+                digest, shape = stored.get("hash"), stored.get("shape")
+                if isinstance(digest, str) and isinstance(shape, Mapping):
+                    self._records[bridge, entity_id] = ShapeRecord(
+                        hash=digest,
+                        shape=dict(shape),
+                        changes=int(stored.get("changes") or 0),
+                        last_change=stored.get("last_change"),
+                        reloads_skipped=int(stored.get("reloads_skipped") or 0),
+                    )
+
+    @callback
+    def async_record(self, accessory: HomeKitClimateAccessory) -> None:
+        """Record a freshly built accessory's shape and follow its skipped reloads."""
+        key = (str(getattr(accessory.driver, "entry_id", None)), accessory.entity_id)
+        shape = accessory_shape(accessory)
+        digest = shape_hash(shape)
+        accessory.on_reload_skipped = lambda attributes: self._async_reload_skipped(
+            key, attributes
+        )
+        record = self._records.get(key)
+        if record is None:
+            self._records[key] = ShapeRecord(hash=digest, shape=shape)
+        elif record.hash != digest:
+            record.last_change = {
+                "at": dt_util.utcnow().isoformat(),
+                "from": record.hash,
+                "to": digest,
+                "causes": shape_changes(record.shape, shape),
+            }
+            record.changes += 1
+            record.hash = digest
+            record.shape = shape
+        else:
+            return
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _async_reload_skipped(
+        self, key: tuple[str, str], attributes: list[str]
+    ) -> None:
+        """Count a reload an accessory avoided because its shape held."""
+        if (record := self._records.get(key)) is not None:
+            record.reloads_skipped += 1
+            record.last_skipped = attributes
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_prune(self, routes: Mapping[str, Set[str]]) -> None:
+        """Drop the records of entities their bridge no longer routes."""
+        stale = [
+            key
+            for key in self._records
+            if key[1] not in routes.get(key[0], frozenset())
+        ]
+        for key in stale:
+            del self._records[key]
+        if stale:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the shape records per bridge, without the shapes, for diagnostics."""
+        return self._grouped(include_shape=False)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the stored data."""
+        return self._grouped(include_shape=True)
+
+    def _grouped(self, include_shape: bool) -> dict[str, Any]:
+        """Return the records nested by bridge and then entity."""
+        grouped: dict[str, Any] = {}
+        for (bridge, entity_id), record in sorted(self._records.items()):
+            grouped.setdefault(bridge, {})[entity_id] = record.as_dict(include_shape)
+        return grouped
+
+
+def _normalize(value: Any) -> Any:
+    """Return a JSON round-tripped copy, so live and stored shapes compare equal."""
+    return json.loads(json.dumps(value, sort_keys=True, default=str))
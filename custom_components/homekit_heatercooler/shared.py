@@ -0,0 +1,140 @@
+"""State derivation and writes shared by one entity's HeaterCoolers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable, Mapping
+from datetime import datetime
+from time import monotonic
+from typing import TYPE_CHECKING, Any, NamedTuple
+from weakref import WeakSet, WeakValueDictionary, ref
+
+from homeassistant.core import HomeAssistant, State
+
+from .const import DATA_SHARED, DOMAIN
+
+if TYPE_CHECKING:
+    from .climate_base import HomeKitClimateAccessory
+
+# A sibling's identical service call within this many seconds is not repeated.
+SHARED_CALL_WINDOW = 2.0
+
+
+class RecentCall(NamedTuple):
+    """A completed service call siblings may reuse."""
+
+    expires: float
+    accessory: ref[HomeKitClimateAccessory]
+    # When the entity's state was last updated as the call completed.
+    last_updated: datetime | None
+
+
+class SharedClimate:
+    """Derivations and a write queue for every accessory of one climate.
+
+    An entity exposed on several bridges gets one accessory per bridge. They
+    receive the same state objects, so anything derived from a state is
+    computed by the first accessory and reused by the rest, and their writes
+    run one at a time so a scene sent to both bridges calls each service once.
+    """
+
+    def __init__(self, entity_id: str) -> None:
+        """Initialize an empty pipeline."""
+        self.entity_id = entity_id
+        self.write_lock = asyncio.Lock()
+        self.accessories: WeakSet[HomeKitClimateAccessory] = WeakSet()
+        self._state: State | None = None
+        self._derived: dict[Hashable, Any] = {}
+        self._recent_calls: dict[Hashable, RecentCall] = {}
+        # Derivation state carried from one state to the next, by accessory type.
+        self.carried: dict[str, Any] = {}
+        self.derivations = 0
+        self.derivations_shared = 0
+        self.calls_shared = 0
+
+    def derive[T](self, state: State, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return a value derived from a state, computing it once per state."""
+        if state is not self._state:
+            self._state = state
+            self._derived = {}
+        elif key in self._derived:
+            self.derivations_shared += 1
+            value: T = self._derived[key]
+            return value
+        value = self._derived[key] = compute()
+        self.derivations += 1
+        return value
+
+    def is_duplicate_call(
+        self,
+        accessory: HomeKitClimateAccessory,
+        service: str,
+        data: Mapping[str, Any],
+    ) -> bool:
+        """Return True if a sibling accessory just made the same service call.
+
+        The call only counts as done while the entity still has the state it
+        had when the call completed; any later state may have undone it.
+        """
+        now = monotonic()
+        self._recent_calls = {
+            call: recent
+            for call, recent in self._recent_calls.items()
+            if recent.expires > now
+        }
+        recent = self._recent_calls.get(_call_key(service, data))
+        if (
+            recent is not None
+            and recent.accessory() is not accessory
+            and recent.last_updated == _last_updated(accessory)
+        ):
+            self.calls_shared += 1
+            return True
+        return False
+
+    def record_call(
+        self,
+        accessory: HomeKitClimateAccessory,
+        service: str,
+        data: Mapping[str, Any],
+    ) -> None:
+        """Remember a completed service call for siblings writing the same."""
+        if len(self.accessories) > 1:
+            self._recent_calls[_call_key(service, data)] = RecentCall(
+                monotonic() + SHARED_CALL_WINDOW,
+                ref(accessory),
+                _last_updated(accessory),
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return sharing counters for diagnostics."""
+        return {
+            "accessories": len(self.accessories),
+            "derivations": self.derivations,
+            "derivations_shared": self.derivations_shared,
+            "calls_shared": self.calls_shared,
+        }
+
+
+def _call_key(service: str, data: Mapping[str, Any]) -> Hashable:
+    """Return a hashable identity for a service call."""
+    return service, tuple(sorted((key, repr(value)) for key, value in data.items()))
+
+
+def _last_updated(accessory: HomeKitClimateAccessory) -> datetime | None:
+    """Return when the accessory's entity state was last updated."""
+    state = accessory.hass.states.get(accessory.entity_id)
+    return state.last_updated if state is not None else None
+
+
+def async_get_shared(
+    hass: HomeAssistant, accessory: HomeKitClimateAccessory
+) -> SharedClimate:
+    """Return the pipeline of an accessory's entity, joining it."""
+    registry: WeakValueDictionary[str, SharedClimate] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_SHARED, WeakValueDictionary())
+    if (shared := registry.get(accessory.entity_id)) is None:
+        shared = registry[accessory.entity_id] = SharedClimate(accessory.entity_id)
+    shared.accessories.add(accessory)
+    return shared
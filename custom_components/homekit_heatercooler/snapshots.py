@@ -0,0 +1,173 @@
+"""Persisted accessory snapshots for building HeaterCoolers before their climate."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
+
+from homeassistant.components.climate import ATTR_CURRENT_HUMIDITY
+from homeassistant.const import ATTR_FRIENDLY_NAME
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.storage import Store
+
+from .climate_util import CAPABILITY_ATTRIBUTES, capability_fingerprint
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .climate_base import HomeKitClimateAccessory
+
+STORAGE_KEY = f"{DOMAIN}.snapshots"
+STORAGE_VERSION = 1
+# Characteristic values change with every temperature reading, so writes are
+# coalesced; the store also flushes on shutdown.
+SAVE_DELAY = 60
+
+# Attributes kept alongside the capabilities, so the rebuilt accessory is
+# named and shaped like the live one.
+PROFILE_ATTRIBUTES = (*CAPABILITY_ATTRIBUTES, ATTR_CURRENT_HUMIDITY, ATTR_FRIENDLY_NAME)
+
+
+@dataclass
+class AccessorySnapshot:
+    """The capability profile and last characteristic values of an accessory."""
+
+    fingerprint: str
+    state: str
+    attributes: dict[str, Any]
+    values: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_state(cls, state: State) -> AccessorySnapshot:
+        """Capture the profile of a live climate state."""
+        return cls(
+            fingerprint=capability_fingerprint(state),
+            state=state.state,
+            attributes={
+                attr: state.attributes[attr]
+                for attr in PROFILE_ATTRIBUTES
+                if attr in state.attributes
+            },
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> AccessorySnapshot | None:
+        """Restore a stored snapshot, or None if it is malformed."""
+        fingerprint = data.get("fingerprint")
+        state = data.get("state")
+        attributes = data.get("attributes")
+        values = data.get("values")
+        if not (
+            isinstance(fingerprint, str)
+            and isinstance(state, str)
+            and isinstance(attributes, Mapping)
+        ):
+            return None
+        return cls(
+            fingerprint=fingerprint,
+            state=state,
+            attributes=dict(attributes),
+            values=dict(values) if isinstance(values, Mapping) else {},
+        )
+
+    def as_state(self, entity_id: str) -> State:
+        """Return a stand-in climate state to build the accessory from."""
+        return State(entity_id, self.state, self.attributes)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the snapshot for storage."""
+        return {
+            "fingerprint": self.fingerprint,
+            "state": self.state,
+            "attributes": self.attributes,
+            "values": self.values,
+        }
+
+
+class SnapshotStore:
+    """Snapshots of routed HeaterCooler accessories, persisted under .storage.
+
+    Live accessories are tracked weakly and read when the store saves, so an
+    update only marks the store dirty instead of copying values.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty store."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._snapshots: dict[str, AccessorySnapshot] = {}
+        self._accessories: WeakValueDictionary[str, HomeKitClimateAccessory] = (
+            WeakValueDictionary()
+        )
+        self._dirty = False
+
+    async def async_load(self) -> None:
+        """Load stored snapshots."""
+        data = await self._store.async_load() or {}
+        for entity_id, stored in data.items():
+            if isinstance(stored, Mapping) and (
+                snapshot := AccessorySnapshot.from_dict(stored)
+            ):
+                self._snapshots[entity_id] = snapshot
+
+    def get(self, entity_id: str) -> AccessorySnapshot | None:
+        """Return the snapshot of an entity, if any."""
+        return self._snapshots.get(entity_id)
+
+    @property
+    def entity_ids(self) -> set[str]:
+        """Return the entities with a snapshot."""
+        return set(self._snapshots)
+
+    @callback
+    def async_track(
+        self, accessory: HomeKitClimateAccessory, snapshot: AccessorySnapshot
+    ) -> None:
+        """Persist an accessory's values under the given profile from now on."""
+        entity_id = accessory.entity_id
+        current = self._snapshots.get(entity_id)
+        if current is not None and current.fingerprint != snapshot.fingerprint:
+            # The shape changed; the old values belong to another accessory.
+            snapshot.values.clear()
+        elif current is not None and not snapshot.values:
+            snapshot.values.update(current.values)
+        self._snapshots[entity_id] = snapshot
+        self._accessories[entity_id] = accessory
+        accessory.on_values_changed = self.async_schedule_save
+        self.async_schedule_save()
+
+    @callback
+    def async_invalidate(self, entity_id: str) -> None:
+        """Drop an entity's snapshot once it no longer matches the entity."""
+        if self._snapshots.pop(entity_id, None) is not None:
+            self._accessories.pop(entity_id, None)
+            self.async_schedule_save()
+
+    @callback
+    def async_prune(self, entity_ids: Iterable[str]) -> None:
+        """Drop snapshots of entities that are no longer routed."""
+        for entity_id in self.entity_ids - set(entity_ids):
+            self.async_invalidate(entity_id)
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a coalesced save."""
+        if not self._dirty:
+            self._dirty = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Collect current characteristic values and return the stored data."""
+        self._dirty = False
+        for entity_id, accessory in list(self._accessories.items()):
+            # A deferred accessory keeps its last saved values; applying the
+            # state here would undo the deferral on every save.
+            if accessory.has_deferred_state:
+                continue
+            if (snapshot := self._snapshots.get(entity_id)) is not None:
+                snapshot.values = accessory.snapshot_values()
+        return {
+            entity_id: snapshot.as_dict()
+            for entity_id, snapshot in self._snapshots.items()
+        }
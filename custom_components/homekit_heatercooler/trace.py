@@ -0,0 +1,106 @@
+"""Bounded traces of the HomeKit writes an accessory handled."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping
+from time import monotonic, time
+from typing import Any
+
+# Writes kept per accessory; older ones are dropped, so memory stays constant.
+TRACE_SIZE = 20
+
+RESULT_PENDING = "not_run"
+RESULT_OK = "ok"
+RESULT_FAILED = "failed"
+
+
+class TraceRecord:
+    """One characteristic batch, what it resolved to, and how it went."""
+
+    __slots__ = ("_started", "batch", "calls", "received", "transitions")
+
+    def __init__(self, batch: Mapping[str, Any], received: float) -> None:
+        """Start a record for a batch that arrived at a monotonic time."""
+        self._started = received
+        self.received = time() - (monotonic() - received)
+        self.batch = dict(batch)
+        # [service, data, commit_mode, pending_mode, result, seconds to result]
+        self.calls: list[list[Any]] = []
+        # (seconds since received, field, value)
+        self.transitions: list[tuple[float, str, Any]] = []
+
+    def _elapsed(self) -> float:
+        """Return the seconds since the batch arrived."""
+        return round(monotonic() - self._started, 6)
+
+    def add_call(
+        self,
+        service: str,
+        data: Mapping[str, Any],
+        commit_mode: str | None,
+        pending_mode: str | None,
+    ) -> None:
+        """Record a resolved service call that has not run yet."""
+        self.calls.append(
+            [service, dict(data), commit_mode, pending_mode, RESULT_PENDING, None]
+        )
+
+    def set_result(self, index: int, result: str) -> None:
+        """Record how a resolved service call went."""
+        call = self.calls[index]
+        call[4] = result
+        call[5] = self._elapsed()
+
+    def transition(self, field: str, value: Any) -> None:
+        """Record a change of the accessory's mode tracking."""
+        self.transitions.append((self._elapsed(), field, value))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record for a trace dump."""
+        return {
+            "received": round(self.received, 3),
+            "batch": self.batch,
+            "calls": [
+                {
+                    "service": service,
+                    "data": data,
+                    "commit_mode": commit_mode,
+                    "pending_mode": pending_mode,
+                    "result": result,
+                    "after": after,
+                }
+                for service, data, commit_mode, pending_mode, result, after in (
+                    self.calls
+                )
+            ],
+            "transitions": [
+                {"after": after, "field": field, "value": value}
+                for after, field, value in self.transitions
+            ],
+        }
+
+
+class WriteTrace:
+    """Keep an accessory's latest writes in a ring buffer."""
+
+    __slots__ = ("records",)
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        """Initialize an empty trace."""
+        self.records: deque[TraceRecord] = deque(maxlen=size)
+
+    def start(self, batch: Mapping[str, Any], received: float) -> TraceRecord:
+        """Add a record for a new batch, dropping the oldest if full."""
+        record = TraceRecord(batch, received)
+        self.records.append(record)
+        return record
+
+    def transition(self, field: str, value: Any) -> None:
+        """Record a mode change on the latest write, if there is one."""
+        if self.records:
+            self.records[-1].transition(field, value)
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the records, oldest first."""
+        return [record.as_dict() for record in self.records]
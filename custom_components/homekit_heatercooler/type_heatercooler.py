@@ -1,12 +1,15 @@
 """Legacy HomeKit HeaterCooler accessory."""
 
-import asyncio
 from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime
 import logging
+from time import monotonic
 from typing import Any, Concatenate, NamedTuple, override
 
 from pyhap.characteristic import Characteristic
 from pyhap.const import CATEGORY_AIR_CONDITIONER, CATEGORY_HEATER
+from pyhap.util import callback as pyhap_callback
 
 from homeassistant.components.climate import (
     ATTR_CURRENT_HUMIDITY,
@@ -26,8 +29,14 @@ from homeassistant.components.climate import (
     HVACAction,
     HVACMode,
 )
-from homeassistant.const import ATTR_ENTITY_ID, ATTR_SUPPORTED_FEATURES
-from homeassistant.core import State, callback
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_SUPPORTED_FEATURES,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import CALLBACK_TYPE, State, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util.enum import try_parse_enum
 
 from .climate_base import CLIMATE_INACTIVE_STATES, HomeKitClimateAccessory
@@ -43,12 +52,24 @@ from .const import (
     CHAR_ROTATION_SPEED,
     CHAR_SWING_MODE,
     CHAR_TARGET_HEATER_COOLER_STATE,
+    CONF_ACTION_DWELL,
+    DATA_FLEET,
+    DOMAIN,
     PROP_MAX_VALUE,
     PROP_MIN_STEP,
     PROP_MIN_VALUE,
     SERV_HEATER_COOLER,
     SERV_HUMIDITY_SENSOR,
 )
+from .fleet import (
+    FLEET_COOLING,
+    FLEET_HEATING,
+    FLEET_IDLE,
+    FLEET_OFF,
+    FLEET_UNAVAILABLE,
+    FleetActions,
+)
+from .trace import RESULT_FAILED, RESULT_OK
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,10 +100,31 @@ HC_HASS_TO_HOMEKIT_ACTION = {
     HVACAction.DEFROSTING: HC_HEATING,
 }
 
+HC_TO_FLEET_ACTION = {
+    HC_INACTIVE: FLEET_OFF,
+    HC_IDLE: FLEET_IDLE,
+    HC_HEATING: FLEET_HEATING,
+    HC_COOLING: FLEET_COOLING,
+}
+
 ACTION_HYSTERESIS = 0.25
+# With a dwell time, noisy sensors widen the hysteresis up to this many degrees
+# (HomeKit units).
+MAX_ACTION_HYSTERESIS = 1.0
+# Weight of the newest reading in the current-temperature jitter average.
+JITTER_SMOOTHING = 0.2
 RANGE_MODES = (HVACMode.HEAT_COOL, HVACMode.AUTO)
 
 
+@dataclass
+class ActionTracker:
+    """Derived-action state carried between the states of one climate."""
+
+    derived_action: HVACAction | None = None
+    last_current_temp: float | None = None
+    temp_jitter: float = 0.0
+
+
 class ClimateServiceCall(NamedTuple):
     """A queued climate write and its accepted mode state."""
 
@@ -90,18 +132,30 @@ class ClimateServiceCall(NamedTuple):
     data: dict[str, Any]
     commit_mode: HVACMode | None = None
     pending_mode: HVACMode | None = None
+    pending_values: tuple[tuple[Characteristic, Any], ...] = ()
 
 
 def _locked_write[**P](
     func: Callable[Concatenate[HeaterCooler, P], Coroutine[Any, Any, None]],
 ) -> Callable[Concatenate[HeaterCooler, P], Coroutine[Any, Any, None]]:
-    """Run a write coroutine under the accessory write lock."""
+    """Run a write coroutine under the accessory write lock, counting the wait."""
 
     async def _wrapper(
         self: HeaterCooler, /, *args: P.args, **kwargs: P.kwargs
     ) -> None:
-        async with self._write_lock:
+        stats = self.write_queue
+        stats.queued += 1
+        waiting_since = monotonic()
+        try:
+            await self._write_lock.acquire()
+        finally:
+            stats.queued -= 1
+        try:
+            stats.max_lock_wait = max(stats.max_lock_wait, monotonic() - waiting_since)
+            stats.batches += 1
             await func(self, *args, **kwargs)
+        finally:
+            self._write_lock.release()
 
     return _wrapper
 
@@ -113,55 +167,17 @@ class HeaterCooler(HomeKitClimateAccessory):
     char_heat: Characteristic
     char_current_humidity: Characteristic
 
-    def __init__(self, *args: Any) -> None:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the accessory."""
-        super().__init__(*args)
-
-        state = self.hass.states.get(self.entity_id)
-        assert state
-        attributes = state.attributes
-        features = attributes.get(ATTR_SUPPORTED_FEATURES, 0)
-        has_thresholds = bool(
-            features
-            & (
-                ClimateEntityFeature.TARGET_TEMPERATURE
-                | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-            )
-        )
+        super().__init__(*args, **kwargs)
 
-        hvac_modes = attributes.get(ATTR_HVAC_MODES, [])
+        state = self._initial_state
         current_mode = try_parse_enum(HVACMode, state.state)
-        self._supports_off = HVACMode.OFF in hvac_modes
-        supports_auto = HVACMode.AUTO in hvac_modes or current_mode == HVACMode.AUTO
-        supports_heat_cool = (
-            HVACMode.HEAT_COOL in hvac_modes or current_mode == HVACMode.HEAT_COOL
-        )
-        can_cool = HVACMode.COOL in hvac_modes or supports_auto or supports_heat_cool
-        can_heat = HVACMode.HEAT in hvac_modes or supports_auto or supports_heat_cool
-        self.category = (
-            CATEGORY_HEATER if can_heat and not can_cool else CATEGORY_AIR_CONDITIONER
-        )
-
-        if (not can_cool and not can_heat) or not (
-            features & ClimateEntityFeature.TARGET_TEMPERATURE
-        ):
-            can_cool = can_heat = True
-        self._has_cool_threshold = has_thresholds and can_cool
-        self._has_heat_threshold = has_thresholds and can_heat
-
-        self._hk_to_ha_target: dict[int, HVACMode] = {}
-        if HVACMode.HEAT in hvac_modes:
-            self._hk_to_ha_target[HC_TARGET_HEAT] = HVACMode.HEAT
-        if HVACMode.COOL in hvac_modes:
-            self._hk_to_ha_target[HC_TARGET_COOL] = HVACMode.COOL
-        if supports_heat_cool:
-            self._hk_to_ha_target[HC_TARGET_AUTO] = HVACMode.HEAT_COOL
-        elif supports_auto:
-            self._hk_to_ha_target[HC_TARGET_AUTO] = HVACMode.AUTO
-        if not self._hk_to_ha_target:
-            self._hk_to_ha_target[HC_TARGET_AUTO] = next(
-                (mode for mode in hvac_modes if mode != HVACMode.OFF), HVACMode.OFF
-            )
+        self._supports_off: bool = self.shape["supports_off"]
+        self.category = self.shape["category"]
+        self._has_cool_threshold: bool = self.shape["cool_threshold"]
+        self._has_heat_threshold: bool = self.shape["heat_threshold"]
+        self._hk_to_ha_target: dict[int, HVACMode] = self.shape["hk_to_ha_target"]
 
         chars = [
             CHAR_ACTIVE,
@@ -203,7 +219,7 @@ class HeaterCooler(HomeKitClimateAccessory):
         self._configure_current_temperature_char(service)
 
         if self._has_cool_threshold or self._has_heat_threshold:
-            min_temp, max_temp = self.get_temperature_range(state)
+            min_temp, max_temp = self.shape["temperature_range"]
             properties = {
                 PROP_MIN_VALUE: min_temp,
                 PROP_MAX_VALUE: max_temp,
@@ -233,7 +249,7 @@ class HeaterCooler(HomeKitClimateAccessory):
         if self.swing_on_mode is not None:
             self.char_swing = service.configure_char(CHAR_SWING_MODE, value=0)
 
-        self._has_humidity = ATTR_CURRENT_HUMIDITY in attributes
+        self._has_humidity: bool = self.shape["humidity"]
         if self._has_humidity:
             humidity_service = self.add_preload_service(SERV_HUMIDITY_SENSOR, CHAR_NAME)
             service.add_linked_service(humidity_service)
@@ -249,21 +265,142 @@ class HeaterCooler(HomeKitClimateAccessory):
             self._last_known_mode = current_mode
         else:
             self._last_known_mode = self._hk_to_ha_target[default_target]
-        self._write_lock = asyncio.Lock()
+        self._write_lock = self.shared.write_lock
         self._pending_mode: HVACMode | None = None
         self._last_reported_mode = current_mode
+        self._action_dwell = as_float(self.config.get(CONF_ACTION_DWELL)) or 0.0
+        self._action_since = monotonic()
+        self._held_action: int | None = None
+        self._action_timer: CALLBACK_TYPE | None = None
+        self._actions: ActionTracker = self.shared.carried.setdefault(
+            "action", ActionTracker()
+        )
+        self.actions_damped = 0
         self.async_update_state(state)
+        self._restore_snapshot_values()
         service.setter_callback = self._set_chars
 
+    @override
+    def _shape(self, state: State) -> dict[str, Any]:
+        """Add the HeaterCooler's modes, thresholds and services to the shape."""
+        shape = super()._shape(state)
+        attributes = state.attributes
+        features = attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+        has_thresholds = bool(
+            features
+            & (
+                ClimateEntityFeature.TARGET_TEMPERATURE
+                | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+            )
+        )
+
+        hvac_modes = attributes.get(ATTR_HVAC_MODES, [])
+        current_mode = try_parse_enum(HVACMode, state.state)
+        supports_auto = HVACMode.AUTO in hvac_modes or current_mode == HVACMode.AUTO
+        supports_heat_cool = (
+            HVACMode.HEAT_COOL in hvac_modes or current_mode == HVACMode.HEAT_COOL
+        )
+        can_cool = HVACMode.COOL in hvac_modes or supports_auto or supports_heat_cool
+        can_heat = HVACMode.HEAT in hvac_modes or supports_auto or supports_heat_cool
+        category = (
+            CATEGORY_HEATER if can_heat and not can_cool else CATEGORY_AIR_CONDITIONER
+        )
+
+        if (not can_cool and not can_heat) or not (
+            features & ClimateEntityFeature.TARGET_TEMPERATURE
+        ):
+            can_cool = can_heat = True
+
+        hk_to_ha_target: dict[int, HVACMode] = {}
+        if HVACMode.HEAT in hvac_modes:
+            hk_to_ha_target[HC_TARGET_HEAT] = HVACMode.HEAT
+        if HVACMode.COOL in hvac_modes:
+            hk_to_ha_target[HC_TARGET_COOL] = HVACMode.COOL
+        if supports_heat_cool:
+            hk_to_ha_target[HC_TARGET_AUTO] = HVACMode.HEAT_COOL
+        elif supports_auto:
+            hk_to_ha_target[HC_TARGET_AUTO] = HVACMode.AUTO
+        if not hk_to_ha_target:
+            hk_to_ha_target[HC_TARGET_AUTO] = next(
+                (mode for mode in hvac_modes if mode != HVACMode.OFF), HVACMode.OFF
+            )
+
+        shape.update(
+            supports_off=HVACMode.OFF in hvac_modes,
+            category=category,
+            cool_threshold=has_thresholds and can_cool,
+            heat_threshold=has_thresholds and can_heat,
+            hk_to_ha_target=hk_to_ha_target,
+            temperature_range=(
+                self.get_temperature_range(state) if has_thresholds else None
+            ),
+            humidity=ATTR_CURRENT_HUMIDITY in attributes,
+        )
+        return shape
+
+    @override
+    def _write_active(self) -> bool:
+        """Return True while a write batch runs or is being confirmed."""
+        return self._write_lock.locked() or super()._write_active()
+
+    @override
+    def _awaiting_confirmation(self) -> bool:
+        """Also wait for a written mode to be reported."""
+        return self._pending_mode is not None or super()._awaiting_confirmation()
+
     def _set_chars(self, char_values: dict[str, Any]) -> None:
         """Schedule one atomic characteristic batch."""
+        self.async_sync_deferred()
         self.hass.async_create_task(
-            self._async_apply_batch(char_values), eager_start=True
+            self._async_apply_batch(char_values, monotonic()), eager_start=True
         )
 
     @_locked_write
-    async def _async_apply_batch(self, char_values: dict[str, Any]) -> None:
+    async def _async_apply_batch(
+        self, char_values: dict[str, Any], received: float | None = None
+    ) -> None:
         """Resolve and apply one characteristic batch in service-call order."""
+        locked = monotonic()
+        trace = self.write_trace.start(
+            char_values, locked if received is None else received
+        )
+        with self._watch("_async_apply_batch"):
+            service_calls = self._resolve_batch(char_values)
+        for call in service_calls:
+            trace.add_call(call.service, call.data, call.commit_mode, call.pending_mode)
+
+        for index, call in enumerate(service_calls):
+            reported_mode = self._last_reported_mode
+            known_mode = self._last_known_mode
+            reported_values = [
+                self._reported_value(char) for char, _ in call.pending_values
+            ]
+            if not await self.async_call_service_and_wait(
+                CLIMATE_DOMAIN,
+                call.service,
+                {ATTR_ENTITY_ID: self.entity_id, **call.data},
+            ):
+                trace.set_result(index, RESULT_FAILED)
+                return
+            trace.set_result(index, RESULT_OK)
+            if call.pending_mode and self._last_reported_mode == reported_mode:
+                self._pending_mode = call.pending_mode
+                trace.transition("pending_mode", call.pending_mode)
+            if call.commit_mode and self._last_known_mode == known_mode:
+                self._last_known_mode = call.commit_mode
+                trace.transition("last_known_mode", call.commit_mode)
+            for (char, value), reported in zip(
+                call.pending_values, reported_values, strict=True
+            ):
+                if self._reported_value(char) == reported:
+                    self._hold_pending_value(char, value, reported)
+        if service_calls:
+            self._record_write(
+                locked if received is None else received, locked, monotonic()
+            )
+
+    def _resolve_batch(self, char_values: dict[str, Any]) -> list[ClimateServiceCall]:
+        """Return the service calls a characteristic batch resolves to."""
         service_calls: list[ClimateServiceCall] = []
         current_state = self.hass.states.get(self.entity_id)
         active = (
@@ -292,20 +429,7 @@ class HeaterCooler(HomeKitClimateAccessory):
                 requested_mode or self._pending_mode,
             )
             self._queue_fan_swing_changes(char_values, service_calls)
-
-        for call in service_calls:
-            reported_mode = self._last_reported_mode
-            known_mode = self._last_known_mode
-            if not await self.async_call_service_and_wait(
-                CLIMATE_DOMAIN,
-                call.service,
-                {ATTR_ENTITY_ID: self.entity_id, **call.data},
-            ):
-                return
-            if call.pending_mode and self._last_reported_mode == reported_mode:
-                self._pending_mode = call.pending_mode
-            if call.commit_mode and self._last_known_mode == known_mode:
-                self._last_known_mode = call.commit_mode
+        return service_calls
 
     def _queue_fan_swing_changes(
         self,
@@ -314,17 +438,31 @@ class HeaterCooler(HomeKitClimateAccessory):
     ) -> None:
         """Queue fan and swing writes after HVAC and temperature writes."""
         if (
-            CHAR_ROTATION_SPEED in char_values
+            self.char_speed is not None
+            and CHAR_ROTATION_SPEED in char_values
             and (params := self._fan_speed_params(char_values[CHAR_ROTATION_SPEED]))
             is not None
         ):
-            service_calls.append(ClimateServiceCall(SERVICE_SET_FAN_MODE, params))
+            service_calls.append(
+                ClimateServiceCall(
+                    SERVICE_SET_FAN_MODE,
+                    params,
+                    pending_values=((self.char_speed, self.char_speed.value),),
+                )
+            )
         if (
-            CHAR_SWING_MODE in char_values
+            self.char_swing is not None
+            and CHAR_SWING_MODE in char_values
             and (params := self._swing_mode_params(char_values[CHAR_SWING_MODE]))
             is not None
         ):
-            service_calls.append(ClimateServiceCall(SERVICE_SET_SWING_MODE, params))
+            service_calls.append(
+                ClimateServiceCall(
+                    SERVICE_SET_SWING_MODE,
+                    params,
+                    pending_values=((self.char_swing, self.char_swing.value),),
+                )
+            )
 
     def _handle_active_mode_changes(
         self,
@@ -415,6 +553,14 @@ class HeaterCooler(HomeKitClimateAccessory):
                     self._dual_setpoint_params(
                         self.char_cool, self.char_heat, cooling_temp, heating_temp
                     ),
+                    pending_values=tuple(
+                        (char, temp)
+                        for char, temp in (
+                            (self.char_cool, cooling_temp),
+                            (self.char_heat, heating_temp),
+                        )
+                        if temp is not None
+                    ),
                 )
             )
             return
@@ -433,11 +579,13 @@ class HeaterCooler(HomeKitClimateAccessory):
         """Queue a single-temperature write for the effective HVAC mode."""
         if current_state is None:
             return
-        selected_temp: float | None = None
+        cool = (self.char_cool, cooling_temp) if cooling_temp is not None else None
+        heat = (self.char_heat, heating_temp) if heating_temp is not None else None
+        selected: tuple[Characteristic, float] | None = None
         if effective_mode == HVACMode.COOL:
-            selected_temp = cooling_temp
+            selected = cool
         elif effective_mode == HVACMode.HEAT:
-            selected_temp = heating_temp
+            selected = heat
         elif (
             effective_mode in RANGE_MODES
             and cooling_temp is not None
@@ -445,25 +593,25 @@ class HeaterCooler(HomeKitClimateAccessory):
         ):
             target_temp = as_float(current_state.attributes.get(ATTR_TEMPERATURE))
             if target_temp is None:
-                selected_temp = heating_temp
+                selected = heat
             else:
                 target_temp_hk = self._temperature_to_homekit(target_temp)
-                selected_temp = (
-                    cooling_temp
+                selected = (
+                    cool
                     if abs(cooling_temp - target_temp_hk)
                     > abs(heating_temp - target_temp_hk)
-                    else heating_temp
+                    else heat
                 )
-        elif cooling_temp is not None:
-            selected_temp = cooling_temp
-        elif heating_temp is not None:
-            selected_temp = heating_temp
+        else:
+            selected = cool or heat
 
-        if selected_temp is not None:
+        if selected is not None:
+            char, selected_temp = selected
             service_calls.append(
                 ClimateServiceCall(
                     SERVICE_SET_TEMPERATURE,
                     {ATTR_TEMPERATURE: self._temperature_to_states(selected_temp)},
+                    pending_values=((char, selected_temp),),
                 )
             )
 
@@ -477,10 +625,19 @@ class HeaterCooler(HomeKitClimateAccessory):
     @override
     def async_update_state(self, new_state: State) -> None:
         """Update characteristics from a climate state."""
+        with self._watch("async_update_state"):
+            self._update_from_state(new_state)
+
+    def _update_from_state(self, new_state: State) -> None:
+        """Apply a climate state to every characteristic."""
         attributes = new_state.attributes
         current_mode = try_parse_enum(HVACMode, new_state.state)
         if current_mode is not None:
             if current_mode != self._last_reported_mode:
+                if self._pending_mode is not None:
+                    # The entity reported a mode after a write; close its trace.
+                    self.write_trace.transition("last_reported_mode", current_mode)
+                    self.write_trace.transition("pending_mode", None)
                 self._pending_mode = None
             self._last_reported_mode = current_mode
         display_mode = self._pending_mode or current_mode
@@ -488,17 +645,10 @@ class HeaterCooler(HomeKitClimateAccessory):
             self._last_known_mode = display_mode
             self.char_target_state.set_value(target)
 
-        if new_state.state in CLIMATE_INACTIVE_STATES:
-            self.char_active.set_value(0)
-            self.char_current_state.set_value(HC_INACTIVE)
-        else:
-            self.char_active.set_value(1)
-            action = attributes.get(ATTR_HVAC_ACTION) or self._derive_action(
-                new_state, current_mode
-            )
-            self.char_current_state.set_value(
-                HC_HASS_TO_HOMEKIT_ACTION.get(action, HC_INACTIVE)
-            )
+        self.char_active.set_value(
+            0 if new_state.state in CLIMATE_INACTIVE_STATES else 1
+        )
+        self._set_current_state(self._derive_current_state(new_state))
 
         self._update_current_temperature_char(new_state)
         self._update_temperature_thresholds(new_state)
@@ -510,6 +660,41 @@ class HeaterCooler(HomeKitClimateAccessory):
             self.char_current_humidity.set_value(humidity)
         self._update_fan_speed_char(attributes)
         self._update_swing_char(attributes)
+        self._note_confirmation()
+
+    def _derive_current_state(self, state: State) -> int:
+        """Return the CurrentHeaterCoolerState for a state.
+
+        Accessories of the entity on other bridges reuse the result per state.
+        """
+        self.shared.derive(
+            state, "jitter", lambda: self._track_temperature_jitter(state)
+        )
+        return self.shared.derive(
+            state, "current_state", lambda: self._current_state_for(state)
+        )
+
+    def _current_state_for(self, state: State) -> int:
+        """Map a state's reported or derived action to HomeKit."""
+        if state.state in CLIMATE_INACTIVE_STATES:
+            self._actions.derived_action = None
+            return HC_INACTIVE
+        action = state.attributes.get(ATTR_HVAC_ACTION) or self._derive_action(
+            state, try_parse_enum(HVACMode, state.state)
+        )
+        return HC_HASS_TO_HOMEKIT_ACTION.get(action, HC_INACTIVE)
+
+    @override
+    def _observe_state(self, new_state: State | None) -> None:
+        """Count the entity's action in the fleet totals."""
+        fleet: FleetActions | None = self.hass.data.get(DOMAIN, {}).get(DATA_FLEET)
+        if fleet is None or new_state is None:
+            return
+        if new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            action = FLEET_UNAVAILABLE
+        else:
+            action = HC_TO_FLEET_ACTION[self._derive_current_state(new_state)]
+        fleet.async_report(self.entity_id, self, action)
 
     def _update_temperature_thresholds(self, state: State) -> None:
         """Update available threshold characteristics."""
@@ -537,12 +722,127 @@ class HeaterCooler(HomeKitClimateAccessory):
             )
         ) is not None:
             if self._has_cool_threshold:
-                self.char_cool.set_value(target_temp)
+                self._set_reported_value(self.char_cool, target_temp)
             if self._has_heat_threshold:
-                self.char_heat.set_value(target_temp)
+                self._set_reported_value(self.char_heat, target_temp)
+
+    def _set_current_state(self, value: int) -> None:
+        """Show a new action once the current one has been shown for the dwell time.
+
+        Transitions to and from inactive always apply at once; flips between
+        idle, heating and cooling inside the dwell time are held, and only the
+        latest one is shown when it ends.
+        """
+        current = self.char_current_state.value
+        if value == current:
+            self._release_held_action()
+            return
+        now = monotonic()
+        remaining = self._action_since + self._action_dwell - now
+        if remaining <= 0 or HC_INACTIVE in (value, current):
+            self._release_held_action()
+            self.char_current_state.set_value(value)
+            self._action_since = now
+            return
+        self._held_action = value
+        self.actions_damped += 1
+        if self._action_timer is None:
+            self._action_timer = async_call_later(
+                self.hass, remaining, self._async_apply_held_action
+            )
+
+    @callback
+    def _async_apply_held_action(self, _now: datetime) -> None:
+        """Show the latest held action once the dwell time has passed."""
+        self._action_timer = None
+        if (value := self._held_action) is not None:
+            self._held_action = None
+            self.char_current_state.set_value(value)
+            self._action_since = monotonic()
+
+    def _release_held_action(self) -> None:
+        """Drop a held action and its timer."""
+        self._held_action = None
+        if self._action_timer is not None:
+            self._action_timer()
+            self._action_timer = None
+
+    @override
+    def diagnostics(self) -> dict[str, Any]:
+        """Add mode tracking, capabilities, values and action damping."""
+        return {
+            **super().diagnostics(),
+            "last_known_mode": self._last_known_mode,
+            "pending_mode": self._pending_mode,
+            "last_reported_mode": self._last_reported_mode,
+            "capabilities": {
+                **self.shape,
+                "hk_to_ha_target": {
+                    str(target): mode for target, mode in self._hk_to_ha_target.items()
+                },
+            },
+            "values": {char.display_name: char.value for char in self._synced_chars()},
+            "action_dwell": self._action_dwell,
+            "action_hysteresis": round(self.action_hysteresis, 3),
+            "actions_damped": self.actions_damped,
+        }
+
+    @callback
+    @pyhap_callback  # type: ignore[untyped-decorator]
+    @override
+    def run(self) -> None:
+        """Follow the entity and join the fleet totals once the bridge starts."""
+        super().run()
+        self._observe_state(self.hass.states.get(self.entity_id))
+
+    @callback
+    @override
+    def async_stop(self) -> None:
+        """Cancel a held action and leave the fleet totals."""
+        self._release_held_action()
+        fleet: FleetActions | None = self.hass.data.get(DOMAIN, {}).get(DATA_FLEET)
+        if fleet is not None:
+            fleet.async_withdraw(self.entity_id, self)
+        super().async_stop()
+
+    def _track_temperature_jitter(self, state: State) -> None:
+        """Follow how much the current temperature moves between reports."""
+        if (
+            current := as_float(state.attributes.get(ATTR_CURRENT_TEMPERATURE))
+        ) is None:
+            return
+        current_hk = self._temperature_to_homekit(current)
+        actions = self._actions
+        if actions.last_current_temp is not None:
+            actions.temp_jitter += JITTER_SMOOTHING * (
+                abs(current_hk - actions.last_current_temp) - actions.temp_jitter
+            )
+        actions.last_current_temp = current_hk
+
+    @property
+    def action_hysteresis(self) -> float:
+        """Return the hysteresis band, widened for noisy sensors when damping."""
+        if not self._action_dwell:
+            return ACTION_HYSTERESIS
+        return min(
+            MAX_ACTION_HYSTERESIS, max(ACTION_HYSTERESIS, 2 * self._actions.temp_jitter)
+        )
 
     def _derive_action(self, state: State, mode: HVACMode | None) -> HVACAction:
-        """Derive heating or cooling when an integration omits hvac_action."""
+        """Derive heating or cooling when an integration omits hvac_action.
+
+        An action starts once the temperature passes the setpoint by the
+        hysteresis band. With a dwell time set, it continues until the
+        temperature is back at the setpoint.
+        """
+        action = self._derive_action_from_setpoints(state, mode)
+        self._actions.derived_action = action
+        return action
+
+    def _derive_action_from_setpoints(
+        self, state: State, mode: HVACMode | None
+    ) -> HVACAction:
+        """Return the action the setpoints call for, given the previous one."""
         current_temp = as_float(state.attributes.get(ATTR_CURRENT_TEMPERATURE))
         if current_temp is None or mode is None:
             return HVACAction.IDLE
@@ -562,16 +862,18 @@ class HeaterCooler(HomeKitClimateAccessory):
             return HVACAction.IDLE
 
         current_hk = self._temperature_to_homekit(current_temp)
+        hysteresis = self.action_hysteresis
+        derived_action = self._actions.derived_action if self._action_dwell else None
+        cool_margin = 0 if derived_action == HVACAction.COOLING else hysteresis
+        heat_margin = 0 if derived_action == HVACAction.HEATING else hysteresis
         if (
             cool_above is not None
-            and current_hk
-            > self._temperature_to_homekit(cool_above) + ACTION_HYSTERESIS
+            and current_hk > self._temperature_to_homekit(cool_above) + cool_margin
         ):
             return HVACAction.COOLING
         if (
             heat_below is not None
-            and current_hk
-            < self._temperature_to_homekit(heat_below) - ACTION_HYSTERESIS
+            and current_hk < self._temperature_to_homekit(heat_below) - heat_margin
         ):
             return HVACAction.HEATING
         return HVACAction.IDLE
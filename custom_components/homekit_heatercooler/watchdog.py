@@ -0,0 +1,138 @@
+"""Opt-in timing of the integration's event-loop work."""
+
+from __future__ import annotations
+
+from asyncio import TimerHandle
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+import logging
+from time import perf_counter
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DATA_WATCHDOG, DOMAIN, SIGNAL_LOOP_LAG_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+# The loop is sampled this often, and the worst lag of each window is reported.
+LAG_SAMPLE_INTERVAL = 1.0
+LAG_SAMPLES_PER_REPORT = 10
+
+
+@dataclass
+class SlowCall:
+    """Calls of one kind for one entity that went over the threshold."""
+
+    count: int
+    worst: float
+
+
+class Watchdog:
+    """Time the integration's callbacks and sample event-loop lag.
+
+    Each call site and entity that goes over the threshold is logged once,
+    then counted, so a persistently slow entity cannot flood the log.
+    """
+
+    def __init__(self, hass: HomeAssistant, threshold: float) -> None:
+        """Initialize a watchdog with a threshold in seconds."""
+        self._hass = hass
+        self.threshold = threshold
+        self.slow_calls: dict[tuple[str, str | None], SlowCall] = {}
+        self.loop_lag: float | None = None
+        self._window_lag = 0.0
+        self._samples = 0
+        self._expected = 0.0
+        self._handle: TimerHandle | None = None
+
+    @contextmanager
+    def timed(self, name: str, entity_id: str | None = None) -> Iterator[None]:
+        """Time a block and note it if it goes over the threshold."""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            if (elapsed := perf_counter() - started) > self.threshold:
+                self._note_slow_call(name, entity_id, elapsed)
+
+    def _note_slow_call(self, name: str, entity_id: str | None, elapsed: float) -> None:
+        """Count a slow call, logging the first for its call site and entity."""
+        if (slow := self.slow_calls.get((name, entity_id))) is not None:
+            slow.count += 1
+            slow.worst = max(slow.worst, elapsed)
+            return
+        self.slow_calls[name, entity_id] = SlowCall(1, elapsed)
+        _LOGGER.warning(
+            "%s took %.1f ms for %s, over the %.1f ms watchdog threshold",
+            name,
+            elapsed * 1000,
+            entity_id or "the integration",
+            self.threshold * 1000,
+        )
+
+    @callback
+    def async_start(self) -> None:
+        """Start sampling event-loop lag until Home Assistant stops."""
+        self._schedule_sample()
+        self._hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @callback
+    def _async_stop(self, _event: Event) -> None:
+        """Stop sampling as Home Assistant stops."""
+        self.async_stop()
+
+    def _schedule_sample(self) -> None:
+        """Schedule the next lag sample."""
+        loop = self._hass.loop
+        self._expected = loop.time() + LAG_SAMPLE_INTERVAL
+        self._handle = loop.call_at(self._expected, self._sample)
+
+    def _sample(self) -> None:
+        """Measure how late this callback ran, reporting each window's worst."""
+        self._window_lag = max(
+            self._window_lag, self._hass.loop.time() - self._expected
+        )
+        self._samples += 1
+        if self._samples >= LAG_SAMPLES_PER_REPORT:
+            self.loop_lag = self._window_lag
+            self._window_lag = 0.0
+            self._samples = 0
+            async_dispatcher_send(self._hass, SIGNAL_LOOP_LAG_UPDATED)
+        self._schedule_sample()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the threshold, loop lag and slow calls for diagnostics."""
+        return {
+            "threshold": self.threshold,
+            "loop_lag": self.loop_lag,
+            "slow_calls": [
+                {
+                    "name": name,
+                    "entity_id": entity_id,
+                    "count": slow.count,
+                    "worst": round(slow.worst, 6),
+                }
+                for (name, entity_id), slow in self.slow_calls.items()
+            ],
+        }
+
+
+def watch(
+    hass: HomeAssistant, name: str, entity_id: str | None = None
+) -> AbstractContextManager[None]:
+    """Time a block if the watchdog is enabled."""
+    watchdog: Watchdog | None = hass.data.get(DOMAIN, {}).get(DATA_WATCHDOG)
+    if watchdog is None:
+        return nullcontext()
+    return watchdog.timed(name, entity_id)
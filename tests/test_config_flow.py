@@ -7,6 +7,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.homekit_heatercooler.config_flow import _normalize_input
 from custom_components.homekit_heatercooler.const import (
     CONF_FAN_LANE,
+    CONF_INCLUDE_AREAS,
     DEFAULT_FAN_LANE,
     DOMAIN,
     FAN_LANE_AUTO,
@@ -101,3 +102,13 @@ def test_normalize_input_invalid_fan_lane_falls_back() -> None:
     assert (
         _normalize_input({CONF_INCLUDE_ENTITIES: []})[CONF_FAN_LANE] == DEFAULT_FAN_LANE
     )
+
+
+def test_normalize_input_keeps_every_rule_kind() -> None:
+    """Rule lists are normalised like entity lists and always present."""
+    normalized = _normalize_input(
+        {CONF_INCLUDE_AREAS: ["office", "lounge", "office"], CONF_FAN_LANE: None}
+    )
+    assert normalized[CONF_INCLUDE_AREAS] == ["lounge", "office"]
+    assert normalized[CONF_INCLUDE_ENTITIES] == []
+    assert normalized[CONF_EXCLUDE_ENTITIES] == []
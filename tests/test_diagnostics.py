@@ -0,0 +1,81 @@
+"""Tests for config-entry diagnostics."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homekit_heatercooler.const import (
+    DATA_BRIDGE_PLAN,
+    DOMAIN,
+    FAN_LANE_AUTO,
+)
+from custom_components.homekit_heatercooler.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from homeassistant.components.climate import ATTR_HVAC_MODES, HVACMode
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entityfilter import (
+    CONF_EXCLUDE_ENTITIES,
+    CONF_INCLUDE_ENTITIES,
+)
+from homeassistant.helpers.json import json_bytes
+from tests.common import ENTITY_ID, set_climate
+
+
+async def test_diagnostics_give_each_entity_a_reason(hass: HomeAssistant) -> None:
+    """The routing table explains every selected entity and serializes."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    hass.states.async_set("sensor.not_climate", "1")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_INCLUDE_ENTITIES: [
+                ENTITY_ID,
+                "climate.missing",
+                "climate.excluded",
+                "sensor.not_climate",
+            ],
+            CONF_EXCLUDE_ENTITIES: ["climate.excluded", "climate.never_selected"],
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert {
+        entity_id: route["reason"]
+        for entity_id, route in diagnostics["routing_table"].items()
+    } == {
+        ENTITY_ID: "patched",
+        "climate.excluded": "excluded",
+        "climate.missing": "missing",
+        "sensor.not_climate": "non_climate",
+    }
+    assert diagnostics["patch_state"]["fan_lane"] == FAN_LANE_AUTO
+    assert diagnostics["patch_state"]["exclude_entities"] == [
+        "climate.excluded",
+        "climate.never_selected",
+    ]
+    json_bytes(diagnostics)
+
+
+async def test_diagnostics_reuse_the_bridge_plan(hass: HomeAssistant) -> None:
+    """The bridge plan is built once and rebuilt only after routing changes."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_INCLUDE_ENTITIES: [ENTITY_ID]})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await async_get_config_entry_diagnostics(hass, entry)
+    plan = hass.data[DOMAIN][DATA_BRIDGE_PLAN]
+    await async_get_config_entry_diagnostics(hass, entry)
+    assert hass.data[DOMAIN][DATA_BRIDGE_PLAN] is plan
+
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_INCLUDE_ENTITIES: [ENTITY_ID, "climate.other"]}
+    )
+    await hass.async_block_till_done()
+    assert DATA_BRIDGE_PLAN not in hass.data[DOMAIN]
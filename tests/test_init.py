@@ -7,6 +7,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.homekit_heatercooler.const import (
     DATA_PATCH_STATE,
     DATA_PATCH_STATUS,
+    DATA_ROUTING_TABLE,
     DOMAIN,
 )
 from homeassistant.components.climate import ATTR_FAN_MODES, ATTR_HVAC_MODES, HVACMode
@@ -65,3 +66,28 @@ async def test_setup_survives_malformed_target_entity(hass: HomeAssistant) -> No
     status = hass.data[DOMAIN][DATA_PATCH_STATUS]
     assert "climate.broken" in status["unsupported_entities"]
     assert "climate.broken" not in status["patched_entities"]
+
+
+async def test_state_changes_reclassify_only_the_changed_entity(
+    hass: HomeAssistant,
+) -> None:
+    """A state change republishes the status only when its list changes."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_INCLUDE_ENTITIES: [ENTITY_ID]})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    status = hass.data[DOMAIN][DATA_PATCH_STATUS]
+    assert status["patched_entities"] == [ENTITY_ID]
+
+    set_climate(hass, HVACMode.OFF, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    await hass.async_block_till_done()
+    assert hass.data[DOMAIN][DATA_PATCH_STATUS] is status
+
+    hass.states.async_set(ENTITY_ID, HVACMode.COOL, {ATTR_SUPPORTED_FEATURES: None})
+    await hass.async_block_till_done()
+    status = hass.data[DOMAIN][DATA_PATCH_STATUS]
+    assert status["unsupported_entities"] == [ENTITY_ID]
+    assert status["patched_entities"] == []
+    routing_table = hass.data[DOMAIN][DATA_ROUTING_TABLE]
+    assert routing_table[ENTITY_ID]["reason"] == "unsupported"
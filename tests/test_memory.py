@@ -0,0 +1,89 @@
+"""Tests for the memory footprint report."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import tracemalloc
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.homekit_heatercooler.memory import (
+    TRACE_TIMEOUT,
+    MemoryTracker,
+    accessory_footprints,
+    footprint,
+)
+from custom_components.homekit_heatercooler.type_heatercooler import HeaterCooler
+from homeassistant.components.climate import ATTR_HVAC_MODES, HVACMode
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from tests.common import ENTITY_ID, set_climate
+
+
+def test_footprint_stops_at_the_boundary() -> None:
+    """Objects in the boundary are not charged to the root."""
+    shared = list(range(1000))
+    root = {"own": [1, 2, 3], "shared": shared}
+
+    assert footprint(root) > footprint(root, (shared,)) + 1000
+
+
+async def test_accessory_footprints_group_by_profile(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Accessories with the same HAP shape share a capability profile."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    accessories = [
+        HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, aid, {}) for aid in (2, 3)
+    ]
+
+    report = accessory_footprints(accessories)
+
+    assert all(entry["bytes"] > 0 for entry in report["accessories"])
+    (profile,) = report["profiles"].values()
+    assert profile["accessories"] == 2
+    assert profile["bytes"] == sum(entry["bytes"] for entry in report["accessories"])
+
+
+async def test_memory_tracker_reports_growth(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A second snapshot reports what this package allocated since the first."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    tracker = MemoryTracker(hass)
+    try:
+        first = tracker.take()
+        assert first["growth"] is None
+        accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+        second = tracker.take()
+    finally:
+        tracker.stop()
+
+    assert accessory.char_active is not None
+    assert second["growth"]["bytes"] > 0
+    assert second["growth"]["lines"]
+
+
+@pytest.mark.parametrize("stopped_by", ["timeout", "home_assistant"])
+async def test_memory_tracker_stops_tracing_by_itself(
+    hass: HomeAssistant, stopped_by: str
+) -> None:
+    """Tracing ends after the timeout or with Home Assistant."""
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc was started outside the tracker")
+    tracker = MemoryTracker(hass)
+    await tracker.async_take()
+    assert tracemalloc.is_tracing()
+
+    if stopped_by == "timeout":
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=TRACE_TIMEOUT + 1)
+        )
+    else:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert not tracemalloc.is_tracing()
+    tracker.async_stop()
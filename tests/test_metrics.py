@@ -0,0 +1,134 @@
+"""Tests for fixed-bucket metrics and write latency."""
+
+from __future__ import annotations
+
+import asyncio
+
+from pyhap.accessory import get_topic
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.homekit_heatercooler.metrics import Histogram
+from custom_components.homekit_heatercooler.type_heatercooler import (
+    CHAR_COOLING_THRESHOLD_TEMPERATURE,
+    HeaterCooler,
+)
+from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_HVAC_MODES,
+    ATTR_TEMPERATURE,
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_TEMPERATURE,
+    HVACMode,
+)
+from homeassistant.components.homekit.accessories import HomeDriver
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from tests.common import ENTITY_ID, set_climate
+
+
+def test_histogram_percentiles_use_bucket_bounds() -> None:
+    """Percentiles report the upper bound of the bucket they fall in."""
+    histogram = Histogram((0.1, 1.0))
+    assert histogram.percentile(0.5) is None
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.percentile(0.5) == 0.1
+    assert histogram.percentile(0.75) == 1.0
+    assert histogram.percentile(0.99) is None
+    other = Histogram((0.1, 1.0))
+    other.observe(0.5)
+    histogram.merge(other)
+    assert histogram.as_dict()["buckets"] == {"0.1": 2, "1.0": 2, "+Inf": 1}
+
+
+async def test_write_latency_completes_on_confirmation(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """The confirm and total intervals end when the entity reports the write."""
+    attributes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]}
+    set_climate(hass, HVACMode.COOL, **attributes)
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    async_mock_service(hass, CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE)
+
+    accessory._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 20})
+    await hass.async_block_till_done()
+    latency = accessory.write_latency
+    assert (latency.queue.count, latency.call.count, latency.total.count) == (1, 1, 0)
+
+    set_climate(hass, HVACMode.COOL, **attributes, **{ATTR_TEMPERATURE: 20})
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    accessory.async_update_state(state)
+    assert (latency.confirm.count, latency.total.count) == (1, 1)
+    assert latency.unconfirmed == 0
+
+
+async def test_write_queue_gauges_and_failures(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Batches behind a slow call are queued, and a failed call re-syncs."""
+    attributes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]}
+    set_climate(hass, HVACMode.COOL, **attributes)
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    release = asyncio.Event()
+
+    async def _slow_then_failing(call: ServiceCall) -> None:
+        if call.data[ATTR_TEMPERATURE] == 20:
+            await release.wait()
+            return
+        raise HomeAssistantError("rejected")
+
+    hass.services.async_register(
+        CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE, _slow_then_failing
+    )
+
+    accessory._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 20})
+    accessory._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 21})
+    await asyncio.sleep(0)
+    stats = accessory.write_queue
+    assert (stats.queued, stats.in_flight) == (1, 1)
+
+    release.set()
+    await hass.async_block_till_done()
+    assert stats.as_dict() | {"max_lock_wait": None} == {
+        "queued": 0,
+        "in_flight": 0,
+        "max_lock_wait": None,
+        "batches": 2,
+        "failures": 1,
+        "resyncs": 1,
+    }
+    assert stats.max_lock_wait > 0
+
+
+async def test_notifications_count_changed_values_only(
+    hass: HomeAssistant, hk_driver: HomeDriver
+) -> None:
+    """Only subscribed updates that change a characteristic count as HAP events."""
+    attributes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]}
+    set_climate(hass, HVACMode.COOL, **attributes, **{ATTR_CURRENT_TEMPERATURE: 21})
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    set_climate(hass, HVACMode.COOL, **attributes, **{ATTR_CURRENT_TEMPERATURE: 22})
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    accessory.async_update_state(state)
+    assert "CurrentTemperature" not in accessory.notifications.as_dict()
+
+    topic = get_topic(
+        accessory.aid, accessory.iid_manager.get_iid(accessory.char_current_temp)
+    )
+    hk_driver.topics[topic] = {("127.0.0.1", 51826)}
+    before = accessory.notifications.as_dict()
+
+    for current in (24, 24, 25):
+        set_climate(
+            hass, HVACMode.COOL, **attributes, **{ATTR_CURRENT_TEMPERATURE: current}
+        )
+        state = hass.states.get(ENTITY_ID)
+        assert state is not None
+        accessory.async_update_state(state)
+
+    counts = accessory.notifications.as_dict()
+    assert counts["CurrentTemperature"] - before.get("CurrentTemperature", 0) == 2
+    assert accessory.notifications.per_minute()["CurrentTemperature"] > 0
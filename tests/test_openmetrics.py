@@ -0,0 +1,99 @@
+"""Tests for the OpenMetrics exposition."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.homekit_heatercooler.const import (
+    DATA_PATCH_STATE,
+    DATA_ROUTING_TABLE,
+    DOMAIN,
+)
+from custom_components.homekit_heatercooler.openmetrics import (
+    RENDER_INTERVAL,
+    cached_metrics,
+    render_metrics,
+)
+from custom_components.homekit_heatercooler.type_heatercooler import HeaterCooler
+from homeassistant.components.climate import ATTR_HVAC_MODES, HVACMode
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entityfilter import CONF_INCLUDE_ENTITIES
+from tests.common import ENTITY_ID, set_climate
+
+
+async def test_render_metrics_sums_accessories_per_bridge(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Accessory counters and histograms are exposed per bridge."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    accessory.write_latency.call.observe(0.02)
+    accessory.write_queue.failures = 2
+    patch_state = SimpleNamespace(accessories=[accessory], failed_accessories={})
+
+    text = render_metrics(
+        {
+            DATA_PATCH_STATE: patch_state,
+            DATA_ROUTING_TABLE: {ENTITY_ID: {"reason": "patched", "bridges": []}},
+        }
+    )
+
+    bridge = str(getattr(hk_driver, "entry_id", None))
+    assert 'homekit_heatercooler_routed_entities{reason="patched"} 1' in text
+    assert (
+        "homekit_heatercooler_write_latency_seconds_bucket"
+        f'{{bridge="{bridge}",interval="call",le="0.025"}} 1'
+    ) in text
+    assert (
+        "homekit_heatercooler_write_latency_seconds_bucket"
+        f'{{bridge="{bridge}",interval="call",le="+Inf"}} 1'
+    ) in text
+    assert f'homekit_heatercooler_write_failures_total{{bridge="{bridge}"}} 2' in text
+    assert text.endswith("# EOF\n")
+
+
+def test_cached_metrics_render_once_per_interval() -> None:
+    """Scrapes within the interval share one render."""
+    domain_data: dict[str, Any] = {
+        DATA_ROUTING_TABLE: {ENTITY_ID: {"reason": "patched", "bridges": []}}
+    }
+    with patch(
+        "custom_components.homekit_heatercooler.openmetrics.monotonic",
+        return_value=100.0,
+    ) as clock:
+        first = cached_metrics(domain_data)
+        domain_data[DATA_ROUTING_TABLE] = {}
+        assert cached_metrics(domain_data) is first
+        clock.return_value += RENDER_INTERVAL
+        assert 'reason="patched"' not in cached_metrics(domain_data)
+
+
+async def test_metrics_view_requires_auth(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    hass_client_no_auth: ClientSessionGenerator,
+) -> None:
+    """The metrics are only served to an authenticated client."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_INCLUDE_ENTITIES: [ENTITY_ID]})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    anonymous = await hass_client_no_auth()
+    assert (
+        await anonymous.get(f"/api/{DOMAIN}/metrics")
+    ).status == HTTPStatus.UNAUTHORIZED
+
+    response = await (await hass_client()).get(f"/api/{DOMAIN}/metrics")
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+    assert 'homekit_heatercooler_routed_entities{reason="patched"} 1' in (
+        await response.text()
+    )
@@ -9,9 +9,11 @@ from unittest.mock import patch
 
 import pytest
 
+from custom_components.homekit_heatercooler.bridges import BridgeRoute
 from custom_components.homekit_heatercooler.const import (
     DATA_PATCH_STATE,
     DOMAIN,
+    FAN_LANE_AUTO,
     FAN_LANE_MANUAL,
     TYPE_HEATER_COOLER,
 )
@@ -20,7 +22,9 @@ from custom_components.homekit_heatercooler.patcher import (
     _get_accessory_params,
     _should_patch_entity,
     apply_patch,
+    capability_fingerprint,
     native_heatercooler_available,
+    prewarm,
     remove_patch,
     supports_heatercooler,
 )
@@ -33,6 +37,7 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.components.homekit import accessories as homekit_accessories
+from homeassistant.components.homekit.accessories import HomeDriver
 from homeassistant.const import ATTR_SUPPORTED_FEATURES
 from homeassistant.core import HomeAssistant, State
 from tests.common import ENTITY_ID, set_climate
@@ -151,6 +156,22 @@ def test_real_get_accessory_matches_expected_signature() -> None:
     )
 
 
+async def test_prewarm_probes_once_for_apply_patch(hass: HomeAssistant) -> None:
+    """After the setup prewarm, installing the patch inspects nothing."""
+    timings = prewarm()
+    assert timings.params == EXPECTED_GET_ACCESSORY_PARAMS
+    assert timings.as_dict()["import_seconds"] >= 0
+    with patch(
+        "custom_components.homekit_heatercooler.patcher._get_accessory_params"
+    ) as probe:
+        apply_patch(hass, {ENTITY_ID}, set())
+        try:
+            assert hass.data[DOMAIN][DATA_PATCH_STATE]
+            probe.assert_not_called()
+        finally:
+            remove_patch(hass)
+
+
 async def test_patch_routes_included_climate_and_restores(
     hass: HomeAssistant, hk_driver: object
 ) -> None:
@@ -312,3 +333,172 @@ async def test_patch_falls_back_to_default_on_error(
         )
     finally:
         remove_patch(hass)
+
+
+async def test_tracking_failure_keeps_the_built_accessory(
+    hass: HomeAssistant, hk_driver: object, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A hook failing after a good build is logged, not counted as a failure."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    apply_patch(hass, {ENTITY_ID}, set())
+    try:
+        state = hass.states.get(ENTITY_ID)
+        caplog.set_level(logging.ERROR)
+        with patch(
+            "custom_components.homekit_heatercooler.patcher.NotificationScheduler",
+            side_effect=RuntimeError("boom"),
+        ):
+            accessory = homekit_accessories.get_accessory(hass, hk_driver, state, 2, {})
+        assert type(accessory).__name__ == "HeaterCooler"
+        assert hass.data[DOMAIN][DATA_PATCH_STATE].failed_accessories == {}
+        assert "Tracking the HeaterCooler for" in caplog.text
+    finally:
+        remove_patch(hass)
+
+
+async def test_patch_skips_known_failures_until_capabilities_change(
+    hass: HomeAssistant, hk_driver: object, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A failing build is logged once, then skipped until its shape changes."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    apply_patch(hass, {ENTITY_ID}, set())
+    builds: list[object] = []
+
+    def _raise(*args: object, **kwargs: object) -> None:
+        builds.append(args)
+        raise RuntimeError("boom")
+
+    try:
+        caplog.clear()
+        caplog.set_level(logging.ERROR)
+        with patch(
+            "custom_components.homekit_heatercooler.type_heatercooler.HeaterCooler",
+            _raise,
+        ):
+            for _ in range(3):
+                accessory = homekit_accessories.get_accessory(
+                    hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+                )
+                assert type(accessory).__name__ == "Thermostat"
+            assert len(builds) == 1
+            assert sum("mapping failed" in r.getMessage() for r in caplog.records) == 1
+            failure = hass.data[DOMAIN][DATA_PATCH_STATE].failed_accessories[
+                ENTITY_ID, FAN_LANE_AUTO
+            ]
+            assert failure.count == 3
+            assert failure.fingerprint == capability_fingerprint(
+                hass.states.get(ENTITY_ID)
+            )
+
+            # New capabilities are a new build, so it is attempted again.
+            set_climate(
+                hass,
+                HVACMode.COOL,
+                **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.HEAT, HVACMode.OFF]},
+            )
+            homekit_accessories.get_accessory(
+                hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+            )
+            assert len(builds) == 2
+
+        accessory = homekit_accessories.get_accessory(
+            hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+        )
+        assert type(accessory).__name__ == "Thermostat"
+        set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL]})
+        accessory = homekit_accessories.get_accessory(
+            hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+        )
+        assert type(accessory).__name__ == "HeaterCooler"
+        assert not hass.data[DOMAIN][DATA_PATCH_STATE].failed_accessories
+    finally:
+        remove_patch(hass)
+
+
+async def test_known_failure_is_kept_per_fan_lane(
+    hass: HomeAssistant, hk_driver: HomeDriver
+) -> None:
+    """A build failing on one bridge's lane is still tried on another lane."""
+    set_climate(
+        hass,
+        HVACMode.COOL,
+        **{
+            ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF],
+            ATTR_FAN_MODES: SEVEN_FAN_MODES,
+        },
+    )
+    bridges = {
+        "manual": BridgeRoute(
+            "manual", "Manual", FAN_LANE_MANUAL, frozenset({ENTITY_ID})
+        ),
+        "auto": BridgeRoute("auto", "Auto", FAN_LANE_AUTO, frozenset({ENTITY_ID})),
+    }
+    apply_patch(hass, {ENTITY_ID}, set(), fan_lane=FAN_LANE_AUTO, bridges=bridges)
+    builds: list[object] = []
+
+    def _raise(*args: object, **kwargs: object) -> None:
+        builds.append(args)
+        raise RuntimeError("boom")
+
+    try:
+        with patch(
+            "custom_components.homekit_heatercooler.type_heatercooler.HeaterCooler",
+            _raise,
+        ):
+            hk_driver.entry_id = "manual"
+            homekit_accessories.get_accessory(
+                hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+            )
+            hk_driver.entry_id = "auto"
+            homekit_accessories.get_accessory(
+                hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+            )
+        assert len(builds) == 2
+        assert set(hass.data[DOMAIN][DATA_PATCH_STATE].failed_accessories) == {
+            (ENTITY_ID, FAN_LANE_MANUAL),
+            (ENTITY_ID, FAN_LANE_AUTO),
+        }
+    finally:
+        remove_patch(hass)
+
+
+async def test_patch_routes_each_bridge_from_its_own_table(
+    hass: HomeAssistant, hk_driver: HomeDriver
+) -> None:
+    """A known bridge uses its own table and lane; unknown drivers use the global."""
+    set_climate(
+        hass,
+        HVACMode.COOL,
+        **{
+            ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF],
+            ATTR_FAN_MODES: SEVEN_FAN_MODES,
+        },
+    )
+    bridges = {
+        "manual": BridgeRoute(
+            "manual", "Manual", FAN_LANE_MANUAL, frozenset({ENTITY_ID})
+        ),
+        "empty": BridgeRoute("empty", "Empty", FAN_LANE_AUTO, frozenset()),
+    }
+    apply_patch(hass, {ENTITY_ID}, set(), fan_lane=FAN_LANE_AUTO, bridges=bridges)
+    try:
+        hk_driver.entry_id = "manual"
+        accessory = homekit_accessories.get_accessory(
+            hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+        )
+        assert accessory.ordered_fan_speeds == ["low", "mid", "high"]
+
+        hk_driver.entry_id = "empty"
+        accessory = homekit_accessories.get_accessory(
+            hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+        )
+        assert type(accessory).__name__ == "Thermostat"
+
+        hk_driver.entry_id = "unknown"
+        accessory = homekit_accessories.get_accessory(
+            hass, hk_driver, hass.states.get(ENTITY_ID), 2, {}
+        )
+        assert type(accessory).__name__ == "HeaterCooler"
+        assert accessory.ordered_fan_speeds != ["low", "mid", "high"]
+    finally:
+        remove_patch(hass)
@@ -0,0 +1,141 @@
+"""Tests for the bridge capacity planner."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homekit_heatercooler.bridges import bridge_routes
+from custom_components.homekit_heatercooler.const import FAN_LANE_AUTO
+from custom_components.homekit_heatercooler.planner import (
+    _compile,
+    _move_out,
+    _only_changes,
+    apply_bridge_plan,
+    build_bridge_plan,
+)
+from homeassistant.components.climate import ATTR_FAN_MODES, ATTR_HVAC_MODES, HVACMode
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import ATTR_SUPPORTED_FEATURES
+from homeassistant.core import HomeAssistant
+
+CLIMATES = [f"climate.unit{index}" for index in range(4)]
+ATTRIBUTES = {
+    ATTR_SUPPORTED_FEATURES: 8,
+    ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF],
+    ATTR_FAN_MODES: ["Low", "High"],
+}
+
+
+def _bridge(hass: HomeAssistant, name: str, entity_filter: dict) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain="homekit",
+        title=name,
+        data={"name": name, "port": 21064},
+        options={"mode": "bridge", "filter": entity_filter},
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def test_plan_balances_heatercoolers_and_applies_filters(
+    hass: HomeAssistant,
+) -> None:
+    """Crowded climates are spread out, and applying rewrites both filters."""
+    for entity_id in CLIMATES:
+        hass.states.async_set(entity_id, HVACMode.COOL, ATTRIBUTES)
+    hass.states.async_set("sensor.outdoor", "20")
+    crowded = _bridge(hass, "Crowded", {"include_entities": CLIMATES})
+    empty = _bridge(hass, "Empty", {"include_domains": ["sensor"]})
+    routes = bridge_routes(hass, set(CLIMATES), FAN_LANE_AUTO, {})
+
+    plan = build_bridge_plan(hass, routes)
+
+    assert plan.current[crowded.entry_id].heatercoolers == tuple(CLIMATES)
+    assert plan.current[empty.entry_id].accessories == 2
+    assert plan.current[crowded.entry_id].estimated_bytes > (
+        plan.current[empty.entry_id].estimated_bytes
+    )
+    current, proposed = plan.current, plan.proposed
+    # The sensor already weighs on the second bridge, so one move is enough.
+    assert len(proposed[crowded.entry_id].heatercoolers) == 3
+    assert len(proposed[empty.entry_id].heatercoolers) == 1
+    assert abs(
+        proposed[crowded.entry_id].estimated_bytes
+        - proposed[empty.entry_id].estimated_bytes
+    ) < abs(
+        current[crowded.entry_id].estimated_bytes
+        - current[empty.entry_id].estimated_bytes
+    )
+    assert all(
+        move == (crowded.entry_id, empty.entry_id) for move in plan.moves.values()
+    )
+    assert plan.as_dict()["moves"]
+
+    result = apply_bridge_plan(hass, plan)
+
+    assert sorted(result["applied"]) == sorted(plan.moves)
+    assert result["skipped"] == []
+    crowded_filter = crowded.options["filter"]
+    empty_filter = empty.options["filter"]
+    assert set(crowded_filter["include_entities"]) == set(CLIMATES) - set(plan.moves)
+    assert set(empty_filter["include_entities"]) == set(plan.moves)
+    assert empty_filter["include_domains"] == ["sensor"]
+
+
+async def test_plan_leaves_shared_climates_in_place(hass: HomeAssistant) -> None:
+    """A climate routed on two bridges is pinned rather than moved."""
+    hass.states.async_set(CLIMATES[0], HVACMode.COOL, ATTRIBUTES)
+    first = _bridge(hass, "First", {"include_domains": ["climate"]})
+    second = _bridge(hass, "Second", {"include_entities": [CLIMATES[0]]})
+    routes = bridge_routes(hass, {CLIMATES[0]}, FAN_LANE_AUTO, {})
+
+    plan = build_bridge_plan(hass, routes)
+
+    assert plan.pinned == (CLIMATES[0],)
+    assert plan.moves == {}
+    assert plan.proposed[first.entry_id].heatercoolers == (CLIMATES[0],)
+    assert plan.proposed[second.entry_id].heatercoolers == (CLIMATES[0],)
+
+
+async def test_apply_leaves_yaml_bridges_alone(hass: HomeAssistant) -> None:
+    """Moves to or from a bridge imported from YAML are reported, not written."""
+    for entity_id in CLIMATES:
+        hass.states.async_set(entity_id, HVACMode.COOL, ATTRIBUTES)
+    crowded = MockConfigEntry(
+        domain="homekit",
+        title="Crowded",
+        source=SOURCE_IMPORT,
+        data={"name": "Crowded", "port": 21064},
+        options={"mode": "bridge", "filter": {"include_entities": CLIMATES}},
+    )
+    crowded.add_to_hass(hass)
+    empty = _bridge(hass, "Empty", {"include_domains": ["sensor"]})
+    routes = bridge_routes(hass, set(CLIMATES), FAN_LANE_AUTO, {})
+    plan = build_bridge_plan(hass, routes)
+    assert plan.moves
+
+    result = apply_bridge_plan(hass, plan)
+
+    assert result["applied"] == []
+    assert result["managed_by_yaml"] == sorted(plan.moves)
+    assert crowded.options["filter"] == {"include_entities": CLIMATES}
+    assert empty.options["filter"] == {"include_domains": ["sensor"]}
+
+
+def test_only_a_mode_switch_can_change_other_entities() -> None:
+    """Listing or unlisting one entity is only checked further on a mode switch."""
+    entity_ids = [*CLIMATES, "sensor.outdoor"]
+    moved = CLIMATES[0]
+
+    listed = {"include_entities": CLIMATES[:2], "include_domains": ["sensor"]}
+    after = _compile(_move_out(listed, moved))
+    assert _only_changes(_compile(listed), after, moved, entity_ids)
+
+    # Unlisting the only include turns the filter into one that admits all.
+    alone = {"include_entities": [moved]}
+    after = _compile(_move_out(alone, moved))
+    assert not _only_changes(_compile(alone), after, moved, entity_ids)
+
+    # Excluding from an empty filter still admits everything else.
+    after = _compile(_move_out({}, moved))
+    assert _only_changes(_compile({}), after, moved, entity_ids)
@@ -0,0 +1,50 @@
+"""Tests for the on-demand profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from pathlib import Path
+import pstats
+
+import pytest
+
+from custom_components.homekit_heatercooler import climate_util
+from custom_components.homekit_heatercooler.profiling import (
+    async_profile,
+    write_profile,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+
+def test_profile_keeps_only_the_integration_modules(tmp_path: Path) -> None:
+    """The pstats file and summary hold the profiled modules' functions only."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(10):
+        climate_util.as_float("21.5")
+    profiler.disable()
+
+    result = write_profile(profiler, tmp_path / "profile")
+
+    stats = pstats.Stats(result["pstats"])
+    assert {Path(filename).name for filename, _, _ in stats.stats} == {
+        "climate_util.py"
+    }
+    assert "as_float" in Path(result["summary"]).read_text(encoding="utf-8")
+    assert result["calls"] == 10
+
+
+async def test_profile_runs_one_at_a_time(hass: HomeAssistant, tmp_path: Path) -> None:
+    """A second profile is refused while one is running."""
+    hass.config.config_dir = str(tmp_path)
+    lock = asyncio.Lock()
+    first = hass.async_create_task(async_profile(hass, lock, 0.05))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HomeAssistantError):
+        await async_profile(hass, lock, 0.05)
+    result = await first
+    assert Path(result["pstats"]).exists()
+    assert Path(result["summary"]).exists()
@@ -0,0 +1,83 @@
+"""Tests for expedited polls after HomeKit writes."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.homekit_heatercooler.refresh import REFRESH_DELAY, PollRefresher
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_component import DATA_INSTANCES
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+POLLING = {"climate.office": True, "climate.lounge": True, "climate.pushed": False}
+
+
+def _climate_component(hass: HomeAssistant) -> None:
+    """Register stand-in climate entities that poll, push or use a coordinator."""
+    entities: dict[str, object] = {
+        entity_id: SimpleNamespace(should_poll=should_poll)
+        for entity_id, should_poll in POLLING.items()
+    }
+    entities["climate.coordinated"] = CoordinatorEntity(SimpleNamespace())
+    hass.data.setdefault(DATA_INSTANCES, {})["climate"] = SimpleNamespace(
+        get_entity=entities.get
+    )
+
+
+async def test_requests_are_coalesced_and_skip_pushing_entities(
+    hass: HomeAssistant,
+) -> None:
+    """Writes in one window become a single update_entity call."""
+    _climate_component(hass)
+    calls = async_mock_service(hass, "homeassistant", "update_entity")
+    refresher = PollRefresher(hass)
+
+    assert refresher.async_request("climate.office")
+    assert refresher.async_request("climate.lounge")
+    assert refresher.async_request("climate.coordinated")
+    assert not refresher.async_request("climate.pushed")
+    assert not refresher.async_request("climate.missing")
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=REFRESH_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data[ATTR_ENTITY_ID] == [
+        "climate.coordinated",
+        "climate.lounge",
+        "climate.office",
+    ]
+    assert refresher.as_dict() == {"requested": 3, "refreshed": 1}
+
+
+async def test_failed_poll_is_logged(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A failing update_entity call is logged instead of escaping the task."""
+    _climate_component(hass)
+
+    async def _fail(_call: ServiceCall) -> None:
+        raise HomeAssistantError("cloud unreachable")
+
+    hass.services.async_register("homeassistant", "update_entity", _fail)
+    refresher = PollRefresher(hass)
+    assert refresher.async_request("climate.office")
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=REFRESH_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert "Early poll of ['climate.office'] failed: cloud unreachable" in caplog.text
@@ -0,0 +1,73 @@
+"""Tests for the routing refresh log."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.homekit_heatercooler.routing_log import (
+    ROUTING_LOG_INTERVAL,
+    RoutingLog,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+INCLUDED = {f"climate.unit_{index}" for index in range(10)}
+
+
+def _info(caplog: pytest.LogCaptureFixture) -> list[str]:
+    """Return the INFO messages logged so far, clearing them."""
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.levelno == logging.INFO
+    ]
+    caplog.clear()
+    return messages
+
+
+async def test_refreshes_are_summarized_and_rate_limited(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Changes within the interval fold into one bounded summary."""
+    caplog.set_level(logging.INFO)
+    routing_log = RoutingLog(hass)
+
+    routing_log.async_record("entity", INCLUDED, set(), ["climate.unit_0"])
+    (loaded,) = _info(caplog)
+    assert "routing loaded" in loaded
+    assert "patched=1" in loaded
+    assert "climate.unit_0" not in loaded
+
+    routing_log.async_record("entity", INCLUDED, set(), ["climate.unit_0"])
+    routing_log.async_record("entity", INCLUDED, set(), sorted(INCLUDED))
+    routing_log.async_record("entity", INCLUDED, set(), sorted(INCLUDED))
+    assert _info(caplog) == []
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ROUTING_LOG_INTERVAL + 1)
+    )
+    await hass.async_block_till_done()
+
+    (changed,) = _info(caplog)
+    assert "patched=10, added=9, removed=0, refreshes=3" in changed
+    assert changed.endswith("(+4 more)")
+
+    routing_log.async_record("entity", INCLUDED, set(), sorted(INCLUDED))
+    assert _info(caplog) == []
+
+
+async def test_full_lists_are_logged_at_debug(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Every refresh keeps its full entity lists at DEBUG."""
+    caplog.set_level(logging.DEBUG)
+    RoutingLog(hass).async_record("entity", INCLUDED, set(), ["climate.unit_0"])
+
+    assert any(
+        record.levelno == logging.DEBUG and "climate.unit_9" in record.getMessage()
+        for record in caplog.records
+    )
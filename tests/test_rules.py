@@ -0,0 +1,130 @@
+"""Tests for registry-indexed selection rules."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homekit_heatercooler.const import (
+    CONF_INCLUDE_INTEGRATIONS,
+    DATA_PATCH_STATE,
+    DATA_RULE_INDEX_UNSUB,
+    DOMAIN,
+)
+from custom_components.homekit_heatercooler.rules import RuleIndex, SelectionRules
+from homeassistant.components.climate import ATTR_FAN_MODES, ATTR_HVAC_MODES, HVACMode
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+
+
+async def test_index_resolves_rules_and_follows_registry_updates(
+    hass: HomeAssistant,
+) -> None:
+    """Each rule kind resolves from the index, which tracks registry events."""
+    ent_reg = er.async_get(hass)
+    first = ent_reg.async_get_or_create("climate", "daikin", "unit1")
+    ent_reg.async_get_or_create("sensor", "daikin", "outdoor")
+    index = RuleIndex(hass)
+    changes: list[None] = []
+    unsubscribe = index.async_start(lambda: changes.append(None))
+
+    daikin = SelectionRules(integrations=frozenset({"daikin"}))
+    by_glob = SelectionRules(entity_globs=frozenset({"climate.daikin_*"}))
+    assert index.resolve(daikin) == {first.entity_id}
+    assert index.resolve(by_glob) == {first.entity_id}
+    # Globs match case-sensitively on every platform, like later updates do.
+    upper = SelectionRules(entity_globs=frozenset({"climate.DAIKIN_*"}))
+    assert index.resolve(upper) == set()
+
+    area = ar.async_get(hass).async_create("Office")
+    ent_reg.async_update_entity(first.entity_id, area_id=area.id, labels={"ac"})
+    second = ent_reg.async_get_or_create("climate", "daikin", "unit2")
+    await hass.async_block_till_done()
+
+    assert index.resolve(SelectionRules(areas=frozenset({area.id}))) == {
+        first.entity_id
+    }
+    assert index.resolve(SelectionRules(labels=frozenset({"ac"}))) == {first.entity_id}
+    # The cached glob picks up the new entity without a rescan.
+    assert index.resolve(by_glob) == {first.entity_id, second.entity_id}
+
+    ent_reg.async_remove(first.entity_id)
+    await hass.async_block_till_done()
+    assert index.resolve(daikin) == {second.entity_id}
+    assert index.resolve(SelectionRules(areas=frozenset({area.id}))) == set()
+    assert changes
+    unsubscribe()
+
+
+async def test_index_inherits_device_area_and_labels(hass: HomeAssistant) -> None:
+    """Climates follow their device's area and labels, including later moves."""
+    config_entry = MockConfigEntry(domain="daikin")
+    config_entry.add_to_hass(hass)
+    dev_reg = dr.async_get(hass)
+    device = dev_reg.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("daikin", "d1")}
+    )
+    entry = er.async_get(hass).async_get_or_create(
+        "climate", "daikin", "unit1", device_id=device.id
+    )
+    index = RuleIndex(hass)
+    unsubscribe = index.async_start(lambda: None)
+    assert index.resolve(SelectionRules(devices=frozenset({device.id}))) == {
+        entry.entity_id
+    }
+
+    area = ar.async_get(hass).async_create("Bedroom")
+    dev_reg.async_update_device(device.id, area_id=area.id, labels={"upstairs"})
+    await hass.async_block_till_done()
+
+    assert index.resolve(SelectionRules(areas=frozenset({area.id}))) == {
+        entry.entity_id
+    }
+    assert index.resolve(SelectionRules(labels=frozenset({"upstairs"}))) == {
+        entry.entity_id
+    }
+    unsubscribe()
+
+
+async def test_integration_rule_routes_entities_registered_later(
+    hass: HomeAssistant,
+) -> None:
+    """A new unit matching a rule is routed without touching the options."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_INCLUDE_INTEGRATIONS: ["daikin"]})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_PATCH_STATE not in hass.data[DOMAIN]
+
+    registered = er.async_get(hass).async_get_or_create("climate", "daikin", "unit1")
+    hass.states.async_set(
+        registered.entity_id,
+        HVACMode.COOL,
+        {
+            ATTR_SUPPORTED_FEATURES: 8,
+            ATTR_FAN_MODES: ["low", "high"],
+            ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF],
+        },
+    )
+    await hass.async_block_till_done()
+
+    patch_state = hass.data[DOMAIN][DATA_PATCH_STATE]
+    assert patch_state.include_entities == {registered.entity_id}
+
+
+async def test_rule_index_stops_with_home_assistant(hass: HomeAssistant) -> None:
+    """The registry listeners are removed when Home Assistant stops."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_INCLUDE_INTEGRATIONS: ["daikin"]})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert DATA_RULE_INDEX_UNSUB in hass.data[DOMAIN]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    assert DATA_RULE_INDEX_UNSUB not in hass.data[DOMAIN]
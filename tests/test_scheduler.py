@@ -0,0 +1,53 @@
+"""Tests for bridge-level pacing of accessory updates."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.homekit_heatercooler.scheduler import (
+    BURST_THRESHOLD,
+    SPREAD_WINDOW,
+    NotificationScheduler,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+
+class _Accessory:
+    """Counts the deferred updates the scheduler applies."""
+
+    def __init__(self) -> None:
+        self.synced = 0
+
+    def async_sync_deferred(self) -> None:
+        self.synced += 1
+
+
+async def test_burst_is_paced_and_merged(hass: HomeAssistant) -> None:
+    """Updates past the burst threshold are queued, merged and drained."""
+    scheduler = NotificationScheduler(hass)
+    accessories = [_Accessory() for _ in range(BURST_THRESHOLD + 5)]
+
+    applied_now = [
+        not scheduler.async_should_queue(accessory) for accessory in accessories
+    ]
+    assert applied_now == [True] * BURST_THRESHOLD + [False] * 5
+    assert scheduler.async_should_queue(accessories[-1])
+    assert scheduler.as_dict()["queued"] == 5
+    assert scheduler.as_dict()["merged"] == 1
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SPREAD_WINDOW / 2)
+    )
+    await hass.async_block_till_done()
+    assert 0 < sum(accessory.synced for accessory in accessories) < 5
+
+    for step in range(1, 30):
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=SPREAD_WINDOW / 2 + step / 10)
+        )
+        await hass.async_block_till_done()
+    assert [accessory.synced for accessory in accessories[BURST_THRESHOLD:]] == [1] * 5
+    assert scheduler.as_dict()["queued"] == 0
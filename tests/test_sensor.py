@@ -5,8 +5,15 @@ from __future__ import annotations
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.homekit_heatercooler.const import DATA_PATCH_STATUS, DOMAIN
-from homeassistant.components.climate import ATTR_HVAC_MODES, HVACMode
-from homeassistant.core import HomeAssistant
+from custom_components.homekit_heatercooler.type_heatercooler import HeaterCooler
+from homeassistant.components.climate import (
+    ATTR_HVAC_ACTION,
+    ATTR_HVAC_MODES,
+    HVACAction,
+    HVACMode,
+)
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_INCLUDE_ENTITIES
 from tests.common import ENTITY_ID, set_climate
@@ -47,10 +54,69 @@ async def test_sensor_reports_patch_diagnostics(hass: HomeAssistant) -> None:
     assert state.attributes["routing_mode"] == "bundled"
 
     # The attributes are the shared status verbatim, minus the count that
-    # native_value already carries. Asserting the whole set means a diagnostic
+    # native_value already carries and the per-bridge lists and failure
+    # details kept for diagnostics. Asserting the whole set means a diagnostic
     # cannot be added to the status and silently fail to surface.
     status = hass.data[DOMAIN][DATA_PATCH_STATUS]
+    summarized = {"patched_entities_count", "bridges", "failed_entities"}
     assert "patched_entities_count" not in state.attributes
     assert {
-        key: value for key, value in status.items() if key != "patched_entities_count"
+        key: value for key, value in status.items() if key not in summarized
     }.items() <= state.attributes.items()
+    assert state.attributes["failed_entities"] == sorted(status["failed_entities"])
+    for entry_id, bridge in status["bridges"].items():
+        assert state.attributes["bridges"][entry_id] == {
+            "name": bridge["name"],
+            "fan_lane": bridge["fan_lane"],
+            "patched_entities_count": bridge["patched_entities_count"],
+        }
+
+
+async def test_fleet_sensors_follow_action_changes(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Each action change moves one unit between the fleet totals."""
+    modes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]}
+    set_climate(hass, HVACMode.COOL, **modes, **{ATTR_HVAC_ACTION: HVACAction.COOLING})
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_INCLUDE_ENTITIES: [ENTITY_ID]})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    registry = er.async_get(hass)
+
+    def _units(action: str) -> str:
+        entity_id = registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_units_{action}"
+        )
+        assert entity_id
+        state = hass.states.get(entity_id)
+        assert state is not None
+        return state.state
+
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    await hass.async_block_till_done()
+    # Only a started accessory counts; one built and dropped never withdraws.
+    assert _units("cooling") == "0"
+    accessory.run()
+    await hass.async_block_till_done()
+    assert _units("cooling") == "1"
+
+    old_state = hass.states.get(ENTITY_ID)
+    hass.states.async_set(ENTITY_ID, STATE_UNAVAILABLE)
+    accessory.async_update_event_state_callback(
+        Event(
+            "state_changed",
+            {
+                "entity_id": ENTITY_ID,
+                "old_state": old_state,
+                "new_state": hass.states.get(ENTITY_ID),
+            },
+        )
+    )
+    await hass.async_block_till_done()
+    assert _units("cooling") == "0"
+    assert _units("unavailable") == "1"
+
+    accessory.async_stop()
+    await hass.async_block_till_done()
+    assert _units("unavailable") == "0"
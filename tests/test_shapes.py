@@ -0,0 +1,109 @@
+"""Tests for accessory shapes and shape-preserving reloads."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.homekit_heatercooler.const import CONF_FAN_LANE, FAN_LANE_AUTO
+from custom_components.homekit_heatercooler.shapes import ShapeTracker
+from custom_components.homekit_heatercooler.type_heatercooler import HeaterCooler
+from homeassistant.components.climate import ATTR_HVAC_MODES, ATTR_MAX_TEMP, HVACMode
+from homeassistant.core import Event, HomeAssistant
+from tests.common import ENTITY_ID, set_climate
+
+HVAC_MODES = [HVACMode.COOL, HVACMode.HEAT, HVACMode.OFF]
+
+
+def _set(hass: HomeAssistant, **attributes: object) -> None:
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: HVAC_MODES, **attributes})
+
+
+def _bridge(driver: object) -> str:
+    return str(getattr(driver, "entry_id", None))
+
+
+def _changed(hass: HomeAssistant, **attributes: object) -> Event:
+    """Change the climate and return the state event HomeKit would deliver."""
+    old_state = hass.states.get(ENTITY_ID)
+    _set(hass, **attributes)
+    return Event(
+        "state_changed",
+        {
+            "entity_id": ENTITY_ID,
+            "old_state": old_state,
+            "new_state": hass.states.get(ENTITY_ID),
+        },
+    )
+
+
+async def test_reload_is_skipped_when_the_shape_holds(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Reload attributes that do not change the accessory leave it in place."""
+    _set(hass)
+    tracker = ShapeTracker(hass)
+    accessory = HeaterCooler(
+        hass, hk_driver, "Test", ENTITY_ID, 2, {CONF_FAN_LANE: FAN_LANE_AUTO}
+    )
+    tracker.async_record(accessory)
+
+    with patch.object(accessory, "async_reload") as reload:
+        accessory.async_update_event_state_callback(
+            _changed(hass, **{ATTR_HVAC_MODES: list(reversed(HVAC_MODES))})
+        )
+        reload.assert_not_called()
+        accessory.async_update_event_state_callback(
+            _changed(hass, **{ATTR_MAX_TEMP: 40})
+        )
+        reload.assert_called_once()
+
+    record = tracker.as_dict()[_bridge(hk_driver)][ENTITY_ID]
+    assert record["reloads_skipped"] == 1
+    assert record["last_skipped"] == [ATTR_HVAC_MODES]
+
+
+async def test_shape_change_records_its_causes(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A rebuilt accessory with another shape reports what changed."""
+    _set(hass)
+    tracker = ShapeTracker(hass)
+    tracker.async_record(HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {}))
+    bridge = _bridge(hk_driver)
+    digest = tracker.as_dict()[bridge][ENTITY_ID]["hash"]
+
+    tracker.async_record(HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {}))
+    assert tracker.as_dict()[bridge][ENTITY_ID]["changes"] == 0
+
+    _set(hass, **{ATTR_MAX_TEMP: 40})
+    tracker.async_record(HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {}))
+    record = tracker.as_dict()[bridge][ENTITY_ID]
+    assert record["changes"] == 1
+    assert record["last_change"]["from"] == digest
+    assert (
+        "HeaterCooler.CoolingThresholdTemperature properties"
+        in record["last_change"]["causes"]
+    )
+
+
+async def test_shapes_are_kept_per_bridge_and_pruned(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Each bridge keeps its own record, dropped once it stops routing the climate."""
+    _set(hass)
+    tracker = ShapeTracker(hass)
+    bridge = _bridge(hk_driver)
+    tracker.async_record(HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {}))
+    with patch.object(hk_driver, "entry_id", "other", create=True):
+        tracker.async_record(
+            HeaterCooler(
+                hass, hk_driver, "Test", ENTITY_ID, 2, {CONF_FAN_LANE: FAN_LANE_AUTO}
+            )
+        )
+    assert set(tracker.as_dict()) == {bridge, "other"}
+
+    tracker.async_prune({"other": {ENTITY_ID}})
+
+    assert set(tracker.as_dict()) == {"other"}
+    tracker.async_prune({"other": set()})
+    assert tracker.as_dict() == {}
@@ -0,0 +1,70 @@
+"""Tests for HeaterCoolers of one entity on several bridges."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.homekit_heatercooler.type_heatercooler import (
+    CHAR_COOLING_THRESHOLD_TEMPERATURE,
+    HeaterCooler,
+)
+from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_HVAC_MODES,
+    ATTR_TEMPERATURE,
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_TEMPERATURE,
+    HVACMode,
+)
+from homeassistant.core import HomeAssistant
+from tests.common import ENTITY_ID, set_climate
+
+ATTRIBUTES = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]}
+
+
+async def test_bridges_share_derivations_and_writes(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A scene sent to both bridges calls the service once."""
+    set_climate(hass, HVACMode.COOL, **ATTRIBUTES)
+    main = HeaterCooler(hass, hk_driver, "Main", ENTITY_ID, 2, {})
+    room = HeaterCooler(hass, hk_driver, "Room", ENTITY_ID, 3, {})
+    assert main.shared is room.shared
+    calls = async_mock_service(hass, CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE)
+
+    set_climate(hass, HVACMode.COOL, **ATTRIBUTES, **{ATTR_CURRENT_TEMPERATURE: 25})
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    derivations = main.shared.derivations
+    main.async_update_state(state)
+    room.async_update_state(state)
+    assert main.shared.derivations == derivations + 2
+    assert main.char_current_state.value == room.char_current_state.value
+
+    main._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 20})
+    room._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 20})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data[ATTR_TEMPERATURE] == 20
+    assert main.shared.as_dict()["calls_shared"] == 1
+    assert room.char_cool.value == 20
+
+
+async def test_write_is_repeated_after_the_state_moves_on(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A sibling's call no longer counts once the entity reports a newer state."""
+    set_climate(hass, HVACMode.COOL, **ATTRIBUTES)
+    main = HeaterCooler(hass, hk_driver, "Main", ENTITY_ID, 2, {})
+    room = HeaterCooler(hass, hk_driver, "Room", ENTITY_ID, 3, {})
+    calls = async_mock_service(hass, CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE)
+
+    main._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 20})
+    await hass.async_block_till_done()
+    set_climate(hass, HVACMode.COOL, **ATTRIBUTES, **{ATTR_TEMPERATURE: 26})
+    room._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 20})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert main.shared.as_dict()["calls_shared"] == 0
@@ -0,0 +1,130 @@
+"""Tests for persisted accessory snapshots."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.homekit_heatercooler.snapshots import (
+    AccessorySnapshot,
+    SnapshotStore,
+)
+from custom_components.homekit_heatercooler.type_heatercooler import HeaterCooler
+from homeassistant.components.climate import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_HVAC_MODES,
+    ATTR_SWING_MODES,
+    HVACMode,
+)
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from tests.common import ENTITY_ID, set_climate
+
+HVAC_MODES = [HVACMode.COOL, HVACMode.HEAT, HVACMode.OFF]
+
+
+def _placeholder(hass: HomeAssistant) -> None:
+    """Set the registry's restored placeholder for a climate not loaded yet."""
+    hass.states.async_set(
+        ENTITY_ID, STATE_UNAVAILABLE, {"restored": True, ATTR_SUPPORTED_FEATURES: 0}
+    )
+
+
+def _live(hass: HomeAssistant, mode: HVACMode, temperature: float) -> None:
+    set_climate(
+        hass,
+        mode,
+        **{ATTR_HVAC_MODES: HVAC_MODES, ATTR_CURRENT_TEMPERATURE: temperature},
+    )
+
+
+async def _stored_snapshot(hass: HomeAssistant, hk_driver: object) -> AccessorySnapshot:
+    """Track a live accessory and return the snapshot a save would persist."""
+    _live(hass, HVACMode.COOL, 25)
+    store = SnapshotStore(hass)
+    live = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    store.async_track(live, AccessorySnapshot.from_state(hass.states.get(ENTITY_ID)))
+    snapshot = AccessorySnapshot.from_dict(store._data_to_save()[ENTITY_ID])
+    assert snapshot is not None
+    return snapshot
+
+
+async def test_snapshot_builds_and_serves_values_before_the_climate_loads(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A placeholder state is served from the snapshot until live state arrives."""
+    snapshot = await _stored_snapshot(hass, hk_driver)
+    assert snapshot.values["HeaterCooler.CurrentTemperature"] == 25
+
+    _placeholder(hass)
+    accessory = HeaterCooler(
+        hass, hk_driver, "Test", ENTITY_ID, 2, {}, snapshot=snapshot
+    )
+    assert accessory.available
+    assert accessory.char_current_temp.value == 25
+    assert (
+        accessory.char_target_state.value
+        == snapshot.values["HeaterCooler.TargetHeaterCoolerState"]
+    )
+
+    _live(hass, HVACMode.COOL, 23)
+    accessory.async_update_state_callback(hass.states.get(ENTITY_ID))
+    assert accessory._snapshot is None
+    assert accessory.char_current_temp.value == 23
+
+
+async def test_snapshot_with_another_shape_reloads_on_live_state(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Live capabilities that differ from the snapshot rebuild the accessory."""
+    snapshot = await _stored_snapshot(hass, hk_driver)
+    _placeholder(hass)
+    accessory = HeaterCooler(
+        hass, hk_driver, "Test", ENTITY_ID, 2, {}, snapshot=snapshot
+    )
+
+    set_climate(
+        hass,
+        HVACMode.COOL,
+        **{ATTR_HVAC_MODES: HVAC_MODES, ATTR_SWING_MODES: ["off", "on"]},
+    )
+    with patch.object(accessory, "async_reload") as reload:
+        accessory.async_update_state_callback(hass.states.get(ENTITY_ID))
+    reload.assert_called_once()
+    assert accessory._snapshot is None
+
+
+async def test_snapshot_is_ignored_once_the_climate_is_live(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A live state always wins over a stored snapshot."""
+    snapshot = await _stored_snapshot(hass, hk_driver)
+    _live(hass, HVACMode.HEAT, 19)
+    accessory = HeaterCooler(
+        hass, hk_driver, "Test", ENTITY_ID, 2, {}, snapshot=snapshot
+    )
+    assert accessory._snapshot is None
+    assert accessory.char_current_temp.value == 19
+
+
+async def test_saving_leaves_a_deferred_accessory_deferred(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A save keeps the last values rather than applying a deferred state."""
+    _live(hass, HVACMode.COOL, 25)
+    store = SnapshotStore(hass)
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    store.async_track(
+        accessory, AccessorySnapshot.from_state(hass.states.get(ENTITY_ID))
+    )
+    accessory.run()
+    await hass.async_block_till_done()
+    store._data_to_save()
+
+    _live(hass, HVACMode.COOL, 27)
+    await hass.async_block_till_done()
+    assert accessory.has_deferred_state
+
+    saved = store._data_to_save()[ENTITY_ID]
+    assert saved["values"]["HeaterCooler.CurrentTemperature"] == 25
+    assert accessory.has_deferred_state
+    assert accessory.char_current_temp.value == 25
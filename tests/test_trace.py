@@ -0,0 +1,77 @@
+"""Tests for the bounded write trace."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.homekit_heatercooler.trace import (
+    RESULT_FAILED,
+    RESULT_OK,
+    WriteTrace,
+)
+from custom_components.homekit_heatercooler.type_heatercooler import (
+    CHAR_ACTIVE,
+    CHAR_COOLING_THRESHOLD_TEMPERATURE,
+    HeaterCooler,
+)
+from homeassistant.components.climate import (
+    ATTR_HVAC_MODES,
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_HVAC_MODE,
+    HVACMode,
+)
+from homeassistant.core import HomeAssistant
+from tests.common import ENTITY_ID, set_climate
+
+
+def test_write_trace_drops_the_oldest_record() -> None:
+    """The trace keeps only its latest records."""
+    trace = WriteTrace(size=2)
+    for value in (1, 2, 3):
+        trace.start({"value": value}, 0.0)
+
+    assert [record["batch"] for record in trace.as_list()] == [
+        {"value": 2},
+        {"value": 3},
+    ]
+
+
+async def test_write_trace_follows_a_mode_write(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A write records its batch, calls, results and the mode it settled on."""
+    attributes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]}
+    set_climate(hass, HVACMode.COOL, **attributes)
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+    async_mock_service(hass, CLIMATE_DOMAIN, SERVICE_SET_HVAC_MODE)
+
+    accessory._set_chars({CHAR_ACTIVE: 0})
+    await hass.async_block_till_done()
+    set_climate(hass, HVACMode.OFF, **attributes)
+    state = hass.states.get(ENTITY_ID)
+    assert state is not None
+    accessory.async_update_state(state)
+
+    (record,) = accessory.write_trace.as_list()
+    assert record["batch"] == {CHAR_ACTIVE: 0}
+    (call,) = record["calls"]
+    assert call["service"] == SERVICE_SET_HVAC_MODE
+    assert call["result"] == RESULT_OK
+    assert ("last_reported_mode", HVACMode.OFF) in [
+        (transition["field"], transition["value"])
+        for transition in record["transitions"]
+    ]
+
+
+async def test_write_trace_records_a_failed_call(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A call the entity rejects is recorded as failed."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+
+    accessory._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 20})
+    await hass.async_block_till_done()
+
+    (record,) = accessory.write_trace.as_list()
+    assert [call["result"] for call in record["calls"]] == [RESULT_FAILED]
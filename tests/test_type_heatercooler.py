@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import timedelta
 
 import pytest
-from pytest_homeassistant_custom_component.common import async_mock_service
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+)
 
+from custom_components.homekit_heatercooler.climate_base import (
+    PENDING_VALUE_TIMEOUT,
+    async_hook_subscriptions,
+)
 from custom_components.homekit_heatercooler.const import (
+    CONF_ACTION_DWELL,
     CONF_FAN_LANE,
     FAN_LANE_AUTO,
     FAN_LANE_MANUAL,
@@ -15,6 +24,7 @@ from custom_components.homekit_heatercooler.const import (
     SERV_HUMIDITY_SENSOR,
 )
 from custom_components.homekit_heatercooler.type_heatercooler import (
+    ACTION_HYSTERESIS,
     CHAR_ACTIVE,
     CHAR_COOLING_THRESHOLD_TEMPERATURE,
     CHAR_HEATING_THRESHOLD_TEMPERATURE,
@@ -57,6 +67,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, ServiceCall, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 from tests.common import ENTITY_ID, set_climate
 
@@ -473,6 +484,68 @@ async def test_pending_mode_bridges_stale_entity_updates(
     assert accessory._pending_mode is None
 
 
+async def test_pending_values_bridge_stale_entity_updates(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Written thresholds and fan speeds hold until the entity reports a change."""
+    attributes = {
+        ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF],
+        ATTR_TEMPERATURE: 20,
+        ATTR_FAN_MODE: "Low",
+    }
+    set_climate(hass, HVACMode.COOL, **attributes)
+    accessory = _accessory(hass, hk_driver, {CONF_FAN_LANE: FAN_LANE_MANUAL})
+    async_mock_service(hass, CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE)
+    async_mock_service(hass, CLIMATE_DOMAIN, SERVICE_SET_FAN_MODE)
+    assert accessory.char_speed is not None
+    low_speed = accessory.char_speed.value
+
+    accessory.char_speed.value = 100
+    accessory._set_chars(
+        {CHAR_COOLING_THRESHOLD_TEMPERATURE: 24, CHAR_ROTATION_SPEED: 100}
+    )
+    await hass.async_block_till_done()
+
+    accessory.async_update_state(State(ENTITY_ID, HVACMode.COOL, attributes))
+    assert accessory.char_cool.value == 24
+    assert accessory.char_speed.value == 100
+
+    confirmed = {**attributes, ATTR_TEMPERATURE: 24, ATTR_FAN_MODE: "High"}
+    accessory.async_update_state(State(ENTITY_ID, HVACMode.COOL, confirmed))
+    assert not accessory._pending_values
+    assert accessory.echoes_suppressed == 2
+    assert accessory.diagnostics()["echoes_suppressed"] == 2
+
+    accessory.async_update_state(State(ENTITY_ID, HVACMode.COOL, attributes))
+    assert accessory.char_cool.value == 20
+    assert accessory.char_speed.value == low_speed
+
+
+async def test_pending_values_expire_on_a_quiet_entity(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A write the entity never reports is dropped and the reported value shown."""
+    attributes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF], ATTR_TEMPERATURE: 20}
+    set_climate(hass, HVACMode.COOL, **attributes)
+    accessory = _accessory(hass, hk_driver)
+    async_mock_service(hass, CLIMATE_DOMAIN, SERVICE_SET_TEMPERATURE)
+    accessory.async_update_state(State(ENTITY_ID, HVACMode.COOL, attributes))
+    reported = accessory.char_cool.value
+
+    accessory._set_chars({CHAR_COOLING_THRESHOLD_TEMPERATURE: 24})
+    await hass.async_block_till_done()
+    assert accessory._write_active()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=PENDING_VALUE_TIMEOUT + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert not accessory._write_active()
+    assert accessory.char_cool.value == reported
+    assert accessory.write_latency.unconfirmed == 1
+
+
 async def test_failed_mode_write_aborts_temperature_and_fan_writes(
     hass: HomeAssistant, hk_driver: object
 ) -> None:
@@ -678,3 +751,129 @@ async def test_absent_swing_mode_keeps_the_last_reported_value(
     set_climate(hass, HVACMode.COOL, **swing, **{ATTR_SWING_MODE: "off"})
     accessory.async_update_state(hass.states.get(ENTITY_ID))
     assert accessory.char_swing.value == 0
+
+
+async def test_state_changes_wait_for_a_reader_without_subscribers(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """An unattended bridge defers updates until a controller reads or subscribes."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_CURRENT_TEMPERATURE: 22})
+    accessory = _accessory(hass, hk_driver)
+    accessory.run()
+    await hass.async_block_till_done()
+
+    set_climate(hass, HVACMode.COOL, **{ATTR_CURRENT_TEMPERATURE: 25})
+    await hass.async_block_till_done()
+    assert accessory.char_current_temp.value == 22
+    assert accessory.char_current_temp.get_value() == 25
+    assert accessory.char_current_temp.getter_callback is None
+
+    topic = (
+        f"{accessory.aid}.{accessory.iid_manager.get_iid(accessory.char_current_temp)}"
+    )
+    hk_driver.async_subscribe_client_topic(("127.0.0.1", 51826), topic, True)
+    set_climate(hass, HVACMode.COOL, **{ATTR_CURRENT_TEMPERATURE: 23})
+    await hass.async_block_till_done()
+    assert accessory.char_current_temp.value == 23
+
+
+async def test_subscribing_applies_a_deferred_state_at_once(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """A controller subscribing sees the newest state without another update."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_CURRENT_TEMPERATURE: 22})
+    accessory = _accessory(hass, hk_driver)
+    hk_driver.accessory = accessory
+    async_hook_subscriptions(hk_driver)
+    async_hook_subscriptions(hk_driver)
+    accessory.run()
+    await hass.async_block_till_done()
+
+    set_climate(hass, HVACMode.COOL, **{ATTR_CURRENT_TEMPERATURE: 25})
+    await hass.async_block_till_done()
+    assert accessory.has_deferred_state
+
+    topic = (
+        f"{accessory.aid}.{accessory.iid_manager.get_iid(accessory.char_current_temp)}"
+    )
+    hk_driver.async_subscribe_client_topic(("127.0.0.1", 51826), topic, True)
+    assert not accessory.has_deferred_state
+    assert accessory.char_current_temp.value == 25
+
+
+async def test_action_flips_inside_the_dwell_time_are_held(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Only the latest action is shown once the current one has dwelt."""
+    cool = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]}
+    set_climate(hass, HVACMode.COOL, **cool, **{ATTR_HVAC_ACTION: HVACAction.IDLE})
+    accessory = _accessory(hass, hk_driver, {CONF_ACTION_DWELL: 60})
+    assert accessory.char_current_state.value == HC_IDLE
+
+    for action in (HVACAction.COOLING, HVACAction.IDLE, HVACAction.COOLING):
+        accessory.async_update_state(
+            State(ENTITY_ID, HVACMode.COOL, {**cool, ATTR_HVAC_ACTION: action})
+        )
+        assert accessory.char_current_state.value == HC_IDLE
+    assert accessory.actions_damped == 2
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    assert accessory.char_current_state.value == HC_COOLING
+
+    accessory.async_update_state(State(ENTITY_ID, HVACMode.OFF, cool))
+    assert accessory.char_current_state.value == HC_INACTIVE
+
+
+async def test_derived_action_keeps_the_fixed_band_by_default(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """Without a dwell time, derived cooling follows a fixed band either way."""
+    attributes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF], ATTR_TEMPERATURE: 20}
+    set_climate(hass, HVACMode.COOL, **attributes, **{ATTR_CURRENT_TEMPERATURE: 20})
+    accessory = _accessory(hass, hk_driver)
+
+    for current, expected in (
+        (20.2, HC_IDLE),
+        (20.3, HC_COOLING),
+        (20.1, HC_IDLE),
+        (21.5, HC_COOLING),
+        (20.2, HC_IDLE),
+    ):
+        accessory.async_update_state(
+            State(
+                ENTITY_ID,
+                HVACMode.COOL,
+                {**attributes, ATTR_CURRENT_TEMPERATURE: current},
+            )
+        )
+        assert accessory.char_current_state.value == expected
+    assert accessory.action_hysteresis == ACTION_HYSTERESIS
+
+
+async def test_derived_action_runs_back_to_the_setpoint_with_a_dwell_time(
+    hass: HomeAssistant, hk_driver: object
+) -> None:
+    """With a dwell time, derived cooling continues until the setpoint."""
+    attributes = {ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF], ATTR_TEMPERATURE: 20}
+    set_climate(hass, HVACMode.COOL, **attributes, **{ATTR_CURRENT_TEMPERATURE: 20})
+    accessory = _accessory(hass, hk_driver, {CONF_ACTION_DWELL: 60})
+
+    for current, expected in (
+        (20.2, HC_IDLE),
+        (20.3, HC_COOLING),
+        (20.1, HC_COOLING),
+        (19.9, HC_IDLE),
+    ):
+        accessory.async_update_state(
+            State(
+                ENTITY_ID,
+                HVACMode.COOL,
+                {**attributes, ATTR_CURRENT_TEMPERATURE: current},
+            )
+        )
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+        await hass.async_block_till_done()
+        assert accessory.char_current_state.value == expected
+    # Readings this steady leave the band at its fixed width.
+    assert accessory.action_hysteresis == ACTION_HYSTERESIS
@@ -0,0 +1,33 @@
+"""Tests for the opt-in callback watchdog."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from custom_components.homekit_heatercooler.const import DATA_WATCHDOG, DOMAIN
+from custom_components.homekit_heatercooler.type_heatercooler import HeaterCooler
+from custom_components.homekit_heatercooler.watchdog import Watchdog
+from homeassistant.components.climate import ATTR_HVAC_MODES, HVACMode
+from homeassistant.core import HomeAssistant
+from tests.common import ENTITY_ID, set_climate
+
+
+async def test_slow_calls_are_logged_once_per_entity(
+    hass: HomeAssistant, hk_driver: object, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Every call over the threshold is counted, but only the first is logged."""
+    set_climate(hass, HVACMode.COOL, **{ATTR_HVAC_MODES: [HVACMode.COOL, HVACMode.OFF]})
+    watchdog = hass.data.setdefault(DOMAIN, {})[DATA_WATCHDOG] = Watchdog(hass, 0.0)
+
+    with caplog.at_level(logging.WARNING):
+        accessory = HeaterCooler(hass, hk_driver, "Test", ENTITY_ID, 2, {})
+        state = hass.states.get(ENTITY_ID)
+        assert state is not None
+        accessory.async_update_state(state)
+
+    slow = watchdog.slow_calls["async_update_state", ENTITY_ID]
+    assert slow.count == 2
+    assert caplog.text.count("async_update_state took") == 1
+    assert watchdog.as_dict()["slow_calls"][0]["entity_id"] == ENTITY_ID